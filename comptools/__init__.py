@@ -8,4 +8,34 @@ from .parsemaker import *
 from .parsepy import *
 from .similarity import *
 from .twelve_tone import *
-from .abjadtools import *
\ No newline at end of file
+from .abjadtools import *
+from .row_arrays import *
+from .row_classes import *
+from .combinatoriality import *
+from .perm_group import *
+from .boulez import *
+from .row_charts import *
+from .row_search import *
+from .row_distances import *
+from .hindemith_analysis import *
+from .score_cache import *
+from .event_arrays import *
+from .corpus_analysis import *
+from .corpus_store import *
+from .partition_lattice import *
+from .partition_graph import *
+from .transitions import *
+
+
+from . import master_perms as _master_perms
+
+
+def __getattr__(name):
+    """Keeps the old up_to_six, six_to_nine and ten_to_twelve names of master_perms
+    importable from the package, generating them only when they are accessed."""
+    if name in _master_perms._LEGACY_RANGES:
+        return getattr(_master_perms, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [name for name in globals() if not name.startswith("_")] + list(_master_perms._LEGACY_RANGES)
@@ -0,0 +1,126 @@
+"""
+Module with the bitmask implementation of Pierre Boulez's multiplication.
+A pitch class set is a 12-bit mask, and the complex multiplication of two sets
+is the OR of the multiplicand mask rotated by each note of the multiplier
+(minus the multiplication factor). See:
+Heinemann - Pitch Class Set Multiplication in Theory and Practice.
+"""
+
+
+from .basic_tools import all_rotations
+from .row_arrays import FORM_LABELS, row_forms, pc_masks, rotate_masks, normal_form_table
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, List, Sequence
+import numpy as np
+
+
+@lru_cache(maxsize=None)
+def mask_multiplication(
+    multiplicand: int,
+    multiplier: int,
+    factor: int,
+) -> int:
+
+    """Returns the mask of the complex multiplication of two pitch class set masks.
+    The result is the same as complex_multiplication, which depends only on
+    the contents of the sets and on the factor.
+    """
+
+    result = 0
+    for pc in range(12):
+        if multiplier >> pc & 1:
+            n = (pc - factor) % 12
+            result |= ((multiplicand << n) | (multiplicand >> (12 - n))) & 0xFFF
+
+    return result
+
+
+def mask_complex_multiplication(
+    multiplicand: Sequence,
+    multiplier: Sequence,
+    multiplication_factor: int,
+) -> List:
+
+    """Drop-in replacement for complex_multiplication that uses the cached
+    bitmask multiplication. Returns the normal form of the result.
+    """
+
+    mask = mask_multiplication(
+        int(pc_masks(multiplicand)), int(pc_masks(multiplier)), multiplication_factor % 12,
+    )
+
+    return list(normal_form_table()[mask])
+
+
+def multiplication_factor(
+    first_segment: Sequence,
+) -> int:
+
+    """Returns the multiplication factor used by boulez_matrix_multiplication:
+    the last note of the first segment, or its third note if it is longer.
+    """
+
+    if len(first_segment) <= 3:
+        return first_segment[-1]
+    return first_segment[2]
+
+
+def boulez_palette_masks(
+    rows: Sequence,
+    part: Sequence,
+) -> np.ndarray:
+
+    """Applies Boulez's multiplication to all the rotations of a partition of 12,
+    over all 48 forms of many rows, in one vectorized pass.
+    Returns an array of masks with shape (N, 48, len(part), len(part), len(part)):
+    entry [n, f, r, a, b] is the multiplication of segment a by segment b of form f
+    of row n, partitioned by rotation r of part (see all_rotations).
+    The forms follow FORM_LABELS. Use normal_form_table to read the masks.
+    """
+
+    forms = row_forms(rows).astype(np.int64)
+    pcs = np.arange(12)
+    result = []
+    for rotation in all_rotations(list(part)):
+        bounds = [0] + list(accumulate(rotation))
+        segments = np.stack(
+            [pc_masks(forms[:, :, bounds[i]:bounds[i + 1]]) for i in range(len(rotation))], axis=-1,
+        )
+        factor = forms[:, :, min(rotation[0], 3) - 1]
+        shifts = (pcs - factor[:, :, np.newaxis]) % 12
+        rotated = rotate_masks(segments[:, :, :, np.newaxis], shifts[:, :, np.newaxis, :])
+        present = (segments[:, :, :, np.newaxis] >> pcs.astype(np.uint16)) & 1
+        products = np.where(
+            present[:, :, np.newaxis, :, :].astype(bool), rotated[:, :, :, np.newaxis, :], 0,
+        )
+        result.append(np.bitwise_or.reduce(products, axis=-1).astype(np.uint16))
+
+    return np.stack(result, axis=2)
+
+
+def boulez_palette(
+    row: Sequence,
+    part: Sequence,
+) -> Dict:
+
+    """Applies Boulez's multiplication to all rotations of a partition of 12,
+    over all the 48 forms of a row. Returns a dictionary keyed by form label
+    and rotation, whose values are dictionaries like the ones returned by
+    boulez_matrix_multiplication.
+    """
+
+    masks = boulez_palette_masks([row], part)[0]
+    forms = row_forms([row])[0].tolist()
+    table = normal_form_table()
+    result = dict()
+    for f, label in enumerate(FORM_LABELS):
+        for r, rotation in enumerate(all_rotations(list(part))):
+            bounds = [0] + list(accumulate(rotation))
+            segments = [tuple(forms[f][bounds[i]:bounds[i + 1]]) for i in range(len(rotation))]
+            result[(label, tuple(rotation))] = {
+                (m, i): list(table[masks[f, r, a, b]])
+                for a, m in enumerate(segments) for b, i in enumerate(segments)
+            }
+
+    return result
@@ -0,0 +1,126 @@
+"""
+Module with the batch combinatoriality tools of the Comp_Tools library.
+Forms are combinatorial at a segment size when their corresponding segments
+(hexachords, tetrachords or trichords) add up to aggregates.
+The segments are compared as 12-bit masks over the batched forms of many rows.
+"""
+
+
+from .row_arrays import FORM_LABELS, as_rows, row_forms, pc_masks
+from typing import Dict, List, Sequence
+import numpy as np
+
+
+SEGMENT_SIZES = (6, 4, 3)
+
+
+def segment_masks(
+    forms: Sequence,
+    size: int,
+) -> np.ndarray:
+
+    """Returns the masks of the discrete segments of the given size of rows
+    or forms stored along the last axis of an array.
+    """
+
+    forms = np.asarray(forms)
+    if forms.shape[-1] % size != 0:
+        raise ValueError("invalid segment size: " + str(size))
+    segments = forms.reshape(forms.shape[:-1] + (forms.shape[-1] // size, size))
+
+    return pc_masks(segments)
+
+
+def complementary_forms(
+    rows: Sequence,
+    size: int = 6,
+    chunk_size: int = 1024,
+) -> np.ndarray:
+
+    """Returns a boolean array with shape (N, 48, 48): entry [n, a, b] is True
+    if the forms a and b of row n (in the order of FORM_LABELS) have disjoint
+    corresponding segments of the given size, at every segment position.
+    """
+
+    rows = as_rows(rows)
+    result = np.zeros((len(rows), 48, 48), dtype=bool)
+    for start in range(0, len(rows), chunk_size):
+        masks = segment_masks(row_forms(rows[start:start + chunk_size]), size)
+        overlaps = masks[:, :, np.newaxis, :] & masks[:, np.newaxis, :, :]
+        result[start:start + chunk_size] = (overlaps == 0).all(axis=-1)
+
+    return result
+
+
+def _groups_from_pairs(
+    pairs: np.ndarray,
+    group_size: int,
+) -> List:
+
+    """Returns, for each row, the groups of forms that include T0 and are
+    pairwise complementary, as tuples of indices into FORM_LABELS.
+    """
+
+    result = []
+    for row_pairs in pairs:
+        candidates = np.flatnonzero(row_pairs[0])
+        groups = [(0,)]
+        for _ in range(group_size - 1):
+            groups = [
+                group + (c,) for group in groups for c in candidates
+                if c > group[-1] and row_pairs[list(group[1:]), c].all()
+            ]
+        result.append(groups)
+    return result
+
+
+def all_combinatorial_mask(
+    hexachord_pairs: np.ndarray,
+) -> np.ndarray:
+
+    """Given the complementary forms for hexachords, returns a boolean array
+    telling which rows are all-combinatorial: combinatorial with a T form other
+    than T0, with an I form and with an RI form (R0 is always combinatorial).
+    """
+
+    with_prime = hexachord_pairs[:, 0, :]
+
+    return (with_prime[:, 1:12].any(axis=1)
+            & with_prime[:, 12:24].any(axis=1)
+            & with_prime[:, 36:48].any(axis=1))
+
+
+def combinatoriality(
+    rows: Sequence,
+    sizes: Sequence = SEGMENT_SIZES,
+    chunk_size: int = 1024,
+) -> Dict:
+
+    """Detects the combinatoriality of many rows at once.
+    Returns a dictionary with:
+    'pairs': for each segment size, the array from complementary_forms;
+    'groups': for each segment size, a list with, for each row, the groups of forms
+    (as tuples of labels, starting with T0) whose corresponding segments produce
+    aggregates: pairs for hexachords, triples for tetrachords and so on;
+    'all_combinatorial': a boolean array flagging the all-combinatorial rows.
+    """
+
+    rows = as_rows(rows)
+    pairs = dict()
+    groups = dict()
+    for size in sizes:
+        pairs[size] = complementary_forms(rows, size, chunk_size)
+        groups[size] = [
+            [tuple(FORM_LABELS[i] for i in group) for group in row_groups]
+            for row_groups in _groups_from_pairs(pairs[size], 12 // size)
+        ]
+    if 6 in pairs:
+        hexachord_pairs = pairs[6]
+    else:
+        hexachord_pairs = complementary_forms(rows, 6, chunk_size)
+
+    return {
+        "pairs": pairs,
+        "groups": groups,
+        "all_combinatorial": all_combinatorial_mask(hexachord_pairs),
+    }
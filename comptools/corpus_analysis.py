@@ -0,0 +1,282 @@
+"""
+Module with the corpus-scale Partitional Analysis tools of the Comp_Tools library.
+The files of a corpus are analysed over a process pool and the results are written
+incrementally to a columnar file (Parquet or Arrow IPC), with one line per offset
+of each piece, and a second file with the time and the error, if any, of each piece.
+The columnar files need pyarrow (pip install comptools[arrow]).
+The workers run in a process pool that survives the crash of a worker
+(see resilient_map), with an optional cap on the memory of each worker.
+"""
+
+
+from .event_arrays import load_events
+from .parsepy import iter_event_partitions, agglomeration_index, dispersion_index
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, Generator, List, Sequence, Union
+import glob
+import sys
+import time
+
+
+SCORE_EXTENSIONS = (".mid", ".midi", ".xml", ".mxl", ".musicxml", ".krn", ".abc")
+
+
+def corpus_files(
+    source: Union[str, Path],
+    extensions: Sequence = SCORE_EXTENSIONS,
+) -> List:
+
+    """Returns the sorted list of the score files of a corpus, given as a directory
+    (searched recursively for files with the given extensions) or as a glob pattern.
+    """
+
+    if Path(source).is_dir():
+        files = [x for x in Path(source).rglob("*") if x.suffix.lower() in extensions]
+    else:
+        files = [Path(x) for x in glob.glob(str(source), recursive=True)]
+
+    return sorted(str(x) for x in files if x.is_file())
+
+
+def analyze_file(
+    filename: str,
+    no_reps: bool = False,
+    cache_dir: Union[str, Path] = None,
+) -> Dict:
+
+    """Runs the rhythmic partitional analysis of a file and returns a dictionary with
+    the 'file', the lists of 'offsets', 'partitions', 'agglomeration' and 'dispersion'
+    indices, the 'seconds' it took and the 'error' raised, if any (None otherwise).
+    """
+
+    start = time.perf_counter()
+    result = {"file": filename, "offsets": [], "partitions": [], "agglomeration": [], "dispersion": []}
+    try:
+        for offset, part in iter_event_partitions(load_events(filename, cache_dir), no_reps):
+            result["offsets"].append(float(offset))
+            result["partitions"].append(list(part))
+            result["agglomeration"].append(int(agglomeration_index(part)))
+            result["dispersion"].append(int(dispersion_index(part)))
+        result["error"] = None
+    except Exception as error:
+        for key in ["offsets", "partitions", "agglomeration", "dispersion"]:
+            result[key] = []
+        result["error"] = type(error).__name__ + ": " + str(error)
+    result["seconds"] = time.perf_counter() - start
+
+    return result
+
+
+def _crashed_file(
+    filename: str,
+    message: str,
+) -> Dict:
+
+    """Returns the result of analyze_file for a file whose worker died."""
+
+    return {
+        "file": filename, "offsets": [], "partitions": [], "agglomeration": [],
+        "dispersion": [], "error": message, "seconds": None,
+    }
+
+
+def _limit_memory(
+    memory_limit: int,
+) -> None:
+
+    """Initializer of the workers: caps the address space of the process at memory_limit
+    bytes, so a piece that needs more raises MemoryError instead of exhausting the machine.
+    Needs the resource module (Unix only)."""
+
+    import resource
+
+    resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+
+def _executor(
+    processes: int = None,
+    maxtasksperchild: int = None,
+    memory_limit: int = None,
+) -> ProcessPoolExecutor:
+
+    """Returns a process pool executor with the given number of workers, each one replaced
+    after maxtasksperchild tasks (Python 3.11 and later) and capped at memory_limit bytes."""
+
+    options = dict()
+    if maxtasksperchild is not None and sys.version_info >= (3, 11):
+        options["max_tasks_per_child"] = maxtasksperchild
+    if memory_limit is not None:
+        options["initializer"] = _limit_memory
+        options["initargs"] = (memory_limit,)
+
+    return ProcessPoolExecutor(processes, **options)
+
+
+def _terminate(
+    executor: ProcessPoolExecutor,
+) -> None:
+
+    """Cancels the pending tasks of an executor and kills its workers, without waiting
+    for the running tasks."""
+
+    processes = list((executor._processes or dict()).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+
+
+def resilient_map(
+    function: Callable,
+    items: Sequence,
+    on_crash: Callable,
+    processes: int = None,
+    maxtasksperchild: int = None,
+    memory_limit: int = None,
+) -> Generator:
+
+    """Generator for function(item) over the items, computed over a process pool
+    and yielded in the order of the items. If a worker dies (a segmentation fault in
+    the parser or the OOM killer), the item that was waited for is run again alone
+    in a new pool: if it kills that one as well, on_crash(item, message) is yielded
+    in its place. The remaining items go to a new pool, keeping the results that
+    were already done. The workers are replaced after maxtasksperchild items and
+    their memory is capped at memory_limit bytes (see _limit_memory). If the consumer
+    stops early or raises, the pending items are cancelled and the workers are killed.
+    With processes = 1, the items are computed in this process, without those guards.
+    """
+
+    items = list(items)
+    if processes == 1:
+        yield from map(function, items)
+        return
+    futures = dict()
+    executor = None
+    try:
+        for i, item in enumerate(items):
+            if executor is None:
+                executor = _executor(processes, maxtasksperchild, memory_limit)
+                for j in range(i, len(items)):
+                    if j not in futures or isinstance(futures[j].exception(), BrokenProcessPool):
+                        futures[j] = executor.submit(function, items[j])
+            try:
+                result = futures.pop(i).result()
+            except BrokenProcessPool:
+                executor.shutdown(wait=True)
+                executor = None
+                single = _executor(1, None, memory_limit)
+                try:
+                    result = single.submit(function, item).result()
+                except BrokenProcessPool:
+                    result = on_crash(item, "BrokenProcessPool: the worker process died")
+                finally:
+                    single.shutdown(wait=True)
+            yield result
+    except BaseException:
+        if executor is not None:
+            _terminate(executor)
+            executor = None
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+def _columnar_writer(
+    path: Union[str, Path],
+    schema,
+    file_format: str = None,
+):
+
+    """Opens a Parquet or Arrow IPC writer, chosen by file_format or by the
+    extension of the path ('.parquet' for Parquet, any other for Arrow IPC)."""
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if file_format is None:
+        file_format = "parquet" if Path(path).suffix.lower() == ".parquet" else "arrow"
+    if file_format == "parquet":
+        return pq.ParquetWriter(str(path), schema)
+    if file_format in ["arrow", "ipc", "feather"]:
+        return pa.ipc.new_file(str(path), schema)
+    raise ValueError("invalid file format: " + str(file_format))
+
+
+def batch_partitional_analysis(
+    source: Union[str, Path, List],
+    output: Union[str, Path],
+    log: Union[str, Path] = None,
+    processes: int = None,
+    maxtasksperchild: int = 25,
+    no_reps: bool = False,
+    cache_dir: Union[str, Path] = None,
+    file_format: str = None,
+    memory_limit: int = None,
+) -> Dict:
+
+    """Runs the rhythmic partitional analysis of all the files of a corpus
+    (a directory, a glob pattern or a list of files, see corpus_files) over a process pool
+    (see resilient_map). Each worker is replaced after maxtasksperchild files and,
+    if memory_limit is given, its memory is capped at that many bytes.
+    The results are written to the output file as each piece is done, one line per offset,
+    with the columns 'file', 'offset', 'partition', 'agglomeration' and 'dispersion'.
+    The log file (by default, the output name with '.files' before the extension) gets
+    one line per piece with the columns 'file', 'seconds', 'offsets' and 'error'.
+    A piece that fails, or whose worker dies, is recorded in the log and does not stop the batch.
+    Returns a dictionary with the number of 'files', 'failures' and 'offsets'.
+    """
+
+    import pyarrow as pa
+
+    files = corpus_files(source) if isinstance(source, (str, Path)) else [str(x) for x in source]
+    output = Path(output)
+    if log is None:
+        log = output.with_name(output.stem + ".files" + output.suffix)
+    schema = pa.schema([
+        ("file", pa.string()),
+        ("offset", pa.float64()),
+        ("partition", pa.list_(pa.int32())),
+        ("agglomeration", pa.int64()),
+        ("dispersion", pa.int64()),
+    ])
+    log_schema = pa.schema([
+        ("file", pa.string()),
+        ("seconds", pa.float64()),
+        ("offsets", pa.int64()),
+        ("error", pa.string()),
+    ])
+
+    worker = partial(analyze_file, no_reps=no_reps, cache_dir=cache_dir)
+    summary = {"files": 0, "failures": 0, "offsets": 0}
+    writer = _columnar_writer(output, schema, file_format)
+    log_writer = _columnar_writer(log, log_schema, file_format)
+    results = resilient_map(worker, files, _crashed_file, processes, maxtasksperchild, memory_limit)
+    try:
+        for result in results:
+            count = len(result["offsets"])
+            if count:
+                writer.write_table(pa.table({
+                    "file": [result["file"]] * count,
+                    "offset": result["offsets"],
+                    "partition": result["partitions"],
+                    "agglomeration": result["agglomeration"],
+                    "dispersion": result["dispersion"],
+                }, schema=schema))
+            log_writer.write_table(pa.table({
+                "file": [result["file"]],
+                "seconds": [result["seconds"]],
+                "offsets": [count],
+                "error": [result["error"]],
+            }, schema=log_schema))
+            summary["files"] += 1
+            summary["failures"] += result["error"] is not None
+            summary["offsets"] += count
+    finally:
+        results.close()
+        writer.close()
+        log_writer.close()
+
+    return summary
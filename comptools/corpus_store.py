@@ -0,0 +1,187 @@
+"""
+Module with the memory-mapped corpus event store of the Comp_Tools library.
+The event arrays (see event_arrays) of all the pieces of a corpus are written
+to a single file, with an index of the slice of each piece, so parallel analyses
+read the pieces from one shared, memory-mapped copy instead of parsing the files again.
+"""
+
+
+from .event_arrays import EVENT_DTYPE, load_events
+from .corpus_analysis import corpus_files, resilient_map
+from functools import partial
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Callable, List, Sequence, Tuple, Union
+import json
+import numpy as np
+
+
+STORE_VERSION = 2
+
+
+def _extract_events(
+    filename: str,
+    cache_dir: Union[str, Path] = None,
+) -> Tuple:
+
+    """Returns the filename, the event array of a file and the error raised, if any."""
+
+    try:
+        return filename, load_events(filename, cache_dir), None
+    except Exception as error:
+        return _failed_piece(filename, type(error).__name__ + ": " + str(error))
+
+
+def _failed_piece(
+    filename: str,
+    message: str,
+) -> Tuple:
+
+    """Returns the filename, an empty event array and the error of a file that failed."""
+
+    return filename, np.zeros(0, dtype=EVENT_DTYPE), message
+
+
+def build_corpus_store(
+    source: Union[str, Path, List],
+    path: Union[str, Path],
+    processes: int = None,
+    maxtasksperchild: int = 25,
+    cache_dir: Union[str, Path] = None,
+    memory_limit: int = None,
+) -> "CorpusStore":
+
+    """Extracts the event arrays of all the files of a corpus (a directory, a glob pattern
+    or a list of files, see corpus_files) over a process pool and writes them to a store
+    at the given directory: 'events.bin' with all the events, 'index.bin' with the first
+    and last event of each piece and 'meta.json' with the files and their errors.
+    The pieces are written in the order of the files, so the store is the same for any
+    number of processes. A file that fails, or whose worker dies, is stored as an empty piece.
+    The workers are replaced after maxtasksperchild files and their memory is capped
+    at memory_limit bytes, if given (see resilient_map).
+    """
+
+    files = corpus_files(source) if isinstance(source, (str, Path)) else [str(x) for x in source]
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    worker = partial(_extract_events, cache_dir=cache_dir)
+
+    index = []
+    errors = dict()
+    count = 0
+    with open(path / "events.bin", "wb") as events_file:
+        results = resilient_map(worker, files, _failed_piece, processes, maxtasksperchild, memory_limit)
+        try:
+            for filename, events, error in results:
+                events_file.write(events.astype(EVENT_DTYPE).tobytes())
+                index.append((count, count + len(events)))
+                count += len(events)
+                if error is not None:
+                    errors[filename] = error
+        finally:
+            results.close()
+    np.array(index, dtype="<i8").reshape(-1, 2).tofile(path / "index.bin")
+
+    meta = {
+        "version": STORE_VERSION,
+        "count": count,
+        "files": files,
+        "errors": errors,
+        "dtype": EVENT_DTYPE.descr,
+    }
+    (path / "meta.json").write_text(json.dumps(meta))
+
+    return CorpusStore(path)
+
+
+class CorpusStore:
+    """On-disk store of the event arrays of a corpus built by build_corpus_store.
+    The events are memory-mapped and each piece is a read-only view of them,
+    so the pieces are read without copies. A store sent to another process
+    is opened again there from its path.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        meta = json.loads((self.path / "meta.json").read_text())
+        if meta["version"] != STORE_VERSION:
+            raise ValueError("unsupported corpus store version: " + str(meta["version"]))
+        self.count = meta["count"]
+        self.files = meta["files"]
+        self.errors = meta["errors"]
+        self.index = np.fromfile(self.path / "index.bin", dtype="<i8").reshape(-1, 2)
+        if self.count:
+            self.events = np.memmap(self.path / "events.bin", dtype=EVENT_DTYPE, mode="r")
+        else:
+            self.events = np.zeros(0, dtype=EVENT_DTYPE)
+        self._positions = {name: i for i, name in enumerate(self.files)}
+
+    def __reduce__(self):
+        return (CorpusStore, (str(self.path),))
+
+    def __len__(self):
+        return len(self.files)
+
+    def __repr__(self) -> str:
+        return "CorpusStore(" + str(self.path) + ", " + str(len(self.files)) + " pieces, " + str(self.count) + " events)"
+
+    def __getitem__(self, i):
+        start, stop = self.index[i]
+        return self.events[start:stop]
+
+    def __iter__(self):
+        for i in range(len(self.files)):
+            yield self[i]
+
+    def piece(self, filename):
+        """Returns the events of a piece, given its filename."""
+        return self[self._positions[str(filename)]]
+
+    def sizes(self):
+        """Returns the number of events of each piece."""
+        return self.index[:, 1] - self.index[:, 0]
+
+
+_open_stores = dict()
+
+
+def _apply_to_piece(
+    item: Tuple,
+    function: Callable,
+):
+
+    """Applies a function to the events of one piece of a store, opening the store
+    once per process."""
+
+    path, i = item
+    if path not in _open_stores:
+        _open_stores[path] = CorpusStore(path)
+
+    return function(_open_stores[path][i])
+
+
+def map_pieces(
+    store: Union[CorpusStore, str, Path],
+    function: Callable,
+    pieces: Sequence = None,
+    processes: int = None,
+    chunksize: int = 1,
+) -> List:
+
+    """Applies a function to the event arrays of the pieces of a store (all of them
+    or the given indices) over a process pool and returns the results in order.
+    The workers only receive the path of the store and the index of each piece,
+    and read the events from the shared memory-mapped file. The function must be
+    defined at the top level of a module, so it can be sent to the workers.
+    """
+
+    if not isinstance(store, CorpusStore):
+        store = CorpusStore(store)
+    if pieces is None:
+        pieces = range(len(store))
+    if processes == 1:
+        return [function(store[i]) for i in pieces]
+    items = [(str(store.path), i) for i in pieces]
+    worker = partial(_apply_to_piece, function=function)
+    with Pool(processes) as pool:
+        return pool.map(worker, items, chunksize)
@@ -0,0 +1,290 @@
+"""
+Module with the event-array representation of scores of the Comp_Tools library.
+A score is extracted once into a NumPy structured array with one line per note
+(the notes of a chord on separate lines) or rest, which the analyses consume
+instead of music21 objects. See EVENT_DTYPE.
+The onsets and durations are stored exactly, as fractions, so the analyses
+of the event arrays give the same results as those of the music21 objects.
+"""
+
+
+from .row_arrays import prime_form_table
+from .score_cache import cached_arrays, fraction_arrays, from_fraction_arrays
+import music21 as m21
+from fractions import Fraction
+from pathlib import Path
+from typing import Dict, List, Sequence, Union
+import numpy as np
+
+
+# Fields of the event arrays: onset and duration in quarter notes, as numerators and
+# denominators (see fraction_arrays), indices of the part and of the voice in the part,
+# MIDI pitch (-1 for rests) and tie flags.
+EVENT_DTYPE = np.dtype([
+    ("onset_num", "<i8"),
+    ("onset_den", "<i8"),
+    ("duration_num", "<i8"),
+    ("duration_den", "<i8"),
+    ("part", "<i2"),
+    ("voice", "<i2"),
+    ("midi", "<i2"),
+    ("tie", "i1"),
+])
+
+# Tie flags: a note tied to the next one has TIE_START, a note tied to the previous one
+# has TIE_STOP, and a note in the middle of a tie has both.
+TIE_START = 1
+TIE_STOP = 2
+
+_TIE_FLAGS = {"start": TIE_START, "stop": TIE_STOP, "continue": TIE_START | TIE_STOP}
+
+
+def _tie_flag(
+    el: m21.note.GeneralNote,
+) -> int:
+
+    """Returns the tie flags of a note."""
+
+    return _TIE_FLAGS.get(el.tie.type, 0) if el.tie is not None else 0
+
+
+def score_events(
+    score: Union[str, Path, m21.stream.Stream],
+    strip: bool = True,
+) -> np.ndarray:
+
+    """Returns the event array of a score, given as a music21 stream or a filename.
+    Each part is split into its voices by music21's voicesToParts, as in extract_parts,
+    and the voice of an element is the position of its voice in the measure
+    (0 for the measures without voices). The events are sorted by part, voice and onset.
+    With strip = True, the tied notes are merged by music21's stripTies after the split,
+    as in extract_parts, and the merged notes keep the tie flags of their first note.
+    """
+
+    if isinstance(score, (str, Path)):
+        score = m21.converter.parse(score)
+    parts = list(score.parts) if hasattr(score, "parts") and len(score.parts) else [score]
+    sources = []
+    split = m21.stream.Score()
+    for p, part in enumerate(parts):
+        for v, voice_part in enumerate(part.voicesToParts().parts):
+            split.insert(0, voice_part)
+            sources.append((p, v))
+    if strip:
+        split = split.stripTies()
+    rows = []
+    for (p, voice), part in zip(sources, split.parts):
+        for el in part.flatten().getElementsByClass("GeneralNote"):
+            onset = el.offset
+            duration = el.quarterLength
+            if isinstance(el, m21.chord.Chord) and len(el):
+                for n in el.notes:
+                    tie = n.tie if n.tie is not None else el.tie
+                    flag = _TIE_FLAGS.get(tie.type, 0) if tie is not None else 0
+                    rows.append((onset, duration, p, voice, n.pitch.midi, flag))
+            elif isinstance(el, m21.note.Note):
+                rows.append((onset, duration, p, voice, el.pitch.midi, _tie_flag(el)))
+            else:
+                rows.append((onset, duration, p, voice, -1, 0))
+    result = event_array(rows)
+
+    return result[np.lexsort((event_times(result), result["voice"], result["part"]))]
+
+
+def event_array(
+    rows: Sequence,
+) -> np.ndarray:
+
+    """Returns the event array of a list of (onset, duration, part, voice, midi, tie) rows,
+    with the onsets and durations given as music21 offsets (floats or Fractions).
+    """
+
+    result = np.zeros(len(rows), dtype=EVENT_DTYPE)
+    if len(rows):
+        onsets, durations, parts, voices, midis, ties = zip(*rows)
+        result["onset_num"], result["onset_den"] = fraction_arrays(onsets)
+        result["duration_num"], result["duration_den"] = fraction_arrays(durations)
+        result["part"], result["voice"], result["midi"], result["tie"] = parts, voices, midis, ties
+
+    return result
+
+
+def event_times(
+    events: np.ndarray,
+    field: str = "onset",
+    exact: bool = False,
+) -> Union[np.ndarray, List]:
+
+    """Returns the onsets (or, with field = 'duration', the durations) of an event array,
+    as a float array, or with exact = True as a list of music21 offsets
+    (floats where they are exact and Fractions otherwise, see from_fraction_arrays).
+    """
+
+    if exact:
+        return from_fraction_arrays(events[field + "_num"], events[field + "_den"])
+
+    return events[field + "_num"] / events[field + "_den"]
+
+
+def load_events(
+    filename: Union[str, Path],
+    cache_dir: Union[str, Path] = None,
+) -> np.ndarray:
+
+    """Returns the event array of a score file (see score_events). If a cache
+    directory is given, the array is kept there (see score_cache), so the file
+    is parsed by music21 only once.
+    """
+
+    if cache_dir is None:
+        return score_events(filename)
+    extractor = lambda filename: {"events": score_events(filename)}
+
+    return cached_arrays(filename, {"extract": "events"}, extractor, cache_dir)["events"]
+
+
+def parts_events(
+    parts: List,
+) -> np.ndarray:
+
+    """Returns the event array of a list of parts, as returned by extract_parts,
+    with the index of each part in the list and voice 0.
+    """
+
+    rows = []
+    for p, part in enumerate(parts):
+        for el in part:
+            onset, duration = el.offset, el.quarterLength
+            if isinstance(el, m21.chord.Chord) and len(el):
+                rows += [(onset, duration, p, 0, n.pitch.midi, _tie_flag(n)) for n in el.notes]
+            elif isinstance(el, m21.note.Note):
+                rows.append((onset, duration, p, 0, el.pitch.midi, _tie_flag(el)))
+            else:
+                rows.append((onset, duration, p, 0, -1, 0))
+
+    return event_array(rows)
+
+
+def _fraction(
+    event: np.void,
+    field: str,
+) -> Fraction:
+
+    """Returns the onset or the duration of one event as a Fraction."""
+
+    return Fraction(int(event[field + "_num"]), int(event[field + "_den"]))
+
+
+def strip_ties(
+    events: np.ndarray,
+) -> np.ndarray:
+
+    """Returns the event array with the tied notes merged into one note:
+    a note tied to the previous one with the same pitch in its part and voice
+    extends the duration of that note. Unlike music21's stripTies, the notes
+    of a chord are merged one by one.
+    """
+
+    events = events[np.lexsort((event_times(events), events["voice"], events["part"]))]
+    result = events.copy()
+    keep = np.ones(len(events), dtype=bool)
+    heads = dict()
+    for i in np.flatnonzero(events["tie"]).tolist():
+        key = (int(events["part"][i]), int(events["voice"][i]), int(events["midi"][i]))
+        if events["tie"][i] & TIE_STOP and key in heads:
+            head = heads[key]
+            end = _fraction(events[i], "onset") + _fraction(events[i], "duration")
+            duration = (end - _fraction(result[head], "onset")).limit_denominator(1 << 31)
+            result["duration_num"][head], result["duration_den"][head] = duration.numerator, duration.denominator
+            keep[i] = False
+        else:
+            head = i
+        if events["tie"][i] & TIE_START:
+            heads[key] = head
+        else:
+            heads.pop(key, None)
+    result["tie"] = 0
+
+    return result[keep]
+
+
+def event_offsets(
+    events: np.ndarray,
+) -> List:
+
+    """Returns the sorted offsets of the elements of an event array, including
+    the starts of the gaps of each part and voice (where extract_parts adds rests),
+    as music21 offsets (see event_times).
+    """
+
+    offsets = set(zip(events["onset_num"].tolist(), events["onset_den"].tolist()))
+    for key in np.unique(events[["part", "voice"]]):
+        stream = events[(events["part"] == key["part"]) & (events["voice"] == key["voice"])]
+        stream = stream[np.argsort(event_times(stream), kind="stable")]
+        if len(stream) and stream["onset_num"][0] > 0:
+            offsets.add((0, 1))
+        end = None
+        for event in stream:
+            onset = _fraction(event, "onset")
+            if end is not None and end < onset:
+                offsets.add((end.numerator, end.denominator))
+            duration = _fraction(event, "duration")
+            end = onset + duration if end is None else max(end, onset + duration)
+    numerators, denominators = zip(*offsets) if offsets else ((), ())
+    result = from_fraction_arrays(np.array(numerators, dtype=np.int64), np.array(denominators, dtype=np.int64))
+
+    return sorted(result)
+
+
+def event_melody(
+    events: np.ndarray,
+    part: int = None,
+) -> np.ndarray:
+
+    """Returns the MIDI pitches of the notes of an event array (or of one of its parts),
+    in the order of their onsets. The tied notes must be merged already.
+    """
+
+    notes = events[events["midi"] >= 0]
+    if part is not None:
+        notes = notes[notes["part"] == part]
+
+    return notes["midi"][np.lexsort((notes["voice"], notes["part"], event_times(notes)))]
+
+
+def set_class_segmentation(
+    events: np.ndarray,
+    window: float = 1.0,
+    boundaries: Sequence = None,
+) -> Dict:
+
+    """Segments an event array into consecutive time spans and returns the
+    pitch-class set sounding in each span (every note that overlaps it) and its set class.
+    The spans are windows of the given length, starting at 0, or the spans between
+    the given boundaries (for instance, the offsets of the measures).
+    Returns a dictionary with arrays of the 'starts' of the spans, the 'masks'
+    of their pitch-class sets and the masks of their 'prime_forms' (see mask_to_pcs).
+    """
+
+    notes = events[events["midi"] >= 0]
+    onsets = event_times(notes)
+    ends = onsets + np.maximum(event_times(notes, "duration"), 0)
+    if boundaries is None:
+        last = ends.max() if len(notes) else 0.0
+        starts = np.arange(0, max(last, window), window)
+    else:
+        starts = np.asarray(boundaries, dtype=np.float64)
+    first = np.searchsorted(starts, onsets, side="right") - 1
+    last = np.maximum(np.searchsorted(starts, ends, side="left") - 1, first)
+    valid = first >= 0
+    first, last, pcs = first[valid], last[valid], notes["midi"][valid] % 12
+    counts = last - first + 1
+    spans = np.repeat(first - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+    masks = np.zeros(len(starts), dtype=np.uint16)
+    np.bitwise_or.at(masks, spans, np.repeat((1 << pcs).astype(np.uint16), counts))
+
+    return {
+        "starts": starts,
+        "masks": masks,
+        "prime_forms": prime_form_table()[masks],
+    }
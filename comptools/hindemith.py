@@ -5,6 +5,7 @@ Module with the tools for Paul Hindemith's chord analysis.
 
 from typing import Dict, List, Sequence, Union
 from itertools import combinations
+import numpy as np
 
 
 def root_interval(
@@ -108,11 +109,91 @@ def find_root(
             clean_strengths = [x for x in strengths if x]
             if strengths[i] == max(clean_strengths):
                 high_indices.append(i)
-    result = root_interval(all_intervals[high_indices[0]])
+        result = root_interval(all_intervals[high_indices[0]])
 
     return result
 
 
+def interval_class_histogram(
+    chord: Sequence,
+) -> List:
+
+    """Returns the interval-class histogram of a chord: a list with one entry per
+    interval class (0 to 6) of the form [count, first], where count is the number
+    of pairs of notes with that interval class and first is the pair of indices (i, j)
+    of its lowest occurrence in the order of combinations(chord, 2), or None.
+    Runs in O(k) time for a chord of k notes.
+    """
+
+    pcs = [x % 12 for x in chord]
+    occurrences = [0] * 12
+    last = [-1] * 12
+    for i, pc in enumerate(pcs):
+        occurrences[pc] += 1
+        last[pc] = i
+    result = []
+    for ic in range(7):
+        if ic == 0:
+            count = sum(n * (n - 1) // 2 for n in occurrences)
+        elif ic == 6:
+            count = sum(occurrences[pc] * occurrences[pc + 6] for pc in range(6))
+        else:
+            count = sum(occurrences[pc] * occurrences[(pc + ic) % 12] for pc in range(12))
+        first = None
+        if count:
+            for i, pc in enumerate(pcs):
+                targets = {(pc + ic) % 12, (pc - ic) % 12}
+                if max(last[t] for t in targets) > i:
+                    j = next(j for j in range(i + 1, len(pcs)) if pcs[j] in targets)
+                    first = (i, j)
+                    break
+        result.append([count, first])
+
+    return result
+
+
+def no_root_histogram(
+    chord: Sequence,
+    histogram: List = None,
+) -> bool:
+
+    """Same as no_root, using the interval-class histogram of the chord.
+    """
+
+    if histogram is None:
+        histogram = interval_class_histogram(chord)
+    if histogram[6][0]:
+        return not (histogram[4][0] or histogram[5][0])
+    if len(chord) != 3:
+        return False
+    chord = [x % 12 for x in chord]
+    aug = [chord[0], (chord[0] + 4) % 12, (chord[0] + 8) % 12]
+    quart = [chord[0], (chord[0] + 5) % 12, (chord[0] + 10) % 12]
+
+    return sorted(chord) in [aug, quart]
+
+
+def find_root_histogram(
+    chord: Sequence,
+) -> Union[int, None]:
+
+    """Same as find_root, for large chords (clusters, spectral chords): the strongest
+    interval class is read from the interval-class histogram and the root is taken
+    from its lowest occurrence, in near-linear time in the size of the chord.
+    Returns None if the chord has no root.
+    """
+
+    histogram = interval_class_histogram(chord)
+    if no_root_histogram(chord, histogram):
+        return None
+    for ic in [5, 4, 3, 2, 1]:
+        if histogram[ic][0]:
+            i, j = histogram[ic][1]
+            return root_interval([chord[i], chord[j]])
+
+    return None
+
+
 def interval_root_force(
     chord: Sequence,
 ) -> List:
@@ -179,4 +260,113 @@ def hindemith_classification(
                 else:
                     chord_type = 'I.2'
                     
-    return chord_type
\ No newline at end of file
+    return chord_type
+
+
+_ROOT_CHOICES = np.array(
+    [2 if d == 0 else
+     (0 if d in [3,4,7,8,9] else 1 if d in [1,2,5,10,11] else 2) if d > 0 else
+     (1 if d % 12 in [3,4,5,8,9] else 0 if d % 12 in [1,2,7,10,11] else 2)
+     for d in range(-11, 12)]
+)
+
+
+def hindemith_batch(
+    voicings: Sequence,
+    cache: Dict = None,
+) -> Dict:
+
+    """Classifies an N x k array of voicings (MIDI pitches, lowest voice first)
+    as hindemith_classification does, computing the pairwise intervals of all
+    the chords at once. Returns a dictionary with arrays for the 'groups',
+    the 'roots' (as in find_root, with -1 for chords without a root) and the
+    'strengths' of the roots. Repeated voicings are classified once; a dictionary
+    given as cache keeps the results of the voicings between calls.
+    """
+
+    voicings = np.asarray(voicings, dtype=np.int64)
+    if voicings.ndim == 1:
+        voicings = voicings[np.newaxis, :]
+    unique, inverse = np.unique(voicings, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    groups = np.empty(len(unique), dtype=object)
+    roots = np.empty(len(unique), dtype=np.int64)
+    strengths = np.empty(len(unique), dtype=np.int64)
+
+    if cache is not None:
+        keys = [tuple(x) for x in unique.tolist()]
+        known = np.array([key in cache for key in keys], dtype=bool)
+        for i in np.flatnonzero(known):
+            groups[i], roots[i], strengths[i] = cache[keys[i]]
+    else:
+        known = np.zeros(len(unique), dtype=bool)
+
+    todo = np.flatnonzero(~known)
+    if len(todo):
+        new = _classify_voicings(unique[todo])
+        groups[todo], roots[todo], strengths[todo] = new
+        if cache is not None:
+            for j, i in enumerate(todo):
+                cache[keys[i]] = (new[0][j], int(new[1][j]), int(new[2][j]))
+
+    return {
+        "groups": groups[inverse],
+        "roots": roots[inverse],
+        "strengths": strengths[inverse],
+    }
+
+
+def _classify_voicings(
+    chords: np.ndarray,
+) -> List:
+
+    """Vectorized core of hindemith_batch for an array of distinct voicings."""
+
+    first, second = np.triu_indices(chords.shape[1], 1)
+    low = chords[:, first]
+    high = chords[:, second]
+    intervals = np.abs(high - low) % 12
+    strengths = (high - low) % 12
+    strengths = np.minimum(strengths, 12 - strengths)
+    strengths[strengths == 6] = 0
+    choices = _ROOT_CHOICES[high % 12 - low % 12 + 11]
+    pair_roots = np.where(choices == 0, low, np.where(choices == 1, high, 0))
+    best = strengths.argmax(axis=1)
+    root = pair_roots[np.arange(len(chords)), best]
+    strength = strengths[np.arange(len(chords)), best]
+
+    pcs = chords % 12
+    pc_intervals = np.abs(pcs[:, second] - pcs[:, first]) % 12
+    has_tritone = (pc_intervals == 6).any(axis=1)
+    has_strong = np.isin(pc_intervals, [4, 8, 5, 7]).any(axis=1)
+    rootless = np.where(has_tritone, ~has_strong, False)
+    if chords.shape[1] == 3:
+        in_order = np.sort(pcs, axis=1)
+        aug = (in_order == (pcs[:, :1] + [0, 4, 8]) % 12).all(axis=1)
+        quart = (in_order == (pcs[:, :1] + [0, 5, 10]) % 12).all(axis=1)
+        rootless |= ~has_tritone & (aug | quart)
+
+    tritones = (intervals == 6).sum(axis=1)
+    has = lambda interval: (intervals == interval).any(axis=1)
+    on_bass = root == chords[:, 0]
+    groups = np.select(
+        [
+            rootless & (tritones > 0),
+            rootless,
+            (tritones > 0) & (has(1) | has(11)) & on_bass,
+            (tritones > 0) & (has(1) | has(11)),
+            (tritones == 1) & has(10) & ~has(2) & on_bass,
+            (tritones == 1) & has(10) & ~has(2),
+            (tritones == 1) & (has(10) | has(2)) & on_bass,
+            (tritones == 1) & (has(10) | has(2)),
+            tritones >= 2,
+            tritones > 0,
+            (has(1) | has(2) | has(10) | has(11)) & on_bass,
+            has(1) | has(2) | has(10) | has(11),
+            on_bass,
+        ],
+        ["VI", "V", "IV.1", "IV.2", "IIa", "IIb.2", "IIb.1", "IIb.2", "IIb.3", None, "III.1", "III.2", "I.1"],
+        "I.2",
+    )
+
+    return [groups, np.where(rootless, -1, root), np.where(rootless, 0, strength)]
@@ -0,0 +1,181 @@
+"""
+Module with the score-level harmonic analysis of Paul Hindemith of the Comp_Tools library.
+A score is chordified one measure at a time and each vertical is classified
+with the hindemith module, giving the root progression, the harmonic fluctuation
+(the rise and fall of the chord groups) and the Series II value of the outer voices.
+"""
+
+
+from .hindemith import hindemith_batch
+import music21 as m21
+from typing import Dict, Generator, Sequence, Tuple, Union
+
+
+# Chord groups from the most to the least stable, in Hindemith's own numbering
+# (groups I to VI in order of decreasing harmonic value).
+HARMONIC_VALUES = {
+    "I.1": 1, "I.2": 2, "IIa": 3, "IIb.1": 4, "IIb.2": 5, "IIb.3": 6,
+    "III.1": 7, "III.2": 8, "IV.1": 9, "IV.2": 10, "V": 11, "VI": 12,
+}
+
+# Series II: intervals (mod 12) from the most to the least consonant.
+SERIES_II = (0, 7, 5, 4, 8, 3, 9, 2, 10, 1, 11, 6)
+
+
+def series_ii_value(
+    pair: Sequence,
+) -> int:
+
+    """Returns the rank (1 to 12) of the interval of two pitches in Hindemith's
+    Series II: octave, fifth, fourth, major third, minor sixth, minor third,
+    major sixth, major second, minor seventh, minor second, major seventh, tritone.
+    """
+
+    return SERIES_II.index((pair[1] - pair[0]) % 12) + 1
+
+
+def classify_vertical(
+    pitches: Sequence,
+    cache: Dict = None,
+) -> Tuple:
+
+    """Returns the (group, root, strength) of a vertical given as MIDI pitches,
+    using hindemith_batch. The group and root are None for verticals with less than
+    two pitch classes (single notes, unisons and octaves) or with no root.
+    Results are kept in the cache dictionary, keyed by the sorted pitch tuple.
+
+    >>> classify_vertical([48, 60])
+    (None, None, 0)
+    """
+
+    key = tuple(sorted(pitches))
+    if len(set(p % 12 for p in key)) < 2:
+        group, root, strength = None, -1, 0
+    elif cache is not None and key in cache:
+        group, root, strength = cache[key]
+    else:
+        result = hindemith_batch([key], cache)
+        group, root, strength = result["groups"][0], int(result["roots"][0]), int(result["strengths"][0])
+
+    return group, (None if root < 0 else root), strength
+
+
+def harmonic_value(
+    pitches: Sequence,
+    cache: Dict = None,
+) -> Union[int, None]:
+
+    """Returns the harmonic value (see HARMONIC_VALUES) of a vertical given as MIDI pitches,
+    or None if it has no group. The lower the value, the more stable the chord:
+    a dominant seventh (group IIa) ranks above an augmented triad (group V).
+
+    >>> harmonic_value([55, 59, 62, 65]) < harmonic_value([60, 64, 68])
+    True
+    """
+
+    return HARMONIC_VALUES.get(classify_vertical(pitches, cache)[0])
+
+
+def iter_verticals(
+    score: m21.stream.Score,
+) -> Generator:
+
+    """Generator for the verticals of a score, chordified one measure at a time.
+    Yields tuples (measure number, offset, MIDI pitches), the offset being
+    the position of the vertical in the whole score. The measures are taken
+    by position, so repeated numbers (voltas, suffixed measures) are read once each.
+
+    >>> score = m21.stream.Score([m21.stream.Part([m21.stream.Measure([m21.note.Note(p + octave, quarterLength=4)], number=n)
+    ...     for p, n in [(60, 1), (62, 2), (64, 2), (65, 3)]], givenElementsBehavior="append") for octave in (0, 12)])
+    >>> list(iter_verticals(score))
+    [(1, 0.0, [60, 72]), (2, 4.0, [62, 74]), (2, 8.0, [64, 76]), (3, 12.0, [65, 77])]
+    """
+
+    parts = list(score.parts) if len(score.parts) else [score]
+    measures = parts[0].getElementsByClass(m21.stream.Measure)
+    if not len(measures):
+        for el in score.chordify().flatten().getElementsByClass(m21.chord.Chord):
+            yield (None, el.offset, [p.midi for p in el.pitches])
+        return
+    for i, (number, start) in enumerate([(m.number, m.getOffsetBySite(parts[0])) for m in measures]):
+        excerpt = score.measures(i, i + 1, indicesNotNumbers=True)
+        for el in excerpt.chordify().recurse().getElementsByClass(m21.chord.Chord):
+            yield (number, start + el.offset, [p.midi for p in el.pitches])
+
+
+def iter_hindemith_analysis(
+    score: Union[str, m21.stream.Score],
+    cache: Dict = None,
+) -> Generator:
+
+    """Generator for the Hindemith analysis of the verticals of a score, given as
+    a music21 stream or a filename. Yields one dictionary per vertical with its
+    measure, offset, pitches, group, root, strength, harmonic value (see HARMONIC_VALUES),
+    root step (the interval from the previous root, in semitones mod 12) and
+    the Series II value of its outer voices. Identical verticals are classified once.
+    """
+
+    if isinstance(score, str):
+        score = m21.converter.parse(score)
+    if cache is None:
+        cache = dict()
+    previous_root = None
+    for number, offset, pitches in iter_verticals(score):
+        pitches = sorted(pitches)
+        group, root, strength = classify_vertical(pitches, cache)
+        root_step = None
+        if root is not None:
+            if previous_root is not None:
+                root_step = (root - previous_root) % 12
+            previous_root = root
+        yield {
+            "measure": number,
+            "offset": offset,
+            "pitches": tuple(pitches),
+            "group": group,
+            "root": root,
+            "strength": strength,
+            "value": HARMONIC_VALUES.get(group),
+            "root_step": root_step,
+            "series_ii": series_ii_value((pitches[0], pitches[-1])) if len(pitches) > 1 else None,
+        }
+
+
+def hindemith_analysis(
+    score: Union[str, m21.stream.Score],
+    cache: Dict = None,
+) -> Dict:
+
+    """Returns the Hindemith analysis of a score as a dictionary of lists, one entry
+    per vertical (see iter_hindemith_analysis), with the 'offsets', 'groups', 'roots',
+    the 'root_progression' (the root steps), the 'fluctuation' (the harmonic values)
+    and its 'fluctuation_steps' (the change of the harmonic value from the previous vertical),
+    and the 'series_ii' values.
+    """
+
+    result = {
+        "offsets": [],
+        "groups": [],
+        "roots": [],
+        "root_progression": [],
+        "fluctuation": [],
+        "fluctuation_steps": [],
+        "series_ii": [],
+    }
+    previous_value = None
+    for vertical in iter_hindemith_analysis(score, cache):
+        value = vertical["value"]
+        result["offsets"].append(vertical["offset"])
+        result["groups"].append(vertical["group"])
+        result["roots"].append(vertical["root"])
+        result["root_progression"].append(vertical["root_step"])
+        result["fluctuation"].append(value)
+        if value is not None and previous_value is not None:
+            result["fluctuation_steps"].append(value - previous_value)
+        else:
+            result["fluctuation_steps"].append(None)
+        if value is not None:
+            previous_value = value
+        result["series_ii"].append(vertical["series_ii"])
+
+    return result
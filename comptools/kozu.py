@@ -3,9 +3,18 @@ Module that implements Fernando Kozu's description
 of a Brian Ferneyhough process.
 """
 
-from .basic_tools import flatten_sequence
-import pycse.lisp
-from typing import List, Sequence, Union
+from functools import lru_cache
+from itertools import product
+from multiprocessing import Pool
+from pathlib import Path
+import io
+import json
+import time
+import numpy as np
+from typing import IO, Dict, Generator, List, Sequence, Tuple, Union
+
+
+SWEEP_PARAMETERS = ("bars_cycle", "beat_cycle", "num_bars", "sub_pos", "sub_nature", "layers", "shared_counter")
 
 
 def make_beat_cycle(
@@ -53,160 +62,395 @@ def kozu(
     low_mid_cycle: Sequence,
     low_cycle: Sequence,
     ranges: Sequence,
-) -> Union[str,str]:
+    output: str = "lisp",
+) -> Union[Tuple[str, str], Tuple[List, List], Dict]:
 
     """Implements Fernando Kozu's description of a Brian Ferneyhough process.
+    With output = "lisp", returns the OpenMusic rhythm tree and the list of pitches
+    as strings; with output = "native", returns them as lists (see kozu_engine);
+    with output = "numpy", returns the arrays of kozu_arrays.
     """
 
-    beat_cycles = make_beat_cycle(beat_cycle,num_bars_cycles)
-    bar_cycles = make_bar_cycle(bars_cycle,num_bars_cycles)
-    flat_cycles = flatten_sequence(beat_cycles)
+    layers = [
+        (high_cycle, ranges[3]),
+        (high_mid_cycle, ranges[2]),
+        (low_mid_cycle, ranges[1]),
+        (low_cycle, ranges[0]),
+    ]
+    arrays = kozu_arrays(bars_cycle, beat_cycle, num_bars_cycles, sub_pos, sub_nature, layers, True)
+    if output == "numpy":
+        return arrays
+    piece, pitches = kozu_rhythm_tree(arrays), arrays["pitches"].tolist()
+    if output == "native":
+        return piece, pitches
+    if output != "lisp":
+        raise ValueError("invalid output: " + str(output))
 
-    sub_inds = [[-1,0]]
-    k = 0
-    while sub_inds[-1][0] < len(flat_cycles):
-        pos = sub_pos[k % len(sub_pos)] + sub_inds[k][0]
-        nat = sub_nature[k % len(sub_nature)]
-        pair = [pos,nat]
-        sub_inds.append(pair)
-        k += 1
-    sub_inds.pop(0)
-    if sub_inds[-1][0] > len(flat_cycles): sub_inds.pop()
-    sub_ind_dict = dict()
-    for pair in sub_inds: sub_ind_dict[pair[0]] = pair[1]
-
-    sub_i = [x[0] for x in sub_inds]
-    sub_value = [x[1] for x in sub_inds]
-    heads = [sub_i[0]]
-    for i in range(1,len(sub_i)):
-        backlist = sub_value[0:i]
-        heads.append(sub_i[i] + sum(backlist))
-    sub_ind_dict = dict()
-    for i in range(len(heads)):
-        sub_ind_dict[heads[i]] = sub_value[i]
-    full_flat = [x for x in flat_cycles]
-    for key in sub_ind_dict.keys(): full_flat += [1] * (sub_ind_dict[key])
-    high_inds = [high_cycle[0] - 1]
-    h = 1
-    while high_inds[-1] < len(full_flat):
-        value = high_inds[-1] + high_cycle[h % len(high_cycle)]
-        high_inds.append(value)
-        h += 1
-    for i, x in enumerate(high_inds):
-        low_heads = [y for y in heads if y <= x]
-        soma = high_inds[i] + len(low_heads)
-        soma_low = [x for x in heads if x <= soma and x not in low_heads]
-        soma += len(soma_low)
-        high_inds[i] = soma
-    if high_inds[-1] > len(full_flat):
-        while high_inds[-1] > len(full_flat): high_inds.pop()
-    high_mid_inds = [high_mid_cycle[0] - 1]
-    h = 1
-    while high_mid_inds[-1] < len(full_flat):
-        value = high_mid_inds[-1] + high_mid_cycle[h % len(high_mid_cycle)]
-        high_mid_inds.append(value)
-        h += 1
-    for i, x in enumerate(high_mid_inds):
-        low_heads = [y for y in heads if y <= x]
-        soma = high_mid_inds[i] + len(low_heads)
-        soma_low = [x for x in heads if x <= soma and x not in low_heads]
-        soma += len(soma_low)
-        high_mid_inds[i] = soma
-    if high_mid_inds[-1] > len(full_flat):
-        while high_mid_inds[-1] > len(full_flat): high_mid_inds.pop()
-    low_mid_inds = [low_mid_cycle[0] - 1]
-    h = 1
-    while low_mid_inds[-1] < len(full_flat):
-        value = low_mid_inds[-1] + low_mid_cycle[h % len(low_mid_cycle)]
-        low_mid_inds.append(value)
-        h += 1
-    for i, x in enumerate(low_mid_inds):
-        low_heads = [y for y in heads if y <= x]
-        soma = low_mid_inds[i] + len(low_heads)
-        soma_low = [x for x in heads if x <= soma and x not in low_heads]
-        soma += len(soma_low)
-        low_mid_inds[i] = soma
-    if low_mid_inds[-1] > len(full_flat):
-        while low_mid_inds[-1] > len(full_flat): low_mid_inds.pop()
-    low_inds = [low_cycle[0] - 1]
-    h = 1
-    while low_inds[-1] < len(full_flat):
-        value = low_inds[-1] + low_cycle[h % len(low_cycle)]
-        low_inds.append(value)
-        h += 1
-    for i, x in enumerate(low_inds):
-        low_heads = [y for y in heads if y <= x]
-        soma = low_inds[i] + len(low_heads)
-        soma_low = [x for x in heads if x <= soma and x not in low_heads]
-        soma += len(soma_low)
-        low_inds[i] = soma
-    if low_inds[-1] > len(full_flat):
-        while low_inds[-1] > len(full_flat): low_inds.pop()
-    full_high = []
-    h = 0
-    full_mid_high = []
-    mh = 0
-    full_mid_low = []
-    ml = 0
-    full_low = []
-    l = 0
+    return om_string(["?", piece]), om_string(pitches)
+
+
+def subdivision_heads(
+    num_beats: int,
+    sub_pos: Sequence,
+    sub_nature: Sequence,
+) -> Dict:
+
+    """Returns a dictionary with the position of each subdivided beat (its head)
+    in the extended list of beats and the number of notes added by the subdivision,
+    as in kozu. The heads are found with a prefix sum of the subdivision sizes.
+    """
+
+    result = dict()
+    pos = -1
+    added = 0
     k = 0
-    while k < len(full_flat):
-        if k in high_inds:
-            full_high.append(high_cycle[h % len(high_cycle)] + ranges[3])
-            h += 1
-        else:
-            full_high.append(0)
-        if k in high_mid_inds:
-            full_mid_high.append(high_mid_cycle[h % len(high_mid_cycle)] + ranges[2])
-            mh += 1
-        else:
-            full_mid_high.append(0)
-        if k in low_mid_inds:
-            full_mid_low.append(low_mid_cycle[h % len(low_mid_cycle)] + ranges[1])
-            ml += 1
-        else:
-            full_mid_low.append(0)
-        if k in low_inds:
-            full_low.append(low_cycle[h % len(low_cycle)] + ranges[0])
-            l += 1
-        else:
-            full_low.append(0)
+    while pos < num_beats:
+        pos += sub_pos[k % len(sub_pos)]
+        if pos > num_beats:
+            break
+        size = sub_nature[k % len(sub_nature)]
+        result[pos + added] = size
+        added += size
         k += 1
-    pitch_groups = [[full_high[i],full_mid_high[i],full_mid_low[i],full_low[i]] for i in range(len(full_flat))]
-    final_pitches = []
-    for i in range(len(full_flat)):
-        group = pitch_groups[i]
-        if group.count(0) == 4: pass
+
+    return result
+
+
+def layer_indices(
+    cycle: Sequence,
+    heads: Sequence,
+    length: int,
+) -> np.ndarray:
+
+    """Returns the positions of the notes of a register layer with the given cycle
+    in the extended list of beats of the given length, shifted past the subdivision
+    heads as in kozu. The heads must be sorted; the number of heads up to each position
+    is read from a prefix count array, so the layer is computed in linear time.
+    """
+
+    cycle = np.asarray(cycle, dtype=np.int64)
+    steps = np.resize(np.roll(cycle, -1), max(length - cycle[0] + 1, 0) // max(cycle.min(), 1) + 2)
+    raw = cycle[0] - 1 + np.concatenate([[0], np.cumsum(steps)])
+    raw = raw[:np.searchsorted(raw, length) + 1]
+    if len(heads):
+        counts = np.cumsum(np.bincount(heads, minlength=heads[-1] + 1))
+        upto = lambda x: np.where(x < 0, 0, counts[np.clip(x, 0, len(counts) - 1)])
+    else:
+        upto = lambda x: np.zeros_like(x)
+    low = upto(raw)
+    result = raw + low
+    result += upto(result) - low
+
+    return result[result <= length]
+
+
+def _freeze(
+    value: Union[Sequence, int],
+) -> Union[Tuple, int]:
+
+    """Returns a hashable copy of a nested sequence, to be used as a cache key."""
+
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return tuple(_freeze(x) for x in value)
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _cycle_expansion(
+    cycle: Tuple,
+    num_bars: int,
+) -> Tuple:
+
+    """Cached make_bar_cycle. The beat counts of make_beat_cycle are the
+    expansion of the beat cycle."""
+
+    return tuple(make_bar_cycle(cycle, num_bars))
+
+
+@lru_cache(maxsize=256)
+def _cached_heads(
+    num_beats: int,
+    sub_pos: Tuple,
+    sub_nature: Tuple,
+) -> Tuple[np.ndarray, np.ndarray]:
+
+    """Cached subdivision_heads, as read-only arrays of heads and sizes."""
+
+    head_sizes = subdivision_heads(num_beats, sub_pos, sub_nature)
+    heads = np.array(sorted(head_sizes), dtype=np.int64)
+    sizes = np.array([head_sizes[k] for k in heads.tolist()], dtype=np.int64)
+    heads.flags.writeable = False
+    sizes.flags.writeable = False
+
+    return heads, sizes
+
+
+@lru_cache(maxsize=1024)
+def _cached_layer(
+    cycle: Tuple,
+    num_beats: int,
+    sub_pos: Tuple,
+    sub_nature: Tuple,
+) -> np.ndarray:
+
+    """Cached layer_indices for the subdivisions of the given beats."""
+
+    heads, sizes = _cached_heads(num_beats, sub_pos, sub_nature)
+    result = layer_indices(cycle, heads, num_beats + int(sizes.sum()))
+    result.flags.writeable = False
+
+    return result
+
+
+def kozu_arrays(
+    bars_cycle: Sequence,
+    beat_cycle: Sequence,
+    num_bars: int,
+    sub_pos: Sequence,
+    sub_nature: Sequence,
+    layers: Sequence,
+    shared_counter: bool = False,
+) -> Dict:
+
+    """Linear-time implementation of Fernando Kozu's description of a Brian Ferneyhough
+    process, with any number of register layers. Each layer is a pair (cycle, range):
+    the notes of the layer fall on the positions given by its cycle and their pitches
+    are the values of the cycle plus the range. At each position the highest pitch
+    of the layers is taken. kozu reads the cycles of all its layers with the counter
+    of the first (high) layer; use shared_counter = True to do the same.
+    Returns a dictionary of arrays: the 'bars' and the number of 'beats' of each bar,
+    the flat 'proportions' (1 for notes, -1 for rests), the positions of the
+    subdivision 'heads' in it with the 'sizes' of their groups, and the 'pitches'
+    (in midicents). See kozu_rhythm_tree.
+    """
+
+    beat_counts = _cycle_expansion(_freeze(beat_cycle), num_bars)
+    num_beats = sum(beat_counts)
+    sub_pos, sub_nature = _freeze(sub_pos), _freeze(sub_nature)
+    heads, sizes = _cached_heads(num_beats, sub_pos, sub_nature)
+    length = num_beats + int(sizes.sum())
+
+    values = np.zeros((len(layers), length), dtype=np.int64)
+    first_count = None
+    for n, (cycle, pitch_range) in enumerate(layers):
+        present = np.zeros(length + 1, dtype=bool)
+        present[_cached_layer(_freeze(cycle), num_beats, sub_pos, sub_nature)] = True
+        present = present[:length]
+        count = np.cumsum(present)
+        if n == 0:
+            first_count = count
+            positions = count - present
+        elif shared_counter:
+            positions = first_count
         else:
-            available = [x for x in group if x != 0]
-            final_pitches.append(max(available) * 100) 
-    rests_raw = [i for i in range(len(pitch_groups)) if pitch_groups[i].count(0) == 4]
-    rests = [x for x in rests_raw if x not in heads]
-    for i in range(len(full_flat)):
-        if i in rests: full_flat[i] = -1
+            positions = count - present
+        cycle = np.asarray(cycle, dtype=np.int64)
+        values[n] = np.where(present, cycle[positions % len(cycle)] + pitch_range, 0)
+
+    sounding = values != 0
+    has_pitch = sounding.any(axis=0)
+    highest = np.where(sounding, values, np.iinfo(np.int64).min).max(axis=0)
+    is_head = np.zeros(length, dtype=bool)
+    is_head[heads[heads < length]] = True
+
+    return {
+        "bars": np.array(_cycle_expansion(_freeze(bars_cycle), num_bars)),
+        "beats": np.array(beat_counts, dtype=np.int64),
+        "proportions": np.where(~has_pitch & ~is_head, -1, 1).astype(np.int8),
+        "heads": heads.copy(),
+        "sizes": sizes.copy(),
+        "pitches": highest[has_pitch] * 100,
+    }
+
+
+def kozu_rhythm_tree(
+    arrays: Dict,
+) -> List:
+
+    """Returns the list of bars of the result of kozu_arrays, each one a pair
+    [bar, proportions], with the subdivided beats as pairs [head, group].
+    """
+
+    full_flat = arrays["proportions"].tolist()
+    head_sizes = dict(zip(arrays["heads"].tolist(), arrays["sizes"].tolist()))
     new_flat = []
     k = 0
     while k < len(full_flat):
-        if k in heads:
-            cur = full_flat[k]
-            size_group = sub_ind_dict[k]
-            group = full_flat[k+1: size_group+k+1]
-            #full_flat[k] = [cur,group]
-            new_flat.append([cur,group])
-            k += len(group)+1
+        if k in head_sizes:
+            group = full_flat[k + 1:k + 1 + head_sizes[k]]
+            new_flat.append([full_flat[k], group])
+            k += len(group) + 1
         else:
             new_flat.append(full_flat[k])
             k += 1
-    final_proportions = []
+    result = []
     k = 0
-    for bar in beat_cycles:
-        group = new_flat[k:k+len(bar)]
-        final_proportions.append(group)
-        k += len(group)
-    final_piece = [[bar_cycles[i],final_proportions[i]] for i in range(len(bar_cycles))]
-    final_piece_om = ["?"]
-    final_piece_om.append(final_piece)
-    final_piece_om = final_piece_om.lisp.replace('"',"")
-
-    return final_piece_om, final_pitches.lisp
\ No newline at end of file
+    for bar, beats in zip(arrays["bars"].tolist(), arrays["beats"].tolist()):
+        result.append([bar, new_flat[k:k + beats]])
+        k += beats
+
+    return result
+
+
+def kozu_engine(
+    bars_cycle: Sequence,
+    beat_cycle: Sequence,
+    num_bars: int,
+    sub_pos: Sequence,
+    sub_nature: Sequence,
+    layers: Sequence,
+    shared_counter: bool = False,
+) -> Tuple[List, List]:
+
+    """Same as kozu_arrays, returning the list of bars, each one a pair
+    [bar, proportions], and the list of pitches (in midicents), as native lists.
+    """
+
+    arrays = kozu_arrays(bars_cycle, beat_cycle, num_bars, sub_pos, sub_nature, layers, shared_counter)
+
+    return kozu_rhythm_tree(arrays), arrays["pitches"].tolist()
+
+
+def write_om(
+    structure: Union[Sequence, int, float, str],
+    stream: IO,
+    chunk_size: int = 65536,
+) -> None:
+
+    """Writes a nested list to a text stream in OpenMusic (lisp) format,
+    with strings as unquoted symbols. The structure is walked without recursion
+    and written in chunks, so deep and long structures are written in constant memory.
+    """
+
+    buffer = []
+    size = 0
+    end = object()
+    stack = [iter([structure])]
+    first = True
+    while stack:
+        el = next(stack[-1], end)
+        if el is end:
+            stack.pop()
+            if stack:
+                buffer.append(")")
+                first = False
+            continue
+        if not first:
+            buffer.append(" ")
+        if isinstance(el, (list, tuple, np.ndarray)):
+            buffer.append("(")
+            stack.append(iter(el))
+            first = True
+        else:
+            buffer.append(str(el))
+            first = False
+        size += 1
+        if size >= chunk_size:
+            stream.write("".join(buffer))
+            buffer = []
+            size = 0
+    stream.write("".join(buffer))
+
+
+def om_string(
+    structure: Union[Sequence, int, float, str],
+) -> str:
+
+    """Returns a nested list in OpenMusic (lisp) format (see write_om).
+    """
+
+    result = io.StringIO()
+    write_om(structure, result)
+
+    return result.getvalue()
+
+
+def sweep_configurations(
+    grid: Dict,
+) -> Generator:
+
+    """Generator for the configurations of a parameter grid: a dictionary with
+    a list of values for each argument of kozu_engine (see SWEEP_PARAMETERS).
+    Yields one dictionary of arguments per combination, in a fixed order,
+    with the last parameter varying fastest.
+    """
+
+    unknown = [name for name in grid if name not in SWEEP_PARAMETERS]
+    if unknown:
+        raise ValueError("invalid parameters: " + str(unknown))
+    names = [name for name in SWEEP_PARAMETERS if name in grid]
+    for values in product(*[grid[name] for name in names]):
+        yield dict(zip(names, values))
+
+
+def _run_configuration(
+    item: Tuple,
+) -> Dict:
+
+    """Runs kozu_engine on one configuration of a sweep, recording its time
+    and any error raised."""
+
+    index, parameters = item
+    start = time.perf_counter()
+    result = {"index": index, "parameters": parameters}
+    try:
+        result["piece"], result["pitches"] = kozu_engine(**parameters)
+    except Exception as error:
+        result["error"] = repr(error)
+    result["time"] = time.perf_counter() - start
+
+    return result
+
+
+def iter_kozu_sweep(
+    grid: Dict,
+    processes: int = None,
+    chunksize: int = 1,
+) -> Generator:
+
+    """Generator for the results of kozu_engine over all the configurations of
+    a parameter grid (see sweep_configurations), computed over a process pool.
+    Yields dictionaries with the 'index' and 'parameters' of each configuration,
+    its 'piece' and 'pitches' (or an 'error') and its 'time', in the order
+    of the configurations. The cycle expansions, subdivision heads and layers
+    are cached in each worker, so configurations that share them compute them once.
+    If the generator is closed before the end (or the consumer raises), the pool is
+    terminated instead of finishing the remaining configurations.
+    """
+
+    items = enumerate(sweep_configurations(grid))
+    if processes == 1:
+        yield from map(_run_configuration, items)
+        return
+    pool = Pool(processes)
+    try:
+        yield from pool.imap(_run_configuration, items, chunksize)
+    except BaseException:
+        pool.terminate()
+        raise
+    finally:
+        pool.close()
+        pool.join()
+
+
+def kozu_sweep(
+    grid: Dict,
+    path: Union[str, Path],
+    processes: int = None,
+    chunksize: int = 1,
+) -> int:
+
+    """Runs kozu_engine over all the configurations of a parameter grid
+    (see iter_kozu_sweep) and writes the results to a JSON lines file,
+    one line per configuration, as soon as each one is done.
+    Returns the number of configurations.
+    """
+
+    count = 0
+    with open(path, "w") as file:
+        for result in iter_kozu_sweep(grid, processes, chunksize):
+            file.write(json.dumps(result) + "\n")
+            file.flush()
+            count += 1
+
+    return count
@@ -1,9 +1,93 @@
-up_to_six = [(1, 1, 1, 1, 1, 7), (7, 1, 1, 1, 1, 1), (1, 1, 1, 7, 1, 1), (1, 1, 7, 1, 1, 1), (1, 1, 1, 1, 7, 1), (1, 7, 1, 1, 1, 1), (2, 1, 6, 1, 1, 1), (1, 2, 1, 6, 1, 1), (1, 1, 1, 2, 6, 1), (1, 1, 1, 1, 6, 2), (1, 1, 6, 1, 2, 1), (6, 1, 1, 1, 2, 1), (2, 1, 1, 1, 1, 6), (1, 1, 2, 1, 1, 6), (1, 1, 2, 6, 1, 1), (1, 1, 6, 1, 1, 2), (6, 1, 1, 1, 1, 2), (6, 1, 2, 1, 1, 1), (1, 2, 6, 1, 1, 1), (1, 2, 1, 1, 1, 6), (2, 1, 1, 6, 1, 1), (1, 1, 1, 1, 2, 6), (1, 1, 1, 6, 2, 1), (2, 1, 1, 1, 6, 1), (1, 1, 2, 1, 6, 1), (1, 6, 1, 1, 1, 2), (1, 1, 1, 2, 1, 6), (1, 6, 1, 1, 2, 1), (1, 1, 6, 2, 1, 1), (6, 1, 1, 2, 1, 1), (1, 6, 1, 2, 1, 1), (1, 1, 1, 6, 1, 2), (1, 2, 1, 1, 6, 1), (2, 6, 1, 1, 1, 1), (1, 6, 2, 1, 1, 1), (6, 2, 1, 1, 1, 1), (1, 1, 3, 1, 5, 1), (1, 5, 1, 1, 1, 3), (1, 1, 1, 1, 5, 3), (1, 3, 5, 1, 1, 1), (5, 1, 1, 1, 3, 1), (1, 3, 1, 1, 1, 5), (3, 1, 1, 1, 1, 5), (3, 1, 5, 1, 1, 1), (3, 5, 1, 1, 1, 1), (1, 5, 1, 3, 1, 1), (3, 1, 1, 5, 1, 1), (5, 1, 1, 1, 1, 3), (1, 1, 1, 3, 5, 1), (1, 1, 1, 1, 3, 5), (1, 1, 5, 1, 3, 1), (1, 1, 3, 1, 1, 5), (1, 1, 1, 5, 3, 1), (1, 1, 3, 5, 1, 1), (1, 1, 5, 1, 1, 3), (1, 3, 1, 1, 5, 1), (5, 1, 3, 1, 1, 1), (3, 1, 1, 1, 5, 1), (5, 1, 1, 3, 1, 1), (1, 5, 3, 1, 1, 1), (1, 1, 1, 5, 1, 3), (1, 5, 1, 1, 3, 1), (1, 1, 1, 3, 1, 5), (1, 1, 5, 3, 1, 1), (5, 3, 1, 1, 1, 1), (1, 3, 1, 5, 1, 1), (4, 1, 1, 1, 4, 1), (1, 1, 4, 1, 4, 1), (1, 1, 1, 1, 4, 4), (1, 4, 1, 1, 1, 4), (4, 1, 4, 1, 1, 1), (4, 4, 1, 1, 1, 1), (1, 1, 4, 1, 1, 4), (1, 4, 4, 1, 1, 1), (4, 1, 1, 4, 1, 1), (1, 1, 1, 4, 1, 4), (1, 4, 1, 1, 4, 1), (1, 1, 4, 4, 1, 1), (1, 1, 1, 4, 4, 1), (4, 1, 1, 1, 1, 4), (1, 4, 1, 4, 1, 1), (1, 8, 1, 1, 1), (8, 1, 1, 1, 1), (1, 1, 1, 1, 8), (1, 1, 8, 1, 1), (1, 1, 1, 8, 1), (2, 5, 1, 1, 2, 1), (5, 1, 2, 1, 2, 1), (5, 1, 2, 2, 1, 1), (1, 1, 1, 2, 5, 2), (1, 5, 1, 1, 2, 2), (2, 5, 1, 1, 1, 2), (2, 1, 2, 5, 1, 1), (1, 5, 1, 2, 1, 2), (2, 1, 1, 2, 1, 5), (1, 5, 2, 2, 1, 1), (5, 2, 2, 1, 1, 1), (5, 1, 2, 1, 1, 2), (1, 1, 2, 2, 1, 5), (1, 2, 1, 2, 5, 1), (2, 1, 1, 1, 2, 5), (2, 5, 2, 1, 1, 1), (1, 2, 1, 1, 2, 5), (1, 1, 2, 1, 2, 5), (1, 2, 5, 1, 2, 1), (2, 1, 1, 5, 2, 1), (1, 2, 5, 1, 1, 2), (2, 1, 1, 5, 1, 2), (2, 1, 2, 1, 1, 5), (1, 2, 1, 5, 2, 1), (1, 1, 2, 5, 2, 1), (5, 1, 1, 1, 2, 2), (2, 1, 2, 1, 5, 1), (1, 1, 2, 5, 1, 2), (2, 2, 5, 1, 1, 1), (2, 5, 1, 2, 1, 1), (1, 1, 1, 2, 2, 5), (1, 1, 5, 2, 2, 1), (1, 2, 2, 1, 1, 5), (2, 2, 1, 1, 1, 5), (1, 2, 1, 5, 1, 2), (1, 1, 5, 1, 2, 2), (1, 5, 2, 1, 2, 1), (1, 2, 2, 5, 1, 1), (2, 1, 1, 2, 5, 1), (2, 1, 5, 1, 2, 1), (1, 1, 1, 5, 2, 2), (2, 2, 1, 5, 1, 1), (1, 1, 5, 2, 1, 2), (2, 1, 5, 2, 1, 1), (1, 1, 2, 2, 5, 1), (1, 2, 5, 2, 1, 1), (1, 5, 2, 1, 1, 2), (2, 1, 1, 1, 5, 2), (2, 1, 5, 1, 1, 2), (5, 2, 1, 2, 1, 1), (1, 1, 2, 1, 5, 2), (5, 1, 1, 2, 1, 2), (5, 1, 1, 2, 2, 1), (1, 2, 1, 2, 1, 5), (1, 2, 2, 1, 5, 1), (5, 2, 1, 1, 2, 1), (2, 2, 1, 1, 5, 1), (5, 2, 1, 1, 1, 2), (1, 2, 1, 1, 5, 2), (1, 5, 1, 2, 2, 1), (3, 2, 1, 1, 1, 4), (2, 1, 1, 3, 1, 4), (1, 1, 3, 1, 4, 2), (1, 2, 4, 1, 3, 1), (2, 1, 1, 4, 3, 1), (1, 2, 1, 4, 1, 3), (4, 3, 1, 1, 1, 2), (1, 1, 4, 1, 3, 2), (2, 3, 1, 1, 4, 1), (1, 4, 1, 3, 1, 2), (1, 2, 4, 1, 1, 3), (1, 4, 1, 3, 2, 1), (3, 4, 2, 1, 1, 1), (4, 3, 1, 2, 1, 1), (3, 1, 1, 2, 1, 4), (2, 1, 4, 3, 1, 1), (1, 1, 4, 1, 2, 3), (1, 4, 2, 1, 3, 1), (3, 4, 1, 2, 1, 1), (2, 1, 3, 1, 1, 4), (2, 3, 1, 1, 1, 4), (1, 4, 3, 2, 1, 1), (4, 1, 2, 1, 1, 3), (1, 3, 1, 1, 4, 2), (1, 3, 1, 4, 2, 1), (3, 1, 1, 1, 4, 2), (4, 2, 3, 1, 1, 1), (4, 1, 3, 1, 1, 2), (1, 4, 1, 1, 2, 3), (1, 3, 1, 4, 1, 2), (1, 3, 4, 2, 1, 1), (1, 2, 3, 1, 4, 1), (1, 4, 1, 2, 3, 1), (1, 2, 4, 3, 1, 1), (4, 3, 1, 1, 2, 1), (3, 1, 1, 4, 1, 2), (3, 1, 2, 4, 1, 1), (3, 4, 1, 1, 1, 2), (1, 1, 3, 1, 2, 4), (3, 2, 4, 1, 1, 1), (4, 2, 1, 1, 3, 1), (2, 1, 1, 4, 1, 3), (4, 1, 1, 2, 3, 1), (3, 1, 2, 1, 4, 1), (1, 4, 2, 3, 1, 1), (2, 4, 1, 3, 1, 1), (2, 3, 4, 1, 1, 1), (4, 1, 1, 2, 1, 3), (1, 1, 1, 4, 3, 2), (2, 1, 1, 3, 4, 1), (1, 3, 1, 2, 4, 1), (1, 1, 3, 4, 1, 2), (1, 1, 1, 4, 2, 3), (1, 4, 1, 1, 3, 2), (1, 3, 2, 1, 4, 1), (3, 1, 2, 1, 1, 4), (1, 3, 4, 1, 1, 2), (2, 4, 1, 1, 1, 3), (1, 1, 3, 2, 4, 1), (1, 3, 4, 1, 2, 1), (3, 1, 1, 4, 2, 1), (3, 1, 4, 1, 2, 1), (1, 3, 2, 4, 1, 1), (2, 4, 3, 1, 1, 1), (1, 1, 2, 3, 1, 4), (1, 2, 1, 1, 3, 4), (1, 3, 1, 1, 2, 4), (1, 1, 4, 2, 3, 1), (2, 1, 3, 1, 4, 1), (3, 1, 1, 1, 2, 4), (4, 1, 2, 3, 1, 1), (1, 2, 3, 4, 1, 1), (4, 3, 2, 1, 1, 1), (1, 1, 1, 2, 4, 3), (1, 2, 1, 3, 4, 1), (1, 4, 1, 2, 1, 3), (4, 1, 2, 1, 3, 1), (1, 4, 3, 1, 2, 1), (1, 1, 1, 2, 3, 4), (1, 2, 3, 1, 1, 4), (3, 2, 1, 1, 4, 1), (1, 1, 1, 3, 4, 2), (1, 1, 3, 4, 2, 1), (4, 2, 1, 1, 1, 3), (1, 2, 1, 3, 1, 4), (4, 1, 1, 3, 1, 2), (3, 1, 1, 2, 4, 1), (4, 1, 1, 3, 2, 1), (4, 1, 3, 2, 1, 1), (2, 1, 1, 1, 4, 3), (1, 1, 2, 1, 3, 4), (1, 2, 1, 1, 4, 3), (1, 1, 2, 1, 4, 3), (2, 3, 1, 4, 1, 1), (3, 1, 4, 1, 1, 2), (2, 1, 1, 1, 3, 4), (1, 1, 2, 4, 1, 3), (1, 3, 1, 2, 1, 4), (4, 1, 1, 1, 3, 2), (1, 3, 2, 1, 1, 4), (2, 1, 3, 4, 1, 1), (2, 1, 4, 1, 3, 1), (1, 1, 3, 2, 1, 4), (3, 1, 4, 2, 1, 1), (4, 1, 1, 1, 2, 3), (2, 1, 4, 1, 1, 3), (2, 4, 1, 1, 3, 1), (4, 1, 3, 1, 2, 1), (4, 2, 1, 3, 1, 1), (1, 1, 4, 2, 1, 3), (1, 4, 2, 1, 1, 3), (1, 2, 1, 4, 3, 1), (1, 1, 4, 3, 1, 2), (1, 1, 2, 3, 4, 1), (1, 1, 4, 3, 2, 1), (1, 4, 3, 1, 1, 2), (3, 2, 1, 4, 1, 1), (1, 1, 2, 4, 3, 1), (1, 1, 1, 3, 2, 4), (3, 4, 1, 1, 2, 1), (1, 2, 1, 1, 7), (1, 7, 1, 1, 2), (1, 7, 1, 2, 1), (1, 1, 1, 7, 2), (2, 1, 7, 1, 1), (1, 2, 1, 7, 1), (7, 2, 1, 1, 1), (7, 1, 2, 1, 1), (2, 1, 1, 1, 7), (7, 1, 1, 2, 1), (1, 1, 7, 2, 1), (1, 1, 2, 1, 7), (1, 1, 1, 2, 7), (7, 1, 1, 1, 2), (1, 1, 7, 1, 2), (1, 1, 2, 7, 1), (1, 2, 7, 1, 1), (2, 7, 1, 1, 1), (2, 1, 1, 7, 1), (1, 7, 2, 1, 1), (1, 3, 1, 3, 1, 3), (1, 1, 3, 1, 3, 3), (3, 1, 1, 3, 1, 3), (3, 1, 3, 1, 1, 3), (1, 3, 3, 3, 1, 1), (1, 3, 3, 1, 3, 1), (1, 3, 3, 1, 1, 3), (1, 1, 3, 3, 3, 1), (3, 3, 1, 1, 3, 1), (3, 3, 3, 1, 1, 1), (1, 1, 1, 3, 3, 3), (3, 1, 1, 3, 3, 1), (1, 3, 1, 3, 3, 1), (1, 1, 3, 3, 1, 3), (3, 1, 3, 3, 1, 1), (3, 1, 3, 1, 3, 1), (1, 3, 1, 1, 3, 3), (3, 3, 1, 1, 1, 3), (3, 3, 1, 3, 1, 1), (3, 1, 1, 1, 3, 3), (1, 6, 1, 1, 3), (1, 1, 3, 6, 1), (1, 3, 1, 1, 6), (6, 1, 1, 1, 3), (1, 3, 6, 1, 1), (3, 1, 1, 6, 1), (1, 1, 6, 3, 1), (3, 1, 6, 1, 1), (6, 3, 1, 1, 1), (1, 1, 1, 6, 3), (1, 1, 6, 1, 3), (1, 3, 1, 6, 1), (1, 1, 3, 1, 6), (1, 1, 1, 3, 6), (3, 1, 1, 1, 6), (1, 6, 3, 1, 1), (6, 1, 1, 3, 1), (1, 6, 1, 3, 1), (3, 6, 1, 1, 1), (6, 1, 3, 1, 1), (1, 5, 4, 1, 1), (1, 4, 5, 1, 1), (1, 4, 1, 1, 5), (1, 1, 5, 1, 4), (1, 1, 4, 1, 5), (5, 1, 1, 4, 1), (1, 5, 1, 1, 4), (5, 4, 1, 1, 1), (5, 1, 1, 1, 4), (1, 1, 1, 5, 4), (1, 1, 4, 5, 1), (4, 5, 1, 1, 1), (1, 4, 1, 5, 1), (1, 1, 1, 4, 5), (4, 1, 1, 1, 5), (5, 1, 4, 1, 1), (1, 1, 5, 4, 1), (4, 1, 5, 1, 1), (1, 5, 1, 4, 1), (4, 1, 1, 5, 1), (1, 1, 1, 9), (1, 9, 1, 1), (1, 1, 9, 1), (9, 1, 1, 1), (1, 1, 2, 4, 2, 2), (2, 1, 4, 2, 1, 2), (4, 2, 2, 1, 2, 1), (2, 1, 2, 4, 2, 1), (1, 1, 2, 2, 4, 2), (2, 2, 1, 1, 4, 2), (1, 2, 2, 4, 2, 1), (2, 1, 1, 2, 2, 4), (4, 2, 2, 2, 1, 1), (1, 2, 4, 1, 2, 2), (2, 1, 2, 2, 1, 4), (2, 2, 1, 2, 4, 1), (2, 1, 2, 4, 1, 2), (4, 2, 2, 1, 1, 2), (1, 2, 2, 1, 4, 2), (1, 1, 2, 2, 2, 4), (2, 2, 4, 1, 2, 1), (1, 4, 1, 2, 2, 2), (1, 4, 2, 2, 2, 1), (2, 2, 2, 1, 4, 1), (2, 2, 2, 4, 1, 1), (1, 1, 4, 2, 2, 2), (1, 2, 2, 1, 2, 4), (2, 4, 2, 1, 2, 1), (1, 2, 2, 4, 1, 2), (4, 2, 1, 2, 1, 2), (2, 2, 1, 1, 2, 4), (2, 4, 2, 2, 1, 1), (1, 2, 1, 2, 4, 2), (2, 2, 4, 1, 1, 2), (2, 1, 4, 1, 2, 2), (2, 2, 2, 1, 1, 4), (2, 1, 1, 4, 2, 2), (1, 2, 2, 2, 4, 1), (2, 1, 2, 1, 4, 2), (2, 2, 4, 2, 1, 1), (2, 2, 1, 2, 1, 4), (4, 1, 1, 2, 2, 2), (2, 4, 2, 1, 1, 2), (1, 4, 2, 1, 2, 2), (1, 2, 4, 2, 2, 1), (1, 2, 1, 2, 2, 4), (1, 4, 2, 2, 1, 2), (4, 1, 2, 1, 2, 2), (2, 4, 1, 2, 1, 2), (1, 2, 4, 2, 1, 2), (2, 2, 1, 4, 2, 1), (2, 4, 1, 2, 2, 1), (4, 1, 2, 2, 2, 1), (4, 2, 1, 1, 2, 2), (4, 1, 2, 2, 1, 2), (1, 2, 2, 2, 1, 4), (2, 1, 2, 1, 2, 4), (2, 2, 1, 4, 1, 2), (2, 4, 1, 1, 2, 2), (2, 1, 1, 2, 4, 2), (1, 2, 1, 4, 2, 2), (2, 1, 2, 2, 4, 1), (4, 2, 1, 2, 2, 1), (2, 1, 4, 2, 2, 1), (3, 1, 1, 2, 3, 2), (2, 3, 2, 1, 3, 1), (2, 1, 1, 3, 2, 3), (2, 2, 1, 1, 3, 3), (1, 3, 1, 2, 2, 3), (1, 3, 2, 2, 3, 1), (2, 1, 3, 3, 2, 1), (3, 1, 1, 2, 2, 3), (1, 3, 3, 2, 2, 1), (2, 1, 2, 3, 1, 3), (1, 3, 2, 2, 1, 3), (1, 2, 3, 2, 3, 1), (1, 3, 2, 3, 2, 1), (2, 3, 2, 1, 1, 3), (2, 3, 3, 1, 2, 1), (3, 2, 2, 3, 1, 1), (3, 3, 2, 1, 1, 2), (2, 3, 1, 1, 2, 3), (1, 2, 3, 2, 1, 3), (2, 3, 1, 1, 3, 2), (2, 2, 1, 3, 3, 1), (1, 1, 3, 3, 2, 2), (2, 2, 1, 3, 1, 3), (1, 1, 2, 3, 3, 2), (2, 1, 1, 2, 3, 3), (3, 3, 2, 2, 1, 1), (3, 1, 3, 2, 1, 2), (3, 2, 1, 1, 2, 3), (1, 3, 2, 1, 3, 2), (2, 3, 2, 3, 1, 1), (1, 3, 2, 1, 2, 3), (1, 2, 3, 1, 3, 2), (3, 2, 2, 1, 1, 3), (2, 1, 3, 3, 1, 2), (2, 2, 3, 3, 1, 1), (3, 3, 2, 1, 2, 1), (2, 3, 3, 1, 1, 2), (1, 2, 1, 3, 3, 2), (1, 3, 3, 2, 1, 2), (2, 2, 3, 1, 3, 1), (1, 3, 2, 3, 1, 2), (2, 2, 3, 1, 1, 3), (3, 1, 3, 2, 2, 1), (3, 1, 2, 1, 3, 2), (1, 3, 1, 3, 2, 2), (3, 2, 3, 2, 1, 1), (3, 2, 1, 2, 3, 1), (3, 1, 1, 3, 2, 2), (3, 1, 3, 1, 2, 2), (2, 3, 1, 2, 3, 1), (3, 1, 2, 1, 2, 3), (3, 2, 1, 2, 1, 3), (2, 3, 1, 2, 1, 3), (3, 1, 2, 2, 3, 1), (1, 1, 2, 2, 3, 3), (1, 1, 2, 3, 2, 3), (1, 3, 3, 1, 2, 2), (2, 1, 3, 1, 2, 3), (1, 2, 3, 3, 2, 1), (1, 2, 2, 3, 3, 1), (1, 2, 2, 3, 1, 3), (3, 2, 1, 1, 3, 2), (3, 3, 1, 1, 2, 2), (2, 3, 3, 2, 1, 1), (2, 1, 2, 3, 3, 1), (1, 2, 2, 1, 3, 3), (3, 2, 1, 3, 2, 1), (2, 1, 3, 1, 3, 2), (1, 1, 3, 2, 2, 3), (1, 1, 3, 2, 3, 2), (3, 1, 2, 2, 1, 3), (3, 2, 1, 3, 1, 2), (1, 2, 3, 1, 2, 3), (1, 2, 1, 2, 3, 3), (1, 2, 3, 3, 1, 2), (2, 1, 3, 2, 3, 1), (2, 1, 2, 1, 3, 3), (3, 3, 1, 2, 2, 1), (1, 2, 1, 3, 2, 3), (3, 2, 3, 1, 2, 1), (3, 1, 2, 3, 1, 2), (2, 1, 3, 2, 1, 3), (3, 1, 2, 3, 2, 1), (3, 2, 2, 1, 3, 1), (2, 3, 1, 3, 2, 1), (3, 3, 1, 2, 1, 2), (3, 2, 3, 1, 1, 2), (2, 1, 1, 3, 3, 2), (1, 3, 1, 2, 3, 2), (2, 3, 1, 3, 1, 2), (2, 2, 6, 1, 1), (2, 1, 1, 6, 2), (2, 1, 6, 1, 2), (6, 2, 1, 2, 1), (2, 2, 1, 6, 1), (1, 1, 2, 6, 2), (2, 6, 1, 2, 1), (6, 2, 1, 1, 2), (1, 2, 1, 2, 6), (1, 6, 2, 2, 1), (2, 1, 2, 6, 1), (2, 6, 1, 1, 2), (1, 2, 2, 1, 6), (1, 1, 6, 2, 2), (1, 6, 2, 1, 2), (6, 2, 2, 1, 1), (1, 2, 6, 2, 1), (1, 2, 1, 6, 2), (1, 2, 6, 1, 2), (2, 1, 1, 2, 6), (1, 1, 2, 2, 6), (2, 6, 2, 1, 1), (1, 2, 2, 6, 1), (6, 1, 2, 2, 1), (2, 2, 1, 1, 6), (6, 1, 1, 2, 2), (1, 6, 1, 2, 2), (2, 1, 6, 2, 1), (6, 1, 2, 1, 2), (2, 1, 2, 1, 6), (1, 3, 1, 2, 5), (5, 2, 1, 1, 3), (1, 5, 2, 3, 1), (2, 1, 3, 1, 5), (2, 1, 5, 3, 1), (5, 1, 2, 3, 1), (1, 3, 2, 1, 5), (5, 3, 1, 2, 1), (1, 5, 1, 3, 2), (1, 2, 5, 1, 3), (1, 5, 1, 2, 3), (3, 2, 5, 1, 1), (1, 5, 3, 2, 1), (5, 1, 1, 3, 2), (3, 1, 2, 1, 5), (5, 3, 1, 1, 2), (3, 5, 2, 1, 1), (2, 1, 1, 5, 3), (1, 5, 3, 1, 2), (1, 1, 3, 5, 2), (5, 1, 1, 2, 3), (3, 2, 1, 1, 5), (3, 1, 1, 5, 2), (1, 2, 3, 5, 1), (1, 1, 2, 5, 3), (2, 3, 1, 1, 5), (2, 5, 1, 3, 1), (5, 1, 2, 1, 3), (1, 5, 2, 1, 3), (2, 1, 1, 3, 5), (2, 1, 5, 1, 3), (3, 1, 5, 2, 1), (3, 1, 5, 1, 2), (5, 3, 2, 1, 1), (1, 1, 2, 3, 5), (1, 2, 1, 5, 3), (2, 3, 5, 1, 1), (1, 3, 1, 5, 2), (1, 1, 3, 2, 5), (2, 1, 3, 5, 1), (2, 5, 3, 1, 1), (1, 3, 2, 5, 1), (5, 1, 3, 1, 2), (3, 1, 1, 2, 5), (1, 3, 5, 2, 1), (2, 5, 1, 1, 3), (3, 5, 1, 1, 2), (3, 5, 1, 2, 1), (5, 1, 3, 2, 1), (3, 1, 2, 5, 1), (1, 2, 1, 3, 5), (1, 3, 5, 1, 2), (5, 2, 3, 1, 1), (3, 2, 1, 5, 1), (5, 2, 1, 3, 1), (2, 3, 1, 5, 1), (1, 1, 5, 2, 3), (1, 2, 3, 1, 5), (1, 1, 5, 3, 2), (1, 2, 5, 3, 1), (2, 4, 1, 1, 4), (1, 4, 1, 2, 4), (1, 4, 4, 1, 2), (1, 4, 2, 1, 4), (4, 1, 1, 4, 2), (4, 2, 1, 1, 4), (1, 2, 4, 1, 4), (4, 2, 4, 1, 1), (2, 4, 4, 1, 1), (1, 1, 2, 4, 4), (4, 1, 2, 1, 4), (2, 1, 1, 4, 4), (4, 1, 1, 2, 4), (2, 1, 4, 1, 4), (4, 1, 4, 2, 1), (4, 1, 2, 4, 1), (2, 4, 1, 4, 1), (1, 1, 4, 4, 2), (4, 4, 2, 1, 1), (4, 4, 1, 1, 2), (4, 4, 1, 2, 1), (1, 4, 4, 2, 1), (1, 2, 1, 4, 4), (4, 1, 4, 1, 2), (1, 2, 4, 4, 1), (1, 4, 2, 4, 1), (4, 2, 1, 4, 1), (1, 4, 1, 4, 2), (1, 1, 4, 2, 4), (2, 1, 4, 4, 1), (2, 8, 1, 1), (1, 2, 1, 8), (1, 2, 8, 1), (8, 1, 2, 1), (8, 2, 1, 1), (1, 8, 1, 2), (2, 1, 8, 1), (8, 1, 1, 2), (2, 1, 1, 8), (1, 1, 2, 8), (1, 1, 8, 2), (1, 8, 2, 1), (3, 3, 1, 1, 4), (1, 3, 3, 4, 1), (3, 4, 1, 1, 3), (3, 1, 3, 4, 1), (4, 3, 3, 1, 1), (3, 1, 4, 3, 1), (3, 3, 4, 1, 1), (3, 1, 1, 4, 3), (1, 4, 3, 3, 1), (1, 1, 3, 4, 3), (3, 4, 3, 1, 1), (3, 1, 1, 3, 4), (4, 1, 1, 3, 3), (1, 3, 3, 1, 4), (3, 1, 4, 1, 3), (4, 3, 1, 3, 1), (1, 1, 3, 3, 4), (3, 1, 3, 1, 4), (4, 1, 3, 3, 1), (1, 3, 1, 4, 3), (1, 4, 3, 1, 3), (4, 3, 1, 1, 3), (1, 3, 4, 3, 1), (3, 3, 1, 4, 1), (3, 4, 1, 3, 1), (1, 3, 1, 3, 4), (1, 3, 4, 1, 3), (1, 4, 1, 3, 3), (4, 1, 3, 1, 3), (1, 1, 4, 3, 3), (7, 3, 1, 1), (1, 1, 3, 7), (3, 1, 1, 7), (1, 3, 7, 1), (1, 1, 7, 3), (3, 7, 1, 1), (1, 3, 1, 7), (7, 1, 3, 1), (3, 1, 7, 1), (7, 1, 1, 3), (1, 7, 1, 3), (1, 7, 3, 1), (6, 4, 1, 1), (1, 1, 4, 6), (4, 1, 6, 1), (1, 6, 4, 1), (1, 1, 6, 4), (6, 1, 4, 1), (4, 6, 1, 1), (1, 4, 6, 1), (1, 6, 1, 4), (6, 1, 1, 4), (1, 4, 1, 6), (4, 1, 1, 6), (5, 5, 1, 1), (1, 5, 5, 1), (1, 1, 5, 5), (1, 5, 1, 5), (5, 1, 1, 5), (5, 1, 5, 1), (1, 10, 1), (1, 1, 10), (10, 1, 1), (2, 1, 2, 2, 3, 2), (3, 2, 2, 2, 2, 1), (2, 1, 2, 2, 2, 3), (2, 3, 2, 1, 2, 2), (3, 2, 2, 2, 1, 2), (3, 1, 2, 2, 2, 2), (2, 2, 2, 2, 3, 1), (2, 2, 2, 3, 1, 2), (1, 3, 2, 2, 2, 2), (2, 2, 2, 3, 2, 1), (2, 2, 2, 1, 3, 2), (2, 2, 1, 2, 2, 3), (1, 2, 3, 2, 2, 2), (2, 2, 1, 2, 3, 2), (2, 2, 3, 2, 2, 1), (2, 2, 2, 1, 2, 3), (2, 2, 3, 1, 2, 2), (2, 2, 2, 2, 1, 3), (2, 3, 2, 2, 1, 2), (1, 2, 2, 2, 3, 2), (2, 3, 2, 2, 2, 1), (1, 2, 2, 3, 2, 2), (2, 2, 1, 3, 2, 2), (2, 2, 3, 2, 1, 2), (2, 1, 3, 2, 2, 2), (1, 2, 2, 2, 2, 3), (3, 2, 1, 2, 2, 2), (2, 3, 1, 2, 2, 2), (2, 1, 2, 3, 2, 2), (3, 2, 2, 1, 2, 2), (1, 5, 2, 2, 2), (1, 2, 5, 2, 2), (2, 2, 2, 1, 5), (2, 1, 5, 2, 2), (5, 1, 2, 2, 2), (5, 2, 2, 2, 1), (2, 2, 1, 5, 2), (2, 5, 2, 1, 2), (2, 5, 2, 2, 1), (1, 2, 2, 2, 5), (5, 2, 2, 1, 2), (2, 1, 2, 5, 2), (2, 2, 2, 5, 1), (2, 5, 1, 2, 2), (2, 2, 1, 2, 5), (2, 2, 5, 2, 1), (5, 2, 1, 2, 2), (2, 2, 5, 1, 2), (1, 2, 2, 5, 2), (2, 1, 2, 2, 5), (2, 2, 4, 1, 3), (1, 4, 2, 2, 3), (3, 4, 2, 1, 2), (3, 4, 2, 2, 1), (4, 2, 2, 1, 3), (2, 1, 3, 2, 4), (2, 3, 1, 4, 2), (2, 4, 3, 2, 1), (3, 4, 1, 2, 2), (2, 1, 4, 3, 2), (2, 2, 3, 1, 4), (4, 2, 3, 1, 2), (2, 4, 2, 3, 1), (1, 2, 4, 2, 3), (2, 1, 4, 2, 3), (3, 1, 2, 2, 4), (3, 2, 1, 2, 4), (4, 2, 1, 2, 3), (1, 2, 2, 3, 4), (2, 3, 2, 1, 4), (3, 2, 2, 1, 4), (2, 4, 2, 1, 3), (2, 3, 1, 2, 4), (2, 4, 3, 1, 2), (3, 2, 4, 2, 1), (1, 2, 3, 4, 2), (4, 3, 2, 2, 1), (3, 1, 4, 2, 2), (2, 2, 1, 4, 3), (2, 3, 4, 2, 1), (4, 1, 2, 3, 2), (1, 4, 3, 2, 2), (2, 1, 3, 4, 2), (2, 3, 4, 1, 2), (3, 2, 4, 1, 2), (1, 3, 2, 4, 2), (2, 2, 1, 3, 4), (4, 3, 1, 2, 2), (4, 3, 2, 1, 2), (2, 1, 2, 4, 3), (2, 2, 4, 3, 1), (1, 3, 4, 2, 2), (2, 4, 1, 3, 2), (4, 2, 2, 3, 1), (1, 2, 3, 2, 4), (2, 2, 3, 4, 1), (2, 1, 2, 3, 4), (4, 1, 3, 2, 2), (4, 2, 3, 2, 1), (3, 2, 1, 4, 2), (1, 4, 2, 3, 2), (4, 1, 2, 2, 3), (4, 2, 1, 3, 2), (1, 2, 4, 3, 2), (1, 2, 2, 4, 3), (2, 3, 2, 4, 1), (2, 4, 1, 2, 3), (3, 1, 2, 4, 2), (1, 3, 2, 2, 4), (3, 2, 2, 4, 1), (1, 2, 7, 2), (2, 1, 7, 2), (1, 2, 2, 7), (7, 2, 2, 1), (1, 7, 2, 2), (7, 1, 2, 2), (2, 2, 1, 7), (2, 7, 2, 1), (2, 1, 2, 7), (2, 7, 1, 2), (2, 2, 7, 1), (7, 2, 1, 2), (2, 3, 3, 3, 1), (3, 2, 3, 3, 1), (3, 3, 2, 1, 3), (3, 2, 1, 3, 3), (2, 3, 3, 1, 3), (2, 3, 1, 3, 3), (1, 3, 3, 3, 2), (3, 3, 3, 2, 1), (3, 3, 3, 1, 2), (3, 1, 3, 3, 2), (1, 3, 3, 2, 3), (3, 2, 3, 1, 3), (3, 1, 3, 2, 3), (1, 2, 3, 3, 3), (3, 3, 2, 3, 1), (3, 3, 1, 3, 2), (2, 1, 3, 3, 3), (3, 1, 2, 3, 3), (3, 3, 1, 2, 3), (1, 3, 2, 3, 3), (3, 1, 6, 2), (3, 2, 1, 6), (2, 6, 1, 3), (1, 3, 2, 6), (1, 2, 6, 3), (2, 3, 1, 6), (3, 2, 6, 1), (2, 1, 6, 3), (1, 2, 3, 6), (3, 1, 2, 6), (6, 2, 3, 1), (1, 6, 3, 2), (6, 1, 3, 2), (2, 3, 6, 1), (3, 6, 2, 1), (1, 3, 6, 2), (6, 1, 2, 3), (2, 1, 3, 6), (6, 3, 2, 1), (6, 3, 1, 2), (2, 6, 3, 1), (1, 6, 2, 3), (3, 6, 1, 2), (6, 2, 1, 3), (5, 1, 4, 2), (1, 4, 5, 2), (4, 2, 5, 1), (1, 5, 4, 2), (2, 4, 5, 1), (2, 5, 4, 1), (5, 1, 2, 4), (4, 1, 5, 2), (1, 2, 5, 4), (5, 2, 1, 4), (1, 2, 4, 5), (5, 4, 2, 1), (1, 5, 2, 4), (1, 4, 2, 5), (4, 2, 1, 5), (5, 4, 1, 2), (2, 1, 5, 4), (2, 4, 1, 5), (2, 5, 1, 4), (4, 1, 2, 5), (2, 1, 4, 5), (4, 5, 1, 2), (5, 2, 4, 1), (4, 5, 2, 1), (2, 9, 1), (1, 2, 9), (2, 1, 9), (9, 1, 2), (9, 2, 1), (1, 9, 2), (5, 3, 1, 3), (5, 1, 3, 3), (5, 3, 3, 1), (1, 5, 3, 3), (3, 5, 3, 1), (3, 5, 1, 3), (1, 3, 3, 5), (3, 1, 5, 3), (1, 3, 5, 3), (3, 3, 1, 5), (3, 3, 5, 1), (3, 1, 3, 5), (1, 4, 3, 4), (1, 4, 4, 3), (4, 1, 3, 4), (4, 4, 3, 1), (4, 4, 1, 3), (3, 1, 4, 4), (1, 3, 4, 4), (3, 4, 1, 4), (3, 4, 4, 1), (4, 3, 1, 4), (4, 1, 4, 3), (4, 3, 4, 1), (3, 8, 1), (1, 3, 8), (8, 3, 1), (1, 8, 3), (3, 1, 8), (8, 1, 3), (7, 4, 1), (1, 4, 7), (1, 7, 4), (4, 7, 1), (4, 1, 7), (7, 1, 4), (5, 1, 6), (6, 1, 5), (5, 6, 1), (1, 5, 6), (1, 6, 5), (6, 5, 1), (1, 11), (11, 1), (2, 2, 2, 2, 2, 2), (2, 2, 2, 2, 4), (2, 2, 4, 2, 2), (2, 4, 2, 2, 2), (4, 2, 2, 2, 2), (2, 2, 2, 4, 2), (3, 3, 2, 2, 2), (3, 2, 2, 3, 2), (2, 3, 3, 2, 2), (2, 2, 2, 3, 3), (3, 2, 2, 2, 3), (2, 3, 2, 3, 2), (2, 2, 3, 2, 3), (3, 2, 3, 2, 2), (2, 2, 3, 3, 2), (2, 3, 2, 2, 3), (2, 2, 2, 6), (2, 6, 2, 2), (6, 2, 2, 2), (2, 2, 6, 2), (2, 3, 2, 5), (5, 2, 3, 2), (5, 2, 2, 3), (2, 2, 5, 3), (2, 5, 2, 3), (3, 2, 2, 5), (3, 5, 2, 2), (2, 3, 5, 2), (2, 5, 3, 2), (3, 2, 5, 2), (2, 2, 3, 5), (5, 3, 2, 2), (2, 2, 4, 4), (4, 2, 4, 2), (2, 4, 4, 2), (2, 4, 2, 4), (4, 2, 2, 4), (4, 4, 2, 2), (8, 2, 2), (2, 8, 2), (2, 2, 8), (4, 3, 2, 3), (3, 2, 3, 4), (3, 3, 2, 4), (4, 2, 3, 3), (2, 3, 3, 4), (2, 3, 4, 3), (3, 3, 4, 2), (4, 3, 3, 2), (3, 4, 2, 3), (3, 4, 3, 2), (3, 2, 4, 3), (2, 4, 3, 3), (7, 3, 2), (3, 2, 7), (7, 2, 3), (3, 7, 2), (2, 3, 7), (2, 7, 3), (4, 6, 2), (6, 4, 2), (6, 2, 4), (4, 2, 6), (2, 4, 6), (2, 6, 4), (5, 2, 5), (2, 5, 5), (5, 5, 2), (2, 10), (10, 2), (3, 3, 3, 3), (3, 3, 6), (6, 3, 3), (3, 6, 3), (4, 3, 5), (4, 5, 3), (3, 4, 5), (5, 4, 3), (5, 3, 4), (3, 5, 4), (3, 9), (9, 3), (4, 4, 4), (8, 4), (4, 8), (7, 5), (5, 7), (6, 6), (12,)]
+"""
+Module with the compositions of an integer used by the twelve-tone tools.
+The compositions are generated on first use and cached as compact arrays,
+instead of being stored as literals.
+"""
 
-six_to_nine = [(1, 1, 4, 1, 1, 1, 1, 1, 1), (1, 1, 1, 1, 1, 1, 4, 1, 1), (1, 1, 1, 4, 1, 1, 1, 1, 1), (4, 1, 1, 1, 1, 1, 1, 1, 1), (1, 1, 1, 1, 4, 1, 1, 1, 1), (1, 1, 1, 1, 1, 1, 1, 1, 4), (1, 1, 1, 1, 1, 1, 1, 4, 1), (1, 4, 1, 1, 1, 1, 1, 1, 1), (1, 1, 1, 1, 1, 4, 1, 1, 1), (1, 1, 1, 1, 3, 2, 1, 1, 1), (3, 1, 1, 1, 1, 2, 1, 1, 1), (1, 1, 1, 1, 2, 3, 1, 1, 1), (1, 1, 1, 3, 1, 1, 1, 1, 2), (1, 1, 1, 3, 1, 1, 1, 2, 1), (1, 1, 2, 1, 1, 3, 1, 1, 1), (1, 2, 1, 3, 1, 1, 1, 1, 1), (1, 1, 1, 1, 2, 1, 3, 1, 1), (3, 1, 2, 1, 1, 1, 1, 1, 1), (2, 1, 1, 1, 1, 3, 1, 1, 1), (1, 1, 1, 1, 1, 2, 3, 1, 1), (1, 1, 1, 3, 1, 1, 2, 1, 1), (1, 2, 1, 1, 1, 1, 1, 1, 3), (1, 3, 2, 1, 1, 1, 1, 1, 1), (3, 1, 1, 1, 2, 1, 1, 1, 1), (3, 2, 1, 1, 1, 1, 1, 1, 1), (1, 2, 1, 1, 3, 1, 1, 1, 1), (1, 1, 1, 1, 3, 1, 2, 1, 1), (1, 2, 1, 1, 1, 3, 1, 1, 1), (1, 1, 1, 3, 1, 2, 1, 1, 1), (1, 1, 1, 1, 1, 3, 2, 1, 1), (1, 1, 1, 1, 2, 1, 1, 1, 3), (1, 3, 1, 1, 1, 1, 1, 2, 1), (1, 2, 1, 1, 1, 1, 3, 1, 1), (1, 1, 2, 1, 1, 1, 1, 1, 3), (1, 1, 1, 1, 1, 1, 2, 3, 1), (1, 2, 3, 1, 1, 1, 1, 1, 1), (1, 3, 1, 1, 1, 1, 1, 1, 2), (1, 1, 1, 1, 1, 1, 3, 2, 1), (3, 1, 1, 1, 1, 1, 2, 1, 1), (1, 3, 1, 1, 1, 2, 1, 1, 1), (1, 1, 3, 2, 1, 1, 1, 1, 1), (2, 1, 1, 3, 1, 1, 1, 1, 1), (2, 1, 3, 1, 1, 1, 1, 1, 1), (1, 1, 3, 1, 1, 1, 1, 2, 1), (3, 1, 1, 1, 1, 1, 1, 1, 2), (1, 1, 1, 1, 1, 2, 1, 3, 1), (1, 1, 1, 1, 1, 1, 2, 1, 3), (2, 3, 1, 1, 1, 1, 1, 1, 1), (1, 3, 1, 2, 1, 1, 1, 1, 1), (1, 1, 1, 3, 2, 1, 1, 1, 1), (1, 1, 2, 3, 1, 1, 1, 1, 1), (1, 1, 1, 1, 1, 1, 3, 1, 2), (2, 1, 1, 1, 1, 1, 3, 1, 1), (2, 1, 1, 1, 1, 1, 1, 3, 1), (1, 1, 3, 1, 1, 1, 1, 1, 2), (1, 1, 1, 2, 1, 1, 3, 1, 1), (1, 2, 1, 1, 1, 1, 1, 3, 1), (1, 1, 3, 1, 1, 2, 1, 1, 1), (1, 1, 1, 2, 3, 1, 1, 1, 1), (1, 1, 3, 1, 1, 1, 2, 1, 1), (1, 1, 1, 2, 1, 1, 1, 3, 1), (2, 1, 1, 1, 3, 1, 1, 1, 1), (3, 1, 1, 2, 1, 1, 1, 1, 1), (1, 1, 2, 1, 3, 1, 1, 1, 1), (1, 3, 1, 1, 1, 1, 2, 1, 1), (1, 1, 1, 1, 3, 1, 1, 2, 1), (3, 1, 1, 1, 1, 1, 1, 2, 1), (1, 1, 3, 1, 2, 1, 1, 1, 1), (1, 1, 1, 1, 1, 3, 1, 1, 2), (1, 1, 1, 1, 1, 3, 1, 2, 1), (1, 1, 1, 2, 1, 1, 1, 1, 3), (2, 1, 1, 1, 1, 1, 1, 1, 3), (1, 1, 1, 1, 1, 1, 1, 3, 2), (1, 1, 1, 1, 1, 2, 1, 1, 3), (1, 3, 1, 1, 2, 1, 1, 1, 1), (1, 1, 2, 1, 1, 1, 3, 1, 1), (1, 1, 1, 1, 1, 1, 1, 2, 3), (1, 1, 2, 1, 1, 1, 1, 3, 1), (1, 1, 1, 1, 2, 1, 1, 3, 1), (1, 1, 1, 2, 1, 3, 1, 1, 1), (1, 1, 1, 1, 3, 1, 1, 1, 2), (1, 1, 1, 1, 1, 1, 1, 5), (1, 1, 5, 1, 1, 1, 1, 1), (1, 1, 1, 1, 1, 1, 5, 1), (1, 1, 1, 1, 5, 1, 1, 1), (1, 1, 1, 5, 1, 1, 1, 1), (1, 1, 1, 1, 1, 5, 1, 1), (1, 5, 1, 1, 1, 1, 1, 1), (5, 1, 1, 1, 1, 1, 1, 1), (1, 1, 1, 1, 2, 1, 2, 2, 1), (1, 2, 1, 1, 2, 1, 2, 1, 1), (2, 2, 1, 2, 1, 1, 1, 1, 1), (2, 2, 2, 1, 1, 1, 1, 1, 1), (2, 1, 1, 2, 1, 1, 1, 1, 2), (2, 1, 1, 2, 1, 1, 1, 2, 1), (1, 1, 2, 1, 1, 2, 1, 2, 1), (2, 2, 1, 1, 2, 1, 1, 1, 1), (1, 1, 1, 1, 2, 1, 2, 1, 2), (1, 1, 1, 2, 1, 1, 2, 2, 1), (1, 1, 2, 2, 1, 1, 1, 2, 1), (1, 1, 1, 1, 1, 1, 2, 2, 2), (1, 1, 2, 1, 1, 2, 1, 1, 2), (2, 1, 1, 1, 2, 1, 1, 2, 1), (1, 1, 1, 1, 2, 2, 2, 1, 1), (1, 1, 1, 2, 1, 1, 2, 1, 2), (1, 1, 2, 2, 1, 2, 1, 1, 1), (2, 2, 1, 1, 1, 1, 1, 2, 1), (1, 1, 2, 1, 1, 1, 2, 1, 2), (2, 1, 1, 2, 1, 1, 2, 1, 1), (2, 2, 1, 1, 1, 1, 2, 1, 1), (1, 1, 1, 2, 2, 1, 2, 1, 1), (1, 2, 2, 1, 2, 1, 1, 1, 1), (2, 1, 1, 1, 1, 2, 1, 2, 1), (1, 1, 1, 1, 1, 2, 1, 2, 2), (1, 2, 1, 1, 2, 1, 1, 1, 2), (1, 1, 2, 1, 2, 1, 1, 2, 1), (1, 1, 2, 2, 1, 1, 2, 1, 1), (1, 2, 2, 2, 1, 1, 1, 1, 1), (1, 2, 1, 1, 1, 1, 1, 2, 2), (2, 1, 1, 1, 1, 2, 1, 1, 2), (1, 1, 2, 1, 2, 2, 1, 1, 1), (1, 1, 1, 2, 2, 2, 1, 1, 1), (2, 1, 2, 1, 2, 1, 1, 1, 1), (1, 2, 1, 2, 2, 1, 1, 1, 1), (2, 1, 2, 1, 1, 1, 1, 1, 2), (1, 1, 1, 1, 2, 2, 1, 2, 1), (1, 1, 2, 2, 2, 1, 1, 1, 1), (1, 1, 1, 2, 1, 2, 1, 2, 1), (1, 1, 2, 2, 1, 1, 1, 1, 2), (1, 1, 2, 1, 1, 1, 2, 2, 1), (1, 1, 1, 2, 1, 2, 2, 1, 1), (1, 1, 2, 1, 1, 2, 2, 1, 1), (2, 1, 1, 1, 2, 2, 1, 1, 1), (1, 2, 2, 1, 1, 1, 2, 1, 1), (2, 1, 1, 1, 2, 1, 2, 1, 1), (2, 1, 1, 2, 2, 1, 1, 1, 1), (1, 1, 2, 1, 2, 1, 1, 1, 2), (1, 2, 1, 1, 1, 1, 2, 1, 2), (1, 1, 1, 1, 2, 1, 1, 2, 2), (1, 1, 1, 1, 1, 2, 2, 1, 2), (1, 2, 2, 1, 1, 2, 1, 1, 1), (2, 1, 1, 2, 1, 2, 1, 1, 1), (2, 1, 1, 1, 1, 2, 2, 1, 1), (2, 2, 1, 1, 1, 2, 1, 1, 1), (1, 1, 1, 2, 1, 2, 1, 1, 2), (1, 1, 1, 1, 2, 2, 1, 1, 2), (2, 1, 1, 1, 1, 1, 2, 2, 1), (1, 2, 1, 2, 1, 1, 2, 1, 1), (2, 1, 1, 1, 2, 1, 1, 1, 2), (2, 1, 1, 1, 1, 1, 1, 2, 2), (1, 2, 2, 1, 1, 1, 1, 1, 2), (1, 2, 2, 1, 1, 1, 1, 2, 1), (2, 1, 1, 1, 1, 1, 2, 1, 2), (2, 2, 1, 1, 1, 1, 1, 1, 2), (1, 1, 1, 1, 1, 2, 2, 2, 1), (2, 1, 2, 2, 1, 1, 1, 1, 1), (1, 1, 1, 2, 2, 1, 1, 2, 1), (1, 2, 1, 1, 1, 1, 2, 2, 1), (2, 1, 2, 1, 1, 1, 2, 1, 1), (1, 2, 1, 1, 1, 2, 2, 1, 1), (1, 2, 1, 2, 1, 2, 1, 1, 1), (1, 2, 1, 2, 1, 1, 1, 2, 1), (1, 1, 2, 1, 2, 1, 2, 1, 1), (1, 2, 1, 2, 1, 1, 1, 1, 2), (1, 2, 1, 1, 2, 1, 1, 2, 1), (2, 1, 2, 1, 1, 2, 1, 1, 1), (1, 2, 1, 1, 2, 2, 1, 1, 1), (1, 1, 1, 2, 1, 1, 1, 2, 2), (1, 1, 1, 2, 2, 1, 1, 1, 2), (2, 1, 2, 1, 1, 1, 1, 2, 1), (1, 1, 2, 1, 1, 1, 1, 2, 2), (1, 2, 1, 1, 1, 2, 1, 1, 2), (1, 2, 1, 1, 1, 2, 1, 2, 1), (1, 1, 1, 1, 1, 1, 2, 4), (1, 1, 1, 1, 4, 1, 1, 2), (4, 1, 2, 1, 1, 1, 1, 1), (1, 1, 1, 2, 4, 1, 1, 1), (1, 1, 1, 4, 1, 1, 2, 1), (4, 1, 1, 1, 1, 1, 2, 1), (4, 1, 1, 1, 1, 2, 1, 1), (1, 1, 1, 1, 1, 2, 4, 1), (1, 1, 1, 4, 1, 1, 1, 2), (1, 1, 2, 1, 1, 4, 1, 1), (1, 4, 1, 1, 1, 1, 2, 1), (2, 1, 1, 1, 1, 1, 1, 4), (2, 1, 1, 1, 1, 4, 1, 1), (2, 1, 4, 1, 1, 1, 1, 1), (1, 1, 1, 1, 2, 1, 1, 4), (4, 1, 1, 1, 1, 1, 1, 2), (1, 4, 1, 1, 1, 1, 1, 2), (4, 1, 1, 1, 2, 1, 1, 1), (1, 1, 1, 2, 1, 1, 1, 4), (1, 1, 1, 1, 4, 2, 1, 1), (1, 4, 1, 1, 2, 1, 1, 1), (1, 1, 1, 1, 1, 2, 1, 4), (1, 2, 1, 1, 1, 1, 4, 1), (1, 2, 4, 1, 1, 1, 1, 1), (2, 1, 1, 1, 4, 1, 1, 1), (1, 1, 2, 1, 1, 1, 1, 4), (1, 2, 1, 4, 1, 1, 1, 1), (2, 1, 1, 4, 1, 1, 1, 1), (4, 1, 1, 2, 1, 1, 1, 1), (1, 1, 1, 4, 1, 2, 1, 1), (1, 4, 1, 1, 1, 2, 1, 1), (1, 1, 4, 1, 1, 1, 2, 1), (1, 1, 1, 1, 1, 1, 4, 2), (1, 1, 1, 2, 1, 4, 1, 1), (1, 2, 1, 1, 1, 4, 1, 1), (4, 2, 1, 1, 1, 1, 1, 1), (1, 1, 1, 1, 4, 1, 2, 1), (1, 1, 1, 1, 1, 4, 2, 1), (1, 1, 4, 1, 1, 1, 1, 2), (2, 4, 1, 1, 1, 1, 1, 1), (1, 1, 1, 1, 1, 4, 1, 2), (1, 1, 1, 1, 2, 1, 4, 1), (1, 1, 4, 1, 2, 1, 1, 1), (1, 4, 2, 1, 1, 1, 1, 1), (2, 1, 1, 1, 1, 1, 4, 1), (1, 1, 4, 1, 1, 2, 1, 1), (1, 1, 1, 4, 2, 1, 1, 1), (1, 1, 2, 4, 1, 1, 1, 1), (1, 2, 1, 1, 4, 1, 1, 1), (1, 2, 1, 1, 1, 1, 1, 4), (1, 1, 1, 2, 1, 1, 4, 1), (1, 1, 4, 2, 1, 1, 1, 1), (1, 1, 1, 1, 2, 4, 1, 1), (1, 1, 2, 1, 4, 1, 1, 1), (1, 1, 2, 1, 1, 1, 4, 1), (1, 4, 1, 2, 1, 1, 1, 1), (3, 1, 1, 3, 1, 1, 1, 1), (3, 1, 1, 1, 3, 1, 1, 1), (3, 1, 1, 1, 1, 1, 3, 1), (1, 1, 1, 3, 1, 1, 3, 1), (1, 1, 1, 1, 3, 1, 1, 3), (1, 1, 3, 3, 1, 1, 1, 1), (3, 1, 1, 1, 1, 3, 1, 1), (3, 3, 1, 1, 1, 1, 1, 1), (1, 1, 1, 3, 1, 3, 1, 1), (1, 1, 3, 1, 1, 1, 3, 1), (1, 1, 3, 1, 3, 1, 1, 1), (1, 3, 1, 1, 1, 1, 3, 1), (1, 1, 1, 1, 1, 3, 3, 1), (3, 1, 1, 1, 1, 1, 1, 3), (1, 1, 1, 3, 1, 1, 1, 3), (1, 1, 1, 1, 3, 3, 1, 1), (1, 3, 1, 1, 1, 1, 1, 3), (1, 1, 1, 3, 3, 1, 1, 1), (1, 1, 3, 1, 1, 1, 1, 3), (1, 1, 3, 1, 1, 3, 1, 1), (3, 1, 3, 1, 1, 1, 1, 1), (1, 1, 1, 1, 1, 3, 1, 3), (1, 3, 1, 3, 1, 1, 1, 1), (1, 1, 1, 1, 1, 1, 3, 3), (1, 3, 3, 1, 1, 1, 1, 1), (1, 3, 1, 1, 3, 1, 1, 1), (1, 1, 1, 1, 3, 1, 3, 1), (1, 3, 1, 1, 1, 3, 1, 1), (1, 6, 1, 1, 1, 1, 1), (6, 1, 1, 1, 1, 1, 1), (1, 1, 1, 6, 1, 1, 1), (1, 1, 6, 1, 1, 1, 1), (1, 1, 1, 1, 1, 6, 1), (1, 1, 1, 1, 1, 1, 6), (1, 1, 1, 1, 6, 1, 1), (1, 1, 1, 1, 2, 2, 3, 1), (1, 1, 2, 1, 2, 1, 3, 1), (1, 2, 1, 3, 1, 2, 1, 1), (2, 1, 2, 1, 1, 3, 1, 1), (1, 2, 1, 1, 1, 3, 2, 1), (1, 1, 1, 3, 1, 2, 2, 1), (1, 1, 1, 1, 2, 2, 1, 3), (1, 1, 1, 1, 3, 2, 2, 1), (1, 1, 2, 1, 2, 1, 1, 3), (2, 1, 1, 2, 1, 3, 1, 1), (1, 2, 1, 1, 1, 3, 1, 2), (2, 1, 1, 1, 3, 1, 1, 2), (2, 1, 1, 1, 3, 1, 2, 1), (1, 1, 3, 1, 2, 1, 2, 1), (1, 1, 3, 2, 1, 1, 2, 1), (2, 1, 3, 2, 1, 1, 1, 1), (1, 1, 1, 2, 1, 3, 2, 1), (1, 1, 1, 2, 3, 2, 1, 1), (1, 3, 1, 2, 1, 1, 2, 1), (2, 1, 2, 1, 1, 1, 3, 1), (3, 1, 1, 1, 1, 2, 1, 2), (1, 1, 2, 1, 1, 3, 1, 2), (2, 1, 2, 1, 1, 1, 1, 3), (2, 1, 1, 2, 1, 1, 1, 3), (1, 2, 3, 1, 1, 1, 2, 1), (3, 2, 1, 1, 1, 1, 2, 1), (3, 1, 1, 2, 1, 2, 1, 1), (1, 3, 1, 2, 1, 2, 1, 1), (1, 3, 2, 2, 1, 1, 1, 1), (1, 3, 1, 1, 1, 1, 2, 2), (1, 2, 1, 1, 1, 1, 3, 2), (3, 2, 1, 1, 2, 1, 1, 1), (1, 1, 2, 2, 1, 1, 3, 1), (1, 2, 1, 1, 1, 2, 3, 1), (1, 1, 3, 1, 2, 2, 1, 1), (3, 1, 2, 2, 1, 1, 1, 1), (2, 3, 1, 2, 1, 1, 1, 1), (1, 1, 1, 2, 1, 1, 3, 2), (2, 3, 1, 1, 2, 1, 1, 1), (1, 1, 2, 1, 1, 1, 3, 2), (3, 1, 2, 1, 1, 1, 2, 1), (1, 2, 3, 1, 1, 2, 1, 1), (3, 2, 2, 1, 1, 1, 1, 1), (2, 1, 3, 1, 1, 1, 1, 2), (1, 1, 1, 1, 3, 2, 1, 2), (1, 1, 2, 1, 1, 2, 3, 1), (1, 1, 1, 1, 1, 2, 3, 2), (1, 2, 1, 1, 2, 3, 1, 1), (1, 1, 2, 1, 3, 2, 1, 1), (3, 1, 1, 1, 1, 2, 2, 1), (1, 1, 3, 1, 2, 1, 1, 2), (2, 2, 3, 1, 1, 1, 1, 1), (3, 1, 2, 1, 2, 1, 1, 1), (2, 1, 2, 1, 3, 1, 1, 1), (1, 1, 2, 1, 1, 2, 1, 3), (3, 1, 2, 1, 1, 1, 1, 2), (1, 1, 1, 3, 1, 1, 2, 2), (1, 1, 3, 2, 1, 1, 1, 2), (1, 2, 1, 2, 1, 1, 3, 1), (1, 1, 1, 1, 1, 2, 2, 3), (1, 1, 2, 3, 1, 1, 2, 1), (1, 1, 2, 2, 1, 3, 1, 1), (1, 1, 2, 3, 1, 2, 1, 1), (1, 2, 1, 2, 1, 1, 1, 3), (1, 1, 1, 2, 2, 3, 1, 1), (1, 2, 1, 3, 1, 1, 2, 1), (1, 3, 1, 2, 2, 1, 1, 1), (3, 1, 2, 1, 1, 2, 1, 1), (2, 1, 1, 1, 1, 2, 3, 1), (1, 2, 1, 1, 3, 1, 1, 2), (2, 1, 1, 1, 2, 1, 1, 3), (1, 1, 1, 2, 1, 3, 1, 2), (1, 1, 3, 2, 1, 2, 1, 1), (1, 2, 1, 1, 3, 1, 2, 1), (1, 2, 2, 1, 1, 3, 1, 1), (2, 1, 1, 1, 3, 2, 1, 1), (2, 3, 1, 1, 1, 2, 1, 1), (1, 2, 1, 1, 1, 1, 2, 3), (1, 2, 1, 1, 2, 1, 3, 1), (1, 2, 3, 2, 1, 1, 1, 1), (3, 2, 1, 2, 1, 1, 1, 1), (2, 1, 1, 1, 1, 2, 1, 3), (2, 1, 1, 3, 2, 1, 1, 1), (1, 2, 1, 1, 2, 1, 1, 3), (2, 3, 2, 1, 1, 1, 1, 1), (2, 1, 1, 1, 1, 1, 2, 3), (3, 1, 1, 1, 2, 2, 1, 1), (1, 1, 1, 2, 2, 1, 1, 3), (1, 1, 2, 1, 2, 3, 1, 1), (2, 1, 1, 3, 1, 2, 1, 1), (3, 2, 1, 1, 1, 2, 1, 1), (1, 1, 2, 1, 3, 1, 2, 1), (1, 2, 2, 1, 1, 1, 3, 1), (1, 1, 1, 1, 2, 1, 2, 3), (1, 1, 1, 2, 1, 1, 2, 3), (1, 1, 1, 3, 2, 2, 1, 1), (1, 2, 2, 1, 1, 1, 1, 3), (3, 1, 1, 1, 1, 1, 2, 2), (1, 1, 1, 1, 3, 1, 2, 2), (1, 1, 2, 1, 1, 3, 2, 1), (1, 1, 2, 2, 1, 1, 1, 3), (1, 2, 1, 1, 1, 2, 1, 3), (1, 3, 2, 1, 1, 1, 2, 1), (1, 1, 2, 1, 1, 1, 2, 3), (1, 1, 2, 2, 3, 1, 1, 1), (3, 1, 1, 1, 2, 1, 2, 1), (1, 2, 1, 3, 2, 1, 1, 1), (2, 2, 1, 1, 1, 3, 1, 1), (1, 1, 3, 1, 1, 1, 2, 2), (1, 3, 1, 1, 1, 2, 1, 2), (1, 3, 2, 1, 1, 1, 1, 2), (1, 2, 2, 3, 1, 1, 1, 1), (1, 1, 1, 2, 1, 2, 1, 3), (1, 3, 1, 1, 1, 2, 2, 1), (2, 1, 2, 3, 1, 1, 1, 1), (3, 1, 1, 1, 2, 1, 1, 2), (1, 1, 3, 2, 2, 1, 1, 1), (2, 3, 1, 1, 1, 1, 2, 1), (3, 1, 1, 2, 1, 1, 1, 2), (1, 1, 2, 3, 2, 1, 1, 1), (2, 1, 1, 2, 3, 1, 1, 1), (2, 1, 3, 1, 2, 1, 1, 1), (1, 3, 1, 1, 2, 2, 1, 1), (2, 1, 1, 1, 1, 1, 3, 2), (1, 1, 1, 1, 1, 3, 2, 2), (1, 3, 2, 1, 1, 2, 1, 1), (1, 2, 1, 3, 1, 1, 1, 2), (2, 2, 1, 1, 1, 1, 3, 1), (1, 1, 1, 3, 2, 1, 1, 2), (2, 1, 1, 3, 1, 1, 1, 2), (1, 1, 1, 3, 2, 1, 2, 1), (2, 1, 1, 3, 1, 1, 2, 1), (1, 1, 1, 1, 2, 3, 1, 2), (2, 1, 3, 1, 1, 1, 2, 1), (2, 2, 1, 1, 1, 1, 1, 3), (1, 2, 1, 1, 3, 2, 1, 1), (2, 1, 3, 1, 1, 2, 1, 1), (1, 3, 1, 1, 2, 1, 2, 1), (1, 1, 1, 3, 1, 2, 1, 2), (2, 1, 1, 2, 1, 1, 3, 1), (1, 1, 1, 2, 1, 2, 3, 1), (2, 1, 1, 1, 2, 1, 3, 1), (1, 1, 1, 2, 3, 1, 2, 1), (1, 2, 3, 1, 2, 1, 1, 1), (1, 1, 2, 1, 3, 1, 1, 2), (1, 2, 1, 2, 1, 3, 1, 1), (1, 3, 1, 1, 2, 1, 1, 2), (1, 2, 2, 1, 3, 1, 1, 1), (2, 2, 1, 3, 1, 1, 1, 1), (1, 1, 1, 2, 3, 1, 1, 2), (1, 3, 1, 2, 1, 1, 1, 2), (3, 1, 1, 2, 1, 1, 2, 1), (1, 1, 1, 2, 2, 1, 3, 1), (1, 1, 3, 1, 1, 2, 1, 2), (1, 1, 2, 3, 1, 1, 1, 2), (1, 1, 3, 1, 1, 2, 2, 1), (1, 3, 2, 1, 2, 1, 1, 1), (1, 2, 3, 1, 1, 1, 1, 2), (3, 2, 1, 1, 1, 1, 1, 2), (3, 1, 1, 2, 2, 1, 1, 1), (2, 1, 1, 1, 1, 3, 1, 2), (2, 1, 1, 1, 1, 3, 2, 1), (2, 2, 1, 1, 3, 1, 1, 1), (2, 3, 1, 1, 1, 1, 1, 2), (1, 1, 1, 1, 2, 1, 3, 2), (1, 1, 1, 1, 2, 3, 2, 1), (1, 2, 1, 2, 3, 1, 1, 1), (2, 1, 1, 1, 2, 3, 1, 1), (1, 1, 1, 1, 1, 5, 2), (1, 5, 1, 2, 1, 1, 1), (1, 1, 1, 2, 1, 5, 1), (1, 1, 2, 1, 1, 5, 1), (2, 1, 1, 1, 1, 5, 1), (1, 1, 1, 1, 5, 2, 1), (2, 1, 5, 1, 1, 1, 1), (5, 1, 1, 1, 1, 2, 1), (1, 2, 1, 1, 1, 1, 5), (1, 5, 1, 1, 1, 2, 1), (1, 1, 1, 1, 5, 1, 2), (1, 1, 5, 2, 1, 1, 1), (5, 1, 1, 1, 1, 1, 2), (1, 1, 1, 1, 1, 2, 5), (1, 1, 1, 2, 5, 1, 1), (1, 2, 1, 5, 1, 1, 1), (1, 1, 1, 5, 1, 2, 1), (1, 2, 5, 1, 1, 1, 1), (1, 5, 1, 1, 1, 1, 2), (1, 1, 5, 1, 1, 2, 1), (1, 2, 1, 1, 5, 1, 1), (1, 1, 1, 5, 2, 1, 1), (1, 1, 2, 5, 1, 1, 1), (2, 1, 1, 1, 1, 1, 5), (1, 1, 1, 5, 1, 1, 2), (1, 1, 1, 2, 1, 1, 5), (2, 1, 1, 5, 1, 1, 1), (1, 1, 5, 1, 1, 1, 2), (1, 1, 1, 1, 2, 1, 5), (5, 1, 1, 2, 1, 1, 1), (1, 1, 2, 1, 5, 1, 1), (1, 1, 2, 1, 1, 1, 5), (2, 1, 1, 1, 5, 1, 1), (5, 1, 1, 1, 2, 1, 1), (2, 5, 1, 1, 1, 1, 1), (5, 2, 1, 1, 1, 1, 1), (1, 1, 5, 1, 2, 1, 1), (1, 2, 1, 1, 1, 5, 1), (1, 5, 1, 1, 2, 1, 1), (5, 1, 2, 1, 1, 1, 1), (1, 5, 2, 1, 1, 1, 1), (1, 1, 1, 1, 2, 5, 1), (4, 1, 3, 1, 1, 1, 1), (1, 1, 1, 1, 3, 4, 1), (1, 1, 1, 1, 4, 3, 1), (1, 4, 3, 1, 1, 1, 1), (1, 3, 1, 1, 1, 1, 4), (1, 3, 1, 4, 1, 1, 1), (1, 4, 1, 1, 1, 1, 3), (1, 1, 1, 1, 1, 4, 3), (1, 1, 1, 4, 1, 3, 1), (1, 4, 1, 3, 1, 1, 1), (4, 1, 1, 1, 1, 3, 1), (1, 1, 1, 1, 1, 3, 4), (3, 1, 1, 1, 1, 1, 4), (1, 1, 1, 4, 1, 1, 3), (1, 1, 1, 1, 4, 1, 3), (3, 1, 1, 1, 4, 1, 1), (1, 1, 3, 1, 1, 4, 1), (1, 3, 4, 1, 1, 1, 1), (1, 1, 3, 1, 4, 1, 1), (3, 1, 1, 4, 1, 1, 1), (1, 1, 1, 3, 1, 1, 4), (1, 4, 1, 1, 3, 1, 1), (4, 1, 1, 1, 3, 1, 1), (4, 3, 1, 1, 1, 1, 1), (1, 1, 1, 3, 4, 1, 1), (1, 1, 1, 1, 3, 1, 4), (3, 4, 1, 1, 1, 1, 1), (1, 1, 4, 1, 1, 3, 1), (4, 1, 1, 3, 1, 1, 1), (4, 1, 1, 1, 1, 1, 3), (1, 1, 4, 3, 1, 1, 1), (1, 1, 1, 4, 3, 1, 1), (1, 1, 3, 1, 1, 1, 4), (1, 3, 1, 1, 1, 4, 1), (3, 1, 4, 1, 1, 1, 1), (3, 1, 1, 1, 1, 4, 1), (1, 1, 4, 1, 1, 1, 3), (1, 1, 4, 1, 3, 1, 1), (1, 3, 1, 1, 4, 1, 1), (1, 1, 1, 3, 1, 4, 1), (1, 4, 1, 1, 1, 3, 1), (1, 1, 3, 4, 1, 1, 1), (1, 1, 1, 1, 2, 2, 2, 2), (2, 2, 2, 1, 1, 1, 1, 2), (2, 1, 1, 1, 2, 2, 1, 2), (1, 2, 2, 1, 1, 1, 2, 2), (2, 2, 1, 1, 2, 2, 1, 1), (1, 1, 2, 2, 1, 2, 2, 1), (2, 1, 1, 2, 2, 2, 1, 1), (2, 2, 1, 2, 1, 1, 2, 1), (2, 2, 1, 1, 2, 1, 1, 2), (2, 2, 1, 1, 2, 1, 2, 1), (1, 2, 1, 1, 1, 2, 2, 2), (2, 1, 1, 2, 2, 1, 1, 2), (1, 2, 1, 2, 2, 1, 2, 1), (2, 1, 1, 2, 1, 2, 2, 1), (1, 1, 2, 1, 2, 1, 2, 2), (1, 1, 2, 2, 2, 1, 2, 1), (2, 1, 2, 2, 1, 1, 1, 2), (2, 1, 2, 2, 1, 1, 2, 1), (2, 2, 2, 1, 2, 1, 1, 1), (1, 1, 2, 2, 1, 2, 1, 2), (1, 1, 2, 2, 2, 1, 1, 2), (2, 2, 1, 2, 1, 1, 1, 2), (1, 2, 1, 2, 2, 1, 1, 2), (1, 2, 2, 1, 2, 1, 2, 1), (1, 2, 2, 2, 1, 2, 1, 1), (2, 1, 1, 2, 1, 1, 2, 2), (2, 2, 1, 1, 1, 2, 2, 1), (1, 1, 2, 2, 2, 2, 1, 1), (2, 1, 2, 2, 1, 2, 1, 1), (1, 2, 2, 1, 2, 2, 1, 1), (1, 1, 2, 1, 1, 2, 2, 2), (1, 2, 1, 1, 2, 2, 1, 2), (2, 1, 1, 2, 1, 2, 1, 2), (1, 2, 1, 1, 2, 2, 2, 1), (2, 1, 2, 1, 1, 2, 2, 1), (1, 2, 2, 1, 2, 1, 1, 2), (2, 1, 2, 1, 1, 1, 2, 2), (1, 1, 2, 1, 2, 2, 2, 1), (1, 1, 1, 2, 1, 2, 2, 2), (2, 2, 2, 1, 1, 2, 1, 1), (1, 2, 1, 2, 1, 1, 2, 2), (2, 2, 1, 1, 1, 2, 1, 2), (2, 2, 1, 2, 1, 2, 1, 1), (1, 2, 2, 2, 1, 1, 1, 2), (1, 2, 2, 2, 1, 1, 2, 1), (2, 2, 2, 2, 1, 1, 1, 1), (1, 2, 2, 1, 1, 2, 2, 1), (1, 1, 2, 1, 2, 2, 1, 2), (2, 1, 2, 1, 2, 1, 2, 1), (1, 2, 2, 2, 2, 1, 1, 1), (1, 2, 2, 1, 1, 2, 1, 2), (2, 1, 1, 1, 2, 1, 2, 2), (2, 1, 2, 1, 1, 2, 1, 2), (1, 1, 1, 2, 2, 1, 2, 2), (1, 1, 1, 2, 2, 2, 1, 2), (1, 1, 1, 2, 2, 2, 2, 1), (1, 2, 1, 2, 2, 2, 1, 1), (2, 1, 2, 1, 2, 2, 1, 1), (2, 1, 1, 1, 2, 2, 2, 1), (2, 1, 2, 1, 2, 1, 1, 2), (2, 1, 1, 1, 1, 2, 2, 2), (2, 2, 1, 1, 1, 1, 2, 2), (2, 2, 2, 1, 1, 1, 2, 1), (2, 1, 2, 2, 2, 1, 1, 1), (1, 2, 1, 1, 2, 1, 2, 2), (2, 1, 1, 2, 2, 1, 2, 1), (2, 2, 1, 2, 2, 1, 1, 1), (1, 2, 1, 2, 1, 2, 1, 2), (1, 1, 2, 2, 1, 1, 2, 2), (1, 2, 1, 2, 1, 2, 2, 1), (4, 1, 2, 2, 1, 1, 1), (1, 2, 1, 4, 2, 1, 1), (2, 1, 4, 1, 1, 1, 2), (2, 1, 4, 1, 1, 2, 1), (1, 2, 2, 1, 1, 4, 1), (2, 2, 1, 4, 1, 1, 1), (1, 2, 1, 1, 2, 1, 4), (2, 1, 1, 1, 1, 4, 2), (1, 4, 1, 2, 2, 1, 1), (2, 1, 1, 1, 1, 2, 4), (1, 1, 1, 4, 1, 2, 2), (2, 1, 2, 1, 1, 4, 1), (1, 1, 2, 2, 4, 1, 1), (4, 1, 1, 1, 1, 2, 2), (1, 2, 4, 1, 1, 2, 1), (1, 1, 1, 2, 1, 2, 4), (4, 2, 2, 1, 1, 1, 1), (1, 1, 2, 1, 4, 2, 1), (4, 1, 1, 1, 2, 1, 2), (2, 1, 2, 1, 4, 1, 1), (1, 1, 1, 2, 2, 1, 4), (1, 4, 2, 1, 1, 1, 2), (1, 1, 2, 4, 2, 1, 1), (4, 1, 1, 2, 2, 1, 1), (1, 1, 1, 4, 2, 1, 2), (1, 1, 4, 1, 2, 2, 1), (4, 2, 1, 2, 1, 1, 1), (2, 1, 1, 2, 1, 4, 1), (2, 4, 2, 1, 1, 1, 1), (1, 1, 2, 1, 2, 1, 4), (1, 2, 1, 1, 2, 4, 1), (1, 2, 2, 4, 1, 1, 1), (1, 4, 1, 2, 1, 2, 1), (1, 4, 1, 1, 1, 2, 2), (1, 1, 2, 1, 1, 4, 2), (2, 4, 1, 2, 1, 1, 1), (2, 2, 4, 1, 1, 1, 1), (1, 1, 1, 2, 1, 4, 2), (1, 1, 4, 2, 1, 2, 1), (4, 1, 1, 2, 1, 2, 1), (2, 2, 1, 1, 1, 4, 1), (1, 2, 2, 1, 1, 1, 4), (1, 1, 2, 1, 4, 1, 2), (2, 2, 1, 1, 4, 1, 1), (1, 2, 4, 2, 1, 1, 1), (1, 1, 2, 4, 1, 2, 1), (1, 1, 4, 1, 2, 1, 2), (1, 2, 4, 1, 1, 1, 2), (1, 2, 1, 1, 1, 4, 2), (2, 1, 2, 1, 1, 1, 4), (1, 1, 4, 2, 2, 1, 1), (2, 4, 1, 1, 2, 1, 1), (1, 2, 1, 1, 4, 1, 2), (1, 2, 1, 1, 4, 2, 1), (2, 1, 4, 1, 2, 1, 1), (1, 2, 1, 2, 1, 4, 1), (4, 2, 1, 1, 1, 1, 2), (4, 2, 1, 1, 1, 2, 1), (1, 1, 1, 1, 2, 4, 2), (1, 1, 2, 2, 1, 4, 1), (1, 2, 1, 2, 4, 1, 1), (2, 1, 1, 2, 1, 1, 4), (1, 2, 1, 1, 1, 2, 4), (1, 1, 1, 2, 2, 4, 1), (1, 4, 1, 2, 1, 1, 2), (2, 1, 1, 4, 1, 1, 2), (2, 1, 1, 4, 1, 2, 1), (1, 1, 4, 2, 1, 1, 2), (1, 1, 2, 1, 1, 2, 4), (2, 1, 1, 1, 2, 4, 1), (1, 4, 1, 1, 2, 1, 2), (1, 1, 2, 1, 2, 4, 1), (1, 4, 2, 1, 2, 1, 1), (1, 2, 2, 1, 4, 1, 1), (2, 1, 1, 1, 4, 2, 1), (1, 1, 2, 4, 1, 1, 2), (2, 1, 1, 1, 2, 1, 4), (4, 1, 1, 2, 1, 1, 2), (4, 1, 2, 1, 1, 2, 1), (4, 1, 2, 1, 2, 1, 1), (1, 1, 1, 2, 4, 1, 2), (1, 1, 1, 2, 4, 2, 1), (4, 1, 2, 1, 1, 1, 2), (2, 4, 1, 1, 1, 1, 2), (2, 2, 1, 1, 1, 1, 4), (2, 4, 1, 1, 1, 2, 1), (1, 1, 1, 1, 4, 2, 2), (2, 1, 2, 4, 1, 1, 1), (2, 1, 1, 2, 4, 1, 1), (1, 4, 2, 2, 1, 1, 1), (1, 4, 1, 1, 2, 2, 1), (1, 1, 1, 1, 2, 2, 4), (1, 2, 1, 4, 1, 2, 1), (4, 2, 1, 1, 2, 1, 1), (1, 2, 1, 2, 1, 1, 4), (4, 1, 1, 1, 2, 2, 1), (1, 2, 1, 4, 1, 1, 2), (1, 4, 2, 1, 1, 2, 1), (1, 1, 2, 2, 1, 1, 4), (1, 1, 4, 1, 1, 2, 2), (1, 1, 1, 4, 2, 2, 1), (1, 2, 4, 1, 2, 1, 1), (2, 1, 1, 4, 2, 1, 1), (2, 1, 4, 2, 1, 1, 1), (2, 1, 1, 1, 4, 1, 2), (1, 1, 3, 2, 3, 1, 1), (1, 3, 1, 2, 1, 3, 1), (1, 2, 1, 1, 3, 1, 3), (1, 1, 2, 1, 3, 3, 1), (2, 3, 1, 1, 1, 3, 1), (3, 1, 1, 1, 1, 2, 3), (1, 2, 1, 3, 3, 1, 1), (1, 3, 1, 2, 1, 1, 3), (3, 1, 1, 1, 2, 3, 1), (1, 1, 1, 1, 3, 3, 2), (1, 1, 3, 1, 1, 3, 2), (1, 1, 2, 1, 3, 1, 3), (2, 1, 1, 3, 3, 1, 1), (1, 3, 1, 1, 3, 2, 1), (1, 1, 3, 1, 1, 2, 3), (1, 3, 2, 1, 1, 3, 1), (1, 1, 3, 3, 1, 2, 1), (3, 1, 1, 2, 3, 1, 1), (1, 2, 3, 1, 3, 1, 1), (2, 1, 3, 1, 1, 3, 1), (2, 3, 1, 1, 3, 1, 1), (3, 1, 1, 1, 3, 2, 1), (3, 1, 3, 2, 1, 1, 1), (2, 1, 3, 1, 1, 1, 3), (3, 1, 1, 1, 3, 1, 2), (1, 3, 3, 1, 1, 1, 2), (1, 1, 2, 3, 3, 1, 1), (1, 1, 1, 1, 2, 3, 3), (1, 3, 1, 2, 3, 1, 1), (2, 1, 1, 1, 1, 3, 3), (2, 1, 1, 3, 1, 1, 3), (3, 1, 2, 1, 3, 1, 1), (1, 1, 1, 1, 3, 2, 3), (1, 1, 1, 2, 1, 3, 3), (1, 1, 3, 1, 3, 1, 2), (1, 1, 1, 3, 3, 2, 1), (3, 2, 1, 3, 1, 1, 1), (3, 3, 1, 1, 2, 1, 1), (1, 1, 3, 2, 1, 3, 1), (1, 3, 1, 1, 3, 1, 2), (2, 1, 3, 3, 1, 1, 1), (3, 1, 1, 1, 2, 1, 3), (1, 1, 3, 2, 1, 1, 3), (3, 1, 2, 1, 1, 3, 1), (1, 3, 2, 1, 1, 1, 3), (2, 1, 1, 1, 3, 1, 3), (1, 1, 3, 3, 1, 1, 2), (3, 1, 2, 1, 1, 1, 3), (1, 3, 2, 3, 1, 1, 1), (1, 3, 1, 1, 1, 3, 2), (2, 1, 1, 3, 1, 3, 1), (1, 3, 3, 1, 2, 1, 1), (1, 2, 1, 1, 1, 3, 3), (1, 1, 2, 3, 1, 3, 1), (1, 1, 1, 3, 1, 3, 2), (3, 2, 1, 1, 3, 1, 1), (3, 1, 3, 1, 2, 1, 1), (1, 3, 1, 1, 2, 1, 3), (3, 2, 1, 1, 1, 1, 3), (3, 3, 1, 1, 1, 2, 1), (1, 1, 1, 3, 1, 2, 3), (1, 1, 3, 1, 3, 2, 1), (3, 1, 1, 3, 1, 1, 2), (3, 3, 1, 1, 1, 1, 2), (1, 1, 3, 1, 2, 3, 1), (2, 3, 1, 1, 1, 1, 3), (3, 2, 3, 1, 1, 1, 1), (2, 3, 1, 3, 1, 1, 1), (3, 1, 3, 1, 1, 1, 2), (3, 3, 1, 2, 1, 1, 1), (3, 1, 3, 1, 1, 2, 1), (2, 3, 3, 1, 1, 1, 1), (3, 3, 2, 1, 1, 1, 1), (2, 1, 3, 1, 3, 1, 1), (1, 1, 1, 3, 3, 1, 2), (1, 2, 1, 1, 3, 3, 1), (3, 1, 1, 3, 2, 1, 1), (1, 3, 1, 3, 1, 1, 2), (1, 3, 1, 3, 1, 2, 1), (3, 1, 2, 3, 1, 1, 1), (1, 3, 1, 1, 1, 2, 3), (3, 1, 1, 1, 1, 3, 2), (3, 1, 1, 3, 1, 2, 1), (1, 2, 1, 3, 1, 3, 1), (1, 3, 1, 3, 2, 1, 1), (1, 1, 2, 1, 1, 3, 3), (1, 1, 2, 3, 1, 1, 3), (1, 2, 1, 3, 1, 1, 3), (2, 1, 1, 1, 3, 3, 1), (3, 1, 1, 2, 1, 3, 1), (1, 1, 1, 3, 2, 3, 1), (1, 2, 3, 3, 1, 1, 1), (1, 2, 3, 1, 1, 3, 1), (1, 3, 2, 1, 3, 1, 1), (1, 1, 1, 2, 3, 3, 1), (1, 1, 1, 3, 2, 1, 3), (3, 1, 1, 2, 1, 1, 3), (1, 1, 3, 1, 2, 1, 3), (1, 3, 3, 2, 1, 1, 1), (1, 2, 3, 1, 1, 1, 3), (1, 1, 1, 2, 3, 1, 3), (1, 3, 3, 1, 1, 2, 1), (1, 1, 3, 3, 2, 1, 1), (1, 3, 1, 1, 2, 3, 1), (3, 2, 1, 1, 1, 3, 1), (1, 2, 1, 1, 2, 3, 2), (2, 1, 1, 2, 1, 2, 3), (1, 2, 1, 1, 3, 2, 2), (1, 2, 2, 1, 1, 3, 2), (1, 2, 3, 2, 2, 1, 1), (2, 1, 2, 2, 1, 3, 1), (1, 2, 1, 1, 2, 2, 3), (2, 3, 1, 1, 2, 2, 1), (1, 1, 2, 1, 3, 2, 2), (1, 2, 2, 1, 1, 2, 3), (2, 1, 2, 1, 1, 3, 2), (3, 2, 1, 2, 2, 1, 1), (3, 1, 1, 1, 2, 2, 2), (1, 2, 2, 1, 3, 1, 2), (2, 3, 1, 1, 2, 1, 2), (2, 2, 1, 3, 1, 2, 1), (2, 3, 2, 2, 1, 1, 1), (1, 1, 2, 2, 1, 2, 3), (3, 1, 1, 2, 2, 1, 2), (1, 3, 2, 1, 2, 1, 2), (3, 1, 1, 2, 2, 2, 1), (2, 3, 1, 2, 2, 1, 1), (2, 1, 3, 1, 2, 2, 1), (1, 1, 3, 2, 1, 2, 2), (1, 1, 1, 2, 3, 2, 2), (2, 2, 3, 1, 1, 1, 2), (2, 1, 3, 1, 1, 2, 2), (2, 2, 1, 3, 1, 1, 2), (2, 1, 3, 1, 2, 1, 2), (1, 1, 2, 3, 2, 1, 2), (2, 1, 1, 1, 3, 2, 2), (1, 2, 3, 2, 1, 2, 1), (2, 3, 2, 1, 2, 1, 1), (2, 2, 1, 1, 2, 1, 3), (1, 3, 1, 1, 2, 2, 2), (2, 1, 1, 2, 1, 3, 2), (1, 2, 3, 2, 1, 1, 2), (2, 2, 1, 3, 2, 1, 1), (1, 1, 2, 2, 2, 1, 3), (1, 3, 1, 2, 2, 1, 2), (1, 3, 1, 2, 2, 2, 1), (2, 1, 1, 3, 1, 2, 2), (2, 2, 1, 1, 3, 2, 1), (1, 2, 1, 2, 1, 3, 2), (3, 1, 2, 2, 2, 1, 1), (3, 2, 1, 1, 1, 2, 2), (1, 2, 2, 1, 3, 2, 1), (2, 1, 1, 2, 2, 3, 1), (2, 2, 1, 1, 3, 1, 2), (2, 2, 2, 1, 1, 3, 1), (2, 3, 1, 2, 1, 2, 1), (1, 2, 1, 3, 2, 2, 1), (2, 1, 1, 2, 2, 1, 3), (1, 2, 2, 2, 3, 1, 1), (2, 3, 1, 2, 1, 1, 2), (1, 2, 1, 2, 2, 3, 1), (2, 2, 1, 1, 1, 2, 3), (2, 1, 2, 1, 1, 2, 3), (1, 2, 3, 1, 2, 2, 1), (2, 1, 1, 1, 2, 2, 3), (2, 1, 2, 3, 1, 2, 1), (1, 3, 2, 1, 1, 2, 2), (2, 1, 1, 2, 3, 1, 2), (1, 2, 2, 2, 1, 3, 1), (2, 1, 1, 2, 3, 2, 1), (3, 1, 2, 2, 1, 2, 1), (3, 1, 2, 1, 1, 2, 2), (2, 1, 2, 3, 1, 1, 2), (2, 2, 2, 1, 3, 1, 1), (1, 2, 1, 2, 1, 2, 3), (1, 1, 1, 2, 2, 3, 2), (3, 2, 1, 2, 1, 2, 1), (2, 1, 3, 2, 1, 2, 1), (2, 3, 1, 1, 1, 2, 2), (2, 1, 2, 1, 3, 2, 1), (1, 2, 1, 3, 1, 2, 2), (2, 1, 2, 3, 2, 1, 1), (3, 2, 2, 1, 1, 1, 2), (2, 2, 3, 2, 1, 1, 1), (1, 1, 1, 2, 2, 2, 3), (1, 1, 3, 1, 2, 2, 2), (3, 2, 1, 2, 1, 1, 2), (1, 2, 1, 3, 2, 1, 2), (2, 1, 1, 3, 2, 2, 1), (1, 1, 2, 1, 2, 3, 2), (2, 2, 1, 1, 1, 3, 2), (2, 1, 2, 2, 3, 1, 1), (2, 2, 2, 3, 1, 1, 1), (1, 1, 3, 2, 2, 2, 1), (2, 1, 1, 1, 2, 3, 2), (2, 1, 2, 1, 3, 1, 2), (2, 2, 2, 1, 1, 1, 3), (2, 2, 3, 1, 2, 1, 1), (2, 2, 1, 2, 1, 3, 1), (2, 3, 2, 1, 1, 2, 1), (3, 2, 2, 1, 2, 1, 1), (1, 1, 2, 2, 3, 2, 1), (1, 2, 3, 1, 2, 1, 2), (2, 2, 1, 2, 1, 1, 3), (1, 3, 2, 2, 1, 2, 1), (1, 2, 1, 2, 3, 2, 1), (1, 1, 2, 2, 3, 1, 2), (1, 3, 2, 2, 1, 1, 2), (1, 2, 1, 2, 3, 1, 2), (3, 2, 1, 1, 2, 1, 2), (1, 3, 2, 2, 2, 1, 1), (3, 2, 1, 1, 2, 2, 1), (1, 3, 1, 2, 1, 2, 2), (1, 2, 2, 1, 2, 3, 1), (1, 2, 2, 2, 1, 1, 3), (1, 2, 2, 3, 1, 2, 1), (3, 1, 2, 2, 1, 1, 2), (1, 1, 2, 3, 1, 2, 2), (3, 2, 2, 1, 1, 2, 1), (3, 1, 2, 1, 2, 1, 2), (1, 2, 2, 3, 1, 1, 2), (2, 2, 1, 2, 3, 1, 1), (3, 1, 2, 1, 2, 2, 1), (2, 1, 2, 1, 2, 3, 1), (2, 1, 2, 2, 1, 1, 3), (2, 2, 1, 1, 2, 3, 1), (3, 2, 2, 2, 1, 1, 1), (1, 1, 2, 3, 2, 2, 1), (1, 1, 2, 2, 1, 3, 2), (1, 1, 1, 3, 2, 2, 2), (1, 2, 2, 1, 2, 1, 3), (3, 1, 1, 2, 1, 2, 2), (1, 3, 2, 1, 2, 2, 1), (2, 1, 2, 1, 2, 1, 3), (2, 1, 1, 3, 2, 1, 2), (2, 1, 3, 2, 1, 1, 2), (1, 2, 2, 3, 2, 1, 1), (1, 1, 3, 2, 2, 1, 2), (2, 2, 3, 1, 1, 2, 1), (1, 1, 2, 2, 2, 3, 1), (2, 3, 2, 1, 1, 1, 2), (1, 2, 3, 1, 1, 2, 2), (1, 1, 2, 1, 2, 2, 3), (2, 1, 3, 2, 2, 1, 1), (1, 2, 1, 2, 2, 1, 3), (2, 2, 2, 1, 2, 1, 2), (1, 2, 2, 2, 1, 2, 2), (2, 1, 2, 2, 2, 2, 1), (2, 1, 2, 2, 1, 2, 2), (2, 2, 2, 2, 1, 2, 1), (1, 2, 2, 1, 2, 2, 2), (2, 1, 1, 2, 2, 2, 2), (2, 2, 2, 2, 1, 1, 2), (1, 2, 2, 2, 2, 2, 1), (2, 1, 2, 1, 2, 2, 2), (2, 1, 2, 2, 2, 1, 2), (1, 2, 2, 2, 2, 1, 2), (1, 2, 1, 2, 2, 2, 2), (2, 2, 2, 2, 2, 1, 1), (2, 2, 2, 1, 1, 2, 2), (2, 2, 1, 1, 2, 2, 2), (2, 2, 2, 1, 2, 2, 1), (2, 2, 1, 2, 1, 2, 2), (1, 1, 2, 2, 2, 2, 2), (2, 2, 1, 2, 2, 1, 2), (2, 2, 1, 2, 2, 2, 1)]
 
+from functools import lru_cache
+from itertools import chain, combinations
+from math import comb
+from typing import Generator, List
+import numpy as np
 
-ten_to_twelve = [(1, 1, 1, 3, 1, 1, 1, 1, 1, 1), (3, 1, 1, 1, 1, 1, 1, 1, 1, 1), (1, 1, 1, 1, 1, 1, 3, 1, 1, 1), (1, 3, 1, 1, 1, 1, 1, 1, 1, 1), (1, 1, 1, 1, 3, 1, 1, 1, 1, 1), (1, 1, 1, 1, 1, 1, 1, 1, 1, 3), (1, 1, 1, 1, 1, 1, 1, 1, 3, 1), (1, 1, 1, 1, 1, 1, 1, 3, 1, 1), (1, 1, 1, 1, 1, 3, 1, 1, 1, 1), (1, 1, 3, 1, 1, 1, 1, 1, 1, 1), (2, 1, 2, 1, 1, 1, 1, 1, 1, 1), (1, 1, 2, 2, 1, 1, 1, 1, 1, 1), (1, 1, 1, 2, 1, 1, 1, 1, 1, 2), (1, 1, 1, 1, 1, 2, 1, 1, 2, 1), (1, 1, 2, 1, 1, 1, 1, 1, 2, 1), (1, 1, 1, 1, 1, 1, 2, 1, 1, 2), (1, 1, 1, 2, 1, 1, 2, 1, 1, 1), (1, 1, 1, 1, 1, 2, 2, 1, 1, 1), (2, 1, 1, 1, 1, 1, 1, 2, 1, 1), (2, 1, 1, 1, 1, 2, 1, 1, 1, 1), (1, 1, 2, 1, 1, 1, 1, 1, 1, 2), (1, 1, 1, 1, 1, 2, 1, 2, 1, 1), (1, 1, 1, 2, 1, 1, 1, 2, 1, 1), (1, 1, 1, 1, 1, 1, 1, 1, 2, 2), (1, 1, 1, 1, 1, 2, 1, 1, 1, 2), (1, 2, 1, 1, 1, 1, 2, 1, 1, 1), (2, 2, 1, 1, 1, 1, 1, 1, 1, 1), (1, 1, 1, 2, 2, 1, 1, 1, 1, 1), (2, 1, 1, 1, 2, 1, 1, 1, 1, 1), (2, 1, 1, 1, 1, 1, 1, 1, 2, 1), (1, 1, 1, 1, 2, 1, 1, 1, 1, 2), (1, 1, 2, 1, 1, 1, 1, 2, 1, 1), (1, 1, 1, 1, 2, 1, 1, 1, 2, 1), (1, 1, 2, 1, 1, 1, 2, 1, 1, 1), (1, 2, 1, 1, 2, 1, 1, 1, 1, 1), (1, 2, 1, 1, 1, 2, 1, 1, 1, 1), (1, 2, 1, 1, 1, 1, 1, 1, 2, 1), (1, 1, 1, 1, 2, 2, 1, 1, 1, 1), (1, 1, 1, 2, 1, 2, 1, 1, 1, 1), (1, 1, 1, 1, 2, 1, 1, 2, 1, 1), (1, 1, 1, 1, 1, 1, 1, 2, 2, 1), (1, 1, 2, 1, 1, 2, 1, 1, 1, 1), (2, 1, 1, 1, 1, 1, 1, 1, 1, 2), (1, 2, 1, 2, 1, 1, 1, 1, 1, 1), (2, 1, 1, 2, 1, 1, 1, 1, 1, 1), (1, 2, 1, 1, 1, 1, 1, 1, 1, 2), (1, 1, 1, 1, 2, 1, 2, 1, 1, 1), (1, 1, 1, 1, 1, 1, 1, 2, 1, 2), (1, 1, 1, 1, 1, 1, 2, 1, 2, 1), (1, 1, 1, 2, 1, 1, 1, 1, 2, 1), (2, 1, 1, 1, 1, 1, 2, 1, 1, 1), (1, 1, 2, 1, 2, 1, 1, 1, 1, 1), (1, 2, 1, 1, 1, 1, 1, 2, 1, 1), (1, 2, 2, 1, 1, 1, 1, 1, 1, 1), (1, 1, 1, 1, 1, 1, 2, 2, 1, 1), 
-                 (1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1), (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2), (2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1), (1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1), (1, 1, 1, 1, 1, 1, 1, 2, 1, 1, 1), (1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1), (1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1), (1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1), (1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1), (1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 1), (1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1), 
-                 (1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1)]
 
+_LEGACY_RANGES = {
+    "up_to_six": (1, 6),
+    "six_to_nine": (7, 9),
+    "ten_to_twelve": (10, 12),
+}
+
+
+@lru_cache(maxsize=None)
+def composition_array(
+    n: int,
+    num_parts: int,
+) -> np.ndarray:
+
+    """Returns a read-only array with all the compositions of n into exactly
+    num_parts parts, one composition per line, in lexicographic order of the cuts.
+    """
+
+    if not 1 <= num_parts <= n:
+        return np.zeros((0, num_parts), dtype=np.min_scalar_type(n))
+    count = comb(n - 1, num_parts - 1)
+    cuts = np.fromiter(
+        chain.from_iterable(combinations(range(1, n), num_parts - 1)),
+        dtype=np.int64,
+        count=count * (num_parts - 1),
+    ).reshape(count, num_parts - 1)
+    bounds = np.hstack([
+        np.zeros((count, 1), dtype=np.int64),
+        cuts,
+        np.full((count, 1), n, dtype=np.int64),
+    ])
+    result = np.diff(bounds, axis=1).astype(np.min_scalar_type(n))
+    result.setflags(write=False)
+
+    return result
+
+
+def compositions(
+    n: int = 12,
+    min_parts: int = 1,
+    max_parts: int = None,
+) -> Generator:
+
+    """Generator for the compositions of n with a number of parts between
+    min_parts and max_parts (both inclusive), as tuples.
+    """
+
+    if max_parts is None:
+        max_parts = n
+    for num_parts in range(min_parts, max_parts + 1):
+        for composition in composition_array(n, num_parts).tolist():
+            yield tuple(composition)
+
+
+def count_compositions(
+    n: int = 12,
+    min_parts: int = 1,
+    max_parts: int = None,
+) -> int:
+
+    """Returns the number of compositions of n with a number of parts between
+    min_parts and max_parts, without generating them.
+    """
+
+    if max_parts is None:
+        max_parts = n
+    return sum(comb(n - 1, k - 1) for k in range(max(min_parts, 1), min(max_parts, n) + 1))
+
+
+def __getattr__(
+    name: str,
+) -> List:
+
+    """Keeps the old up_to_six, six_to_nine and ten_to_twelve names available,
+    generating them only when they are accessed.
+    """
+
+    if name in _LEGACY_RANGES:
+        return list(compositions(12, *_LEGACY_RANGES[name]))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,19 +5,22 @@ Partitional Analysis of an existing piece.
 
 
 import music21 as m21
+from .score_cache import cached_arrays, fraction_arrays, from_fraction_arrays
 from collections import defaultdict
+from pathlib import Path
+import numpy as np
 import random
-from typing import Dict, Sequence, List
+from typing import Dict, Sequence, List, Union
 
 
-def make_catalog_dict(
+def measure_duration_arrays(
     filename: str,
 ) -> Dict:
 
-    """Given a xml or MIDI file, creates a catalog.
-    Each measure of the original file must have complete independence between parts.
-    That means that the partitional analysis of each point of a measure must be 1 ** n,
-    with n being the number of parts.
+    """Returns the durations of the notes and rests of each measure of each part
+    of a xml or MIDI file as a dictionary of arrays: the 'measure' and 'part'
+    of each duration and the duration as a numerator and a denominator
+    (see fraction_arrays).
     """
 
     piece = m21.converter.parse(filename)
@@ -25,16 +28,51 @@ def make_catalog_dict(
     measures = [part.getElementsByClass("Measure") for part in piece.parts]
     num_measures = len(measures[0])
 
-    master_list = []
-    final_dict = defaultdict(list)
-
+    measure_inds, part_inds, durs = [], [], []
     for j in range(num_measures):
-        mm_list = []
         for i in range(num_parts):
             cur_measure = measures[i][j]
-            durs = [x.quarterLength for x in cur_measure.getElementsByClass("GeneralNote")]
-            mm_list.append(durs)
-        master_list.append(mm_list)
+            for x in cur_measure.getElementsByClass("GeneralNote"):
+                measure_inds.append(j)
+                part_inds.append(i)
+                durs.append(x.quarterLength)
+    numerators, denominators = fraction_arrays(durs)
+
+    return {
+        "measure": np.array(measure_inds, dtype=np.int32),
+        "part": np.array(part_inds, dtype=np.int32),
+        "duration_num": numerators,
+        "duration_den": denominators,
+        "num_measures": np.array(num_measures),
+        "num_parts": np.array(num_parts),
+    }
+
+
+def make_catalog_dict(
+    filename: str,
+    cache_dir: Union[str, Path] = None,
+) -> Dict:
+
+    """Given a xml or MIDI file, creates a catalog.
+    Each measure of the original file must have complete independence between parts.
+    That means that the partitional analysis of each point of a measure must be 1 ** n,
+    with n being the number of parts.
+    If a cache directory is given, the durations are kept there (see score_cache),
+    so the file is parsed by music21 only once.
+    """
+
+    if cache_dir is None:
+        arrays = measure_duration_arrays(filename)
+    else:
+        arrays = cached_arrays(filename, {"extract": "measures"}, measure_duration_arrays, cache_dir)
+    durations = from_fraction_arrays(arrays["duration_num"], arrays["duration_den"])
+    num_measures, num_parts = int(arrays["num_measures"]), int(arrays["num_parts"])
+
+    master_list = [[[] for i in range(num_parts)] for j in range(num_measures)]
+    final_dict = defaultdict(list)
+
+    for j, i, dur in zip(arrays["measure"].tolist(), arrays["part"].tolist(), durations):
+        master_list[j][i].append(dur)
 
     for mm in master_list:
         dur_mm = sum(mm[0])
@@ -5,12 +5,18 @@ Pauxy Gentil-Nunes - Análise Particional: Uma Mediação Entre Composição Mus
 """
 
 import music21 as m21
-from typing import Tuple, Union, List, Sequence, Generator, Dict
+from typing import Tuple, Union, List, Sequence, Generator, Dict, Iterable
 from fractions import Fraction
 import matplotlib.pyplot as plt
-from .basic_tools import markov
+from .score_cache import cached_arrays
+from .event_arrays import load_events, event_offsets, event_times, event_melody
+from .partition_lattice import PartitionLattice
+from .transitions import LINEAR_LABELS, partition_transitions, linear_transitions, transition_graph, write_graph
+from pathlib import Path
+import numpy as np
 from graphviz import Digraph
 from collections import defaultdict, Counter
+import heapq
 
 
 def extract_parts(
@@ -25,7 +31,7 @@ def extract_parts(
     raw_parts = [x for x in piece.getElementsByClass("Part")]
     parts = []
     for part in raw_parts:
-        new_part = part.flat.getElementsByClass("GeneralNote")
+        new_part = part.flatten().getElementsByClass("GeneralNote").stream()
         filled_part = new_part.makeRests(fillGaps=True, inPlace=False)
         parts.append(filled_part)
 
@@ -45,62 +51,129 @@ def split_chord(
     return result
 
 
+def load_note_events(
+    filename: str,
+    cache_dir: Union[str, Path] = None,
+) -> Tuple[List, List]:
+
+    """Returns the note events of a piece as (onset, duration) pairs, with the chords
+    split into their notes, and the sorted list of its offsets, rests included,
+    taken from its event array (see load_events). If a cache directory is given,
+    the event array is kept there (see score_cache), so the piece is parsed by music21 only once.
+    """
+
+    return event_note_pairs(load_events(filename, cache_dir))
+
+
+def event_note_pairs(
+    events: np.ndarray,
+) -> Tuple[List, List]:
+
+    """Returns the notes of an event array as (onset, duration) pairs
+    and its offsets (see event_offsets), as music21 offsets.
+    """
+
+    notes = events[events["midi"] >= 0]
+    pairs = list(zip(event_times(notes, exact=True), event_times(notes, "duration", exact=True)))
+
+    return pairs, event_offsets(events)
+
+
+def sweep_partitions(
+    events: List,
+    offsets: List,
+    no_reps: bool = False,
+) -> Generator:
+
+    """Generator for the rhythmic partitions of a list of (onset, duration) note events
+    at each of the given offsets, as in partitional_analysis. Yields (offset, partition) pairs.
+    The offsets are swept in order, keeping the sounding notes in a multiset keyed by
+    (onset, duration) and their ends in a heap, so it runs in O(n log n) time.
+    With no_reps = True, only the offsets where the partition changes are yielded.
+    """
+
+    events = sorted(events, key=lambda x: x[0])
+    active = dict()
+    blocks = Counter()
+    ends = []
+    previous = None
+    e = 0
+    for offset in offsets:
+        current = round(offset, 5)
+        while ends and ends[0][0] <= current:
+            key = heapq.heappop(ends)[2]
+            size = active.pop(key)
+            blocks[size] -= 1
+        while e < len(events) and events[e][0] <= offset:
+            key = events[e]
+            e += 1
+            if key[0] != offset:
+                continue
+            size = active.get(key, 0)
+            if size:
+                blocks[size] -= 1
+            else:
+                heapq.heappush(ends, (round(key[0] + key[1], 5), e, key))
+            active[key] = size + 1
+            blocks[size + 1] += 1
+        partition = tuple(size for size in sorted(blocks) for _ in range(blocks[size]))
+        if len(partition) == 0:
+            partition = tuple([0])
+        if not no_reps or partition != previous:
+            yield offset, partition
+        previous = partition
+
+
+def iter_partitional_analysis(
+    filename: str,
+    no_reps: bool = False,
+    cache_dir: Union[str, Path] = None,
+) -> Generator:
+
+    """Generator for the rhythmic partitional analysis of a piece, given its filename.
+    Yields the (offset, partition) pairs in order (see sweep_partitions).
+    """
+
+    yield from iter_event_partitions(load_events(filename, cache_dir), no_reps)
+
+
 def partitional_analysis(
     filename: str,
     no_reps: bool = False,
+    cache_dir: Union[str, Path] = None,
 ) -> Dict:
 
     """Returns the rhythmic partitional analysis of a piece, given its filename.
+    If a cache directory is given, the parsed piece is kept there (see load_events).
     """
-  
-    offset_dict = defaultdict(list)
-    parts = extract_parts(filename)
-    offsets = []
-    for p in parts:
-        for el in p:
-            if el.offset not in offsets:
-                offsets.append(el.offset)
-    offsets.sort()
-    for p in parts:
-        for el in p:
-            if isinstance(el, m21.chord.Chord):
-                new_el = split_chord(el)
-                for element in new_el:
-                    offset_dict[el.offset].append(element)
-            elif isinstance(el, m21.note.Note):
-                offset_dict[el.offset].append(el)
-            else:
-                pass
-    new_values = []
-    analise = dict()
-    for i, el in enumerate(offsets):
-        if i == 0:
-            cur_list = [(el,x.quarterLength) for x in offset_dict[el]]
-        else:
-            cur_list = [(el,x.quarterLength) for x in offset_dict[el]]
-            prev_list = new_values[i-1]
-            for y in prev_list:
-                if round(y[0] + y[1],5) > round(el,5):
-                    cur_list.append(y)
-        counts = Counter(cur_list)
-        final_count = tuple(sorted(list(counts.values())))
-        if len(final_count) == 0:
-            final_count = tuple([0])
-        analise[el] = final_count
-        new_values.append(cur_list)
-        
-    if no_reps == True:
-        new_analise = dict()
-        for y, el in enumerate(offsets):
-            if y == 0:
-                new_analise[el] = analise[el]
-            else:
-                if analise[el] != analise[offsets[y-1]]:
-                    new_analise[el] = analise[el]
-                else:
-                    pass
-        return new_analise
-    return analise
+
+    return dict(iter_partitional_analysis(filename, no_reps, cache_dir))
+
+
+def iter_event_partitions(
+    events: np.ndarray,
+    no_reps: bool = False,
+) -> Generator:
+
+    """Generator for the rhythmic partitional analysis of an event array,
+    as iter_partitional_analysis: yields (offset, partition) pairs in order.
+    The tied notes must be merged already (see score_events and strip_ties).
+    """
+
+    pairs, offsets = event_note_pairs(events)
+    yield from sweep_partitions(pairs, offsets, no_reps)
+
+
+def event_partitional_analysis(
+    events: np.ndarray,
+    no_reps: bool = False,
+) -> Dict:
+
+    """Returns the rhythmic partitional analysis of an event array,
+    as partitional_analysis.
+    """
+
+    return dict(iter_event_partitions(events, no_reps))
 
 
 def binary_relations(
@@ -378,6 +451,55 @@ def linear_partitions(
     return result
 
 
+def iter_linear_partitions(
+    pitches: Iterable,
+) -> Generator:
+
+    """Generator for the Linear Partitions of a stream of pitches (a list, a generator
+    or an array), with the same labels as linear_partitions. Only the current linvector
+    is kept and it is updated in place for each pitch. Its elements are more than
+    2 semitones apart, so it never has more than 43 MIDI pitches, and at most 2 of them
+    are within 2 semitones of the next pitch. The memory used does not grow with the melody.
+    """
+
+    linvector = []
+    for pitch in pitches:
+        close = [i for i, element in enumerate(linvector) if abs(pitch - element) <= 2]
+        if not linvector:
+            label = "N"
+        elif pitch == linvector[-1]:
+            label = "R"
+        elif len(close) == 1:
+            if linvector[close[0]] == pitch:
+                label = "G"
+            elif abs(pitch - linvector[-1]) < 3:
+                label = "P"
+            else:
+                label = "A"
+        elif not close:
+            label = "N"
+        elif abs(pitch - linvector[-1]) < 3:
+            label = "C"
+        else:
+            label = "F"
+        for i in reversed(close):
+            del linvector[i]
+        linvector.append(pitch)
+        yield label
+
+
+def event_linear_partitions(
+    events: np.ndarray,
+    part: int = None,
+) -> List:
+
+    """Returns the Linear Partitions (see linear_partitions) of the melody
+    of an event array, or of one of its parts (see event_melody).
+    """
+
+    return list(iter_linear_partitions(event_melody(events, part).tolist()))
+
+
 def part_rep(
     part: Tuple,
 ) -> str:
@@ -391,77 +513,127 @@ def part_rep(
     return result[:-1]
 
 
+def partitiograph_graph(
+    filename: str,
+    new_name: str,
+    no_reps: bool = False,
+    cache_dir: Union[str, Path] = None,
+) -> Digraph:
+
+    """Returns the graphviz Digraph of the rhythmic partitiograph of a piece:
+    a node for each partition of its partitional analysis and an edge for each
+    transition, labelled with its count (see partition_transitions).
+    """
+
+    analysis = partitional_analysis(filename,no_reps=no_reps,cache_dir=cache_dir)
+    partitions = [analysis[key] for key in sorted(analysis.keys())]
+    lattice = PartitionLattice(max([sum(part) for part in partitions], default=0))
+    matrix = partition_transitions(partitions, lattice)
+    nodes = np.unique(lattice.ranks(partitions))
+
+    return transition_graph(
+        matrix, lambda i: part_rep(lattice.unrank(i)), new_name, engine="circo",
+        nodes=nodes, filename=new_name.lower() + ".gv",
+    )
+
+
 def partitiograph(
     filename: str,
     new_name: str,
     no_reps: bool = False,
+    cache_dir: Union[str, Path] = None,
 ) -> None:
 
     """Function to create the rhythmic partitiograph of a piece of music.
     """
 
-    analysis = partitional_analysis(filename,no_reps=no_reps)
-    keys = sorted(list(analysis.keys()))
+    gra = partitiograph_graph(filename, new_name, no_reps, cache_dir)
+    gra.view()
 
-    partitions = [analysis[key] for key in keys]
-    ind_partitions = list(set(partitions))
 
-    markov_an = markov(partitions)
+def render_partitiograph(
+    filename: str,
+    output: Union[str, Path],
+    no_reps: bool = False,
+    cache_dir: Union[str, Path] = None,
+    file_format: str = None,
+) -> Path:
+
+    """Writes the rhythmic partitiograph of a piece (see partitiograph) to the output
+    file without opening it, in the format of its extension ('.gv' for the DOT source,
+    '.svg' and the other graphviz formats for images) or of file_format (see write_graph).
+    Returns the path written.
+    """
 
-    for part in ind_partitions:
-        if part not in markov_an.keys(): markov_an[part] = []
-    gra = Digraph(new_name,filename=new_name.lower() + ".gv", engine="circo")
-    #gra.attr(rankdir='LR')
+    gra = partitiograph_graph(filename, Path(output).stem, no_reps, cache_dir)
 
-    list_edges = []
-    for i in range(len(ind_partitions)):
-        part1 = ind_partitions[i]
-        for j in range(len(ind_partitions)):
-            part2 = ind_partitions[j]
-            if part2 in markov_an[part1]:
-                list_edges.append([part_rep(part1),part_rep(part2), str(markov_an[part1].count(part2))])
+    return write_graph(gra, output, file_format)
 
-    for part in ind_partitions: gra.node(part_rep(part))
-    for edge in list_edges: gra.edge(edge[0],edge[1],label=edge[2])
 
-    gra.view()
+def melody_pitches(
+    filename: str,
+    cache_dir: Union[str, Path] = None,
+) -> List:
+
+    """Returns the MIDI pitches of the notes of a melody, given its filename.
+    If a cache directory is given, the pitches are kept there (see score_cache).
+    """
+
+    def extractor(filename):
+        notes = m21.converter.parse(filename).flatten().stripTies().getElementsByClass("Note")
+        return {"midi": np.array([note.pitch.midi for note in notes], dtype=np.int16)}
+
+    if cache_dir is None:
+        return extractor(filename)["midi"].tolist()
+    return cached_arrays(filename, {"extract": "melody"}, extractor, cache_dir)["midi"].tolist()
+
+
+def linear_partitiograph_graph(
+    filename: str,
+    name: str = None,
+    cache_dir: Union[str, Path] = None,
+) -> Digraph:
+
+    """Returns the graphviz Digraph of the partitiograph of the linear partitions of a melody
+    (see linear_transitions).
+    """
+
+    partitions = list(iter_linear_partitions(melody_pitches(filename, cache_dir)))
+    matrix = linear_transitions(partitions)
+    nodes = sorted(set(LINEAR_LABELS.index(part) for part in partitions))
+    gra = transition_graph(matrix, lambda i: LINEAR_LABELS[i], name, nodes=nodes)
+    gra.attr(rankdir='LR')
+
+    return gra
 
 
 def partitiograph_linear(
     filename: str,
+    cache_dir: Union[str, Path] = None,
 ) -> None:
 
     """Function to create the partitiograph of the linear partitions of a melody.
     """
 
-    notes = m21.converter.parse(filename).flat.stripTies().getElementsByClass("Note")
-    pitches = [note.pitch.midi for note in notes]
-
-    partitions = linear_partitions(pitches)
-    ind_partitions = list(set(partitions))
-
-    markov_an = markov(partitions)
+    gra = linear_partitiograph_graph(filename, cache_dir=cache_dir)
+    gra.view()
 
 
-    for part in ind_partitions:
-        if part not in markov_an.keys(): markov_an[part] = []
+def render_linear_partitiograph(
+    filename: str,
+    output: Union[str, Path],
+    cache_dir: Union[str, Path] = None,
+    file_format: str = None,
+) -> Path:
 
-        
-    gra = Digraph()
-    gra.attr(rankdir='LR')
+    """Writes the partitiograph of the linear partitions of a melody (see partitiograph_linear)
+    to the output file without opening it, as render_partitiograph. Returns the path written.
+    """
 
-    list_edges = []
-    for i in range(len(ind_partitions)):
-        part1 = ind_partitions[i]
-        for j in range(len(ind_partitions)):
-            part2 = ind_partitions[j]
-            if part2 in markov_an[part1]:
-                list_edges.append([part1, part2, str(markov_an[part1].count(part2))])
+    gra = linear_partitiograph_graph(filename, Path(output).stem, cache_dir)
 
-    for part in ind_partitions: gra.node(part)
-    for edge in list_edges: gra.edge(edge[0],edge[1],label=edge[2])
+    return write_graph(gra, output, file_format)
 
-    gra.view()
 
 def build_graph(
     edges: List,
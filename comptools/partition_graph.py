@@ -0,0 +1,269 @@
+"""
+Module with the partition operator graph of the Comp_Tools library.
+The partitions are the nodes, given by their IDs in a PartitionLattice, and the edges
+are the resizing (m), revariance (v) and transference (t) operations, as in creat_op_graph.
+The edges are kept in a hashed set while the graph is built and then stored
+as a compact adjacency structure (CSR). The graphviz graph is only made on demand.
+The operator distances (the least number of operations between two partitions)
+are found by breadth-first search with scipy.sparse.csgraph, for all the pairs
+(a table that can be cached on disk) or only from the partitions of a piece.
+"""
+
+
+from .parsepy import resizing, revariance, transference, part_rep
+from .partition_lattice import PartitionLattice
+from collections import deque
+from graphviz import Graph
+from pathlib import Path
+from scipy.sparse.csgraph import shortest_path
+from typing import List, Sequence, Tuple, Union
+import os
+import numpy as np
+import scipy.sparse as sp
+
+
+OPERATORS = ("m", "v", "t")
+DISTANCES_VERSION = 1
+
+
+class OperatorGraph:
+    """Undirected graph of the partitions of the integers up to n under the resizing,
+    revariance and transference operations. The neighbours of the node i are
+    indices[indptr[i]:indptr[i + 1]], reached by the operators with the codes in
+    operators[indptr[i]:indptr[i + 1]] (see OPERATORS).
+    """
+
+    def __init__(self, lattice, edges):
+        self.lattice = lattice
+        self.edges = np.array(sorted(edges), dtype=np.int64).reshape(-1, 3)
+        sources = np.concatenate([self.edges[:, 0], self.edges[:, 1]])
+        targets = np.concatenate([self.edges[:, 1], self.edges[:, 0]])
+        codes = np.concatenate([self.edges[:, 2], self.edges[:, 2]])
+        order = np.lexsort((codes, targets, sources))
+        self.indices = targets[order]
+        self.operators = codes[order].astype(np.int8)
+        self.indptr = np.zeros(len(lattice) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=len(lattice)), out=self.indptr[1:])
+
+    def __len__(self):
+        return len(self.lattice)
+
+    def __repr__(self) -> str:
+        return "OperatorGraph(" + str(self.lattice.n) + ", " + str(len(self.edges)) + " edges)"
+
+    def neighbours(self, i):
+        """Returns the IDs of the neighbours of a node, with repetitions
+        when two partitions are related by more than one operator."""
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def matrix(self):
+        """Returns the adjacency matrix of the graph, as a scipy CSR matrix of ones."""
+        result = sp.csr_matrix((np.ones(len(self.indices), dtype=np.int8), self.indices, self.indptr), shape=(len(self), len(self)))
+        result.sum_duplicates()
+        result.data[:] = 1
+        return result
+
+    def degrees(self):
+        """Returns the number of edges of each node."""
+        return np.diff(self.indptr)
+
+    def edge_list(self) -> List:
+        """Returns the edges as creat_op_graph does: lists [part1, part2, operator]
+        with the two partitions sorted."""
+        unrank = self.lattice.unrank
+        return [sorted([unrank(int(a)), unrank(int(b))]) + [OPERATORS[c]] for a, b, c in self.edges.tolist()]
+
+    def to_graphviz(self, name="partitions", engine="neato", **attributes):
+        """Returns a graphviz Graph of the nodes with edges, labelled as in part_rep,
+        with the edges labelled by their operators."""
+        gra = Graph(name, engine=engine, **attributes)
+        nodes = np.unique(self.edges[:, :2])
+        for i in nodes.tolist():
+            gra.node(str(i), part_rep(self.lattice.unrank(i)))
+        for a, b, c in self.edges.tolist():
+            gra.edge(str(a), str(b), label=OPERATORS[c])
+        return gra
+
+
+def build_op_graph(
+    upper_int: int,
+) -> OperatorGraph:
+
+    """Builds the operator graph of creat_op_graph: the resizing, revariance and
+    transference edges of the partitions of the integers up to upper_int - 1, and the
+    transference edges of the partitions of upper_int. The edges are stored once each,
+    in a set of (ID, ID, operator code) triples, and transference is applied
+    once per partition.
+    """
+
+    lattice = PartitionLattice(upper_int)
+    rank = lattice.rank
+    edges = set()
+
+    def add(i, part, code):
+        j = rank(part)
+        edges.add((min(i, j), max(i, j), code))
+
+    for m in range(1, upper_int + 1):
+        for part in lattice.partitions(m):
+            i = rank(part)
+            if m < upper_int:
+                for x in resizing(part):
+                    add(i, x, 0)
+                add(i, revariance(part), 1)
+            for x in transference(part) or []:
+                add(i, x, 2)
+
+    return OperatorGraph(lattice, edges)
+
+
+def bfs_path(
+    graph: OperatorGraph,
+    start: Tuple,
+    goal: Tuple,
+) -> List:
+
+    """Returns a shortest path between two partitions in the operator graph, as shortest_path
+    does for the adjacency dictionary of build_graph (an empty list if there is none).
+    The queue is a deque of node IDs, the visited nodes are a bitset
+    and the path is rebuilt from the parent of each node.
+    """
+
+    lattice = graph.lattice
+    source = lattice.rank(start)
+    target = lattice.rank(goal)
+    if source == target:
+        return [lattice.unrank(source)]
+    indptr, indices = graph.indptr.tolist(), graph.indices.tolist()
+    visited = bytearray((len(graph) >> 3) + 1)
+    visited[source >> 3] |= 1 << (source & 7)
+    parents = {source: None}
+    queue = deque([source])
+    while queue:
+        node = queue.popleft()
+        for neighbour in indices[indptr[node]:indptr[node + 1]]:
+            if visited[neighbour >> 3] & (1 << (neighbour & 7)):
+                continue
+            visited[neighbour >> 3] |= 1 << (neighbour & 7)
+            parents[neighbour] = node
+            if neighbour == target:
+                path = []
+                while neighbour is not None:
+                    path.append(lattice.unrank(neighbour))
+                    neighbour = parents[neighbour]
+                return path[::-1]
+            queue.append(neighbour)
+
+    return []
+
+
+def bfs_distances(
+    graph: OperatorGraph,
+    source: int,
+) -> np.ndarray:
+
+    """Returns the operator distances from the node with the ID source to every node
+    of the graph, as an int16 array (-1 for the nodes that cannot be reached).
+    The search goes one level at a time, with the whole frontier expanded
+    at once over the CSR arrays.
+    """
+
+    indptr, indices = graph.indptr, graph.indices
+    result = np.full(len(graph), -1, dtype=np.int16)
+    result[source] = 0
+    frontier = np.array([source], dtype=np.int64)
+    level = 0
+    while len(frontier):
+        level += 1
+        starts = indptr[frontier]
+        counts = indptr[frontier + 1] - starts
+        total = int(counts.sum())
+        if not total:
+            break
+        positions = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+        neighbours = np.unique(indices[positions])
+        frontier = neighbours[result[neighbours] < 0]
+        result[frontier] = level
+
+    return result
+
+
+def source_distances(
+    graph: OperatorGraph,
+    sources: Sequence,
+    block_size: int = 1024,
+) -> np.ndarray:
+
+    """Returns the operator distances from each of the nodes with the given IDs to every
+    node of the graph, as an int16 array with one line per source (-1 for the nodes that
+    cannot be reached). The searches run in scipy's csgraph, block_size sources at a time.
+    """
+
+    sources = np.asarray(sources, dtype=np.int64)
+    matrix = graph.matrix()
+    result = np.empty((len(sources), len(graph)), dtype=np.int16)
+    for start in range(0, len(sources), block_size):
+        block = shortest_path(matrix, directed=False, unweighted=True, indices=sources[start:start + block_size])
+        block[np.isinf(block)] = -1
+        result[start:start + block_size] = block
+
+    return result
+
+
+def operator_distances(
+    upper_int: int,
+    cache_dir: Union[str, Path] = None,
+) -> np.ndarray:
+
+    """Returns the table of the operator distances between all the partitions of the
+    integers up to upper_int, in the graph of build_op_graph(upper_int): an int16 array
+    indexed by the IDs of PartitionLattice(upper_int), with -1 for the pairs not connected.
+    If a cache directory is given, the table is kept there, so it is computed only once.
+    The table has len(PartitionLattice(upper_int)) ** 2 entries (15 MB for 20, 1.6 GB
+    for 30): to score pieces, distance_travelled with the graph needs only the lines
+    of the partitions that occur in them.
+    """
+
+    if cache_dir is not None:
+        path = Path(cache_dir) / ("operator_distances_" + str(upper_int) + "_v" + str(DISTANCES_VERSION) + ".npy")
+        if path.exists():
+            return np.load(path)
+
+    graph = build_op_graph(upper_int)
+    result = source_distances(graph, np.arange(len(graph)))
+
+    if cache_dir is not None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(path.name + "." + str(os.getpid()) + ".tmp")
+        with open(temporary, "wb") as file:
+            np.save(file, result)
+        os.replace(temporary, path)
+
+    return result
+
+
+def distance_travelled(
+    partitions: Sequence,
+    distances: Union[np.ndarray, OperatorGraph],
+    lattice: PartitionLattice = None,
+) -> np.ndarray:
+
+    """Returns the operator distance between each partition of a sequence (the
+    partitions of partitional_analysis, for instance) and the next one, looked up
+    at once in a table of operator_distances, with the lattice of the same integer
+    (PartitionLattice(upper_int)) for the IDs. Given the OperatorGraph instead of the
+    table, only the distances from the partitions of the sequence are computed
+    (see source_distances). The distance travelled along the sequence is the sum
+    of the steps that are not -1 (the steps to or from the empty partition (0,),
+    or to partitions not connected in the graph).
+    """
+
+    if isinstance(distances, OperatorGraph):
+        lattice = distances.lattice
+    ids = lattice.ranks(partitions)
+    if isinstance(distances, OperatorGraph):
+        sources = np.unique(ids[:-1])
+        rows = source_distances(distances, sources)
+        return rows[np.searchsorted(sources, ids[:-1]), ids[1:]]
+
+    return distances[ids[:-1], ids[1:]]
@@ -0,0 +1,126 @@
+"""
+Module with the integer-partition lattice of the Comp_Tools library.
+The partitions of the integers 0 to n get dense integer IDs, in the order of young_ret
+(with the empty partition (0,) of partitional_analysis as ID 0), so they can be ranked,
+unranked and counted without being enumerated, and the analyses can be stored as int arrays.
+The partitions are tuples in ascending order, as in parsepy.
+"""
+
+
+from typing import Generator, List, Sequence
+import numpy as np
+
+
+class PartitionLattice:
+    """Ranking and unranking of the partitions of the integers 0 to n.
+    Within each integer, the partitions are in lexicographic order, as generated by accel_asc.
+    The counts come from the table q(m, k) of the partitions of m with all parts >= k,
+    and the agglomeration and dispersion indices of every ID are precomputed as arrays.
+    """
+
+    def __init__(self, n):
+        if n < 0:
+            raise ValueError("invalid integer: " + str(n))
+        self.n = n
+        self.table = [[1] * (n + 2)]
+        for m in range(1, n + 1):
+            row = [0] * (n + 2)
+            for k in range(m, 0, -1):
+                row[k] = self.table[m - k][k] + row[k + 1]
+            self.table.append(row)
+        self.offsets = [0, 1]
+        for m in range(1, n + 1):
+            self.offsets.append(self.offsets[-1] + self.table[m][1])
+        self.integers = np.repeat(
+            np.arange(n + 1, dtype=np.int32), [1] + [self.table[m][1] for m in range(1, n + 1)],
+        )
+        self.agglomeration = self._agglomeration()
+        self.dispersion = (self.integers.astype(np.int64) * (self.integers - 1) // 2 - self.agglomeration).astype(np.int32)
+
+    def __len__(self):
+        return self.offsets[-1]
+
+    def __repr__(self) -> str:
+        return "PartitionLattice(" + str(self.n) + ", " + str(len(self)) + " partitions)"
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.unrank(i)
+
+    def count(self, m=None, min_part=1):
+        """Returns the number of partitions of m with all parts >= min_part, or the
+        number of IDs (partitions of 0 to n) if m is None."""
+        if m is None:
+            return len(self)
+        if min_part > m:
+            return int(m == 0)
+        return self.table[m][max(min_part, 1)]
+
+    def rank(self, part):
+        """Returns the ID of a partition."""
+        part = sorted(part)
+        m = sum(part)
+        if m == 0:
+            return 0
+        if m > self.n or part[0] < 1:
+            raise ValueError("not a partition of an integer up to " + str(self.n) + ": " + str(tuple(part)))
+        result = self.offsets[m]
+        lower = 1
+        for a in part:
+            result += self.table[m][lower] - self.table[m][a]
+            m -= a
+            lower = a
+        return result
+
+    def unrank(self, i):
+        """Returns the partition of an ID."""
+        if not 0 <= i < len(self):
+            raise IndexError("partition ID out of range: " + str(i))
+        if i == 0:
+            return tuple([0])
+        m = int(np.searchsorted(self.offsets, i, side="right")) - 1
+        i -= self.offsets[m]
+        result = []
+        lower = 1
+        while m > 0:
+            x = lower
+            while i >= self.table[m - x][x]:
+                i -= self.table[m - x][x]
+                x += 1
+            result.append(x)
+            m -= x
+            lower = x
+        return tuple(result)
+
+    def ranks(self, parts: Sequence) -> np.ndarray:
+        """Returns the IDs of a sequence of partitions, as an int array."""
+        cache = dict()
+        result = np.empty(len(parts), dtype=np.int64)
+        for j, part in enumerate(parts):
+            part = tuple(part)
+            if part not in cache:
+                cache[part] = self.rank(part)
+            result[j] = cache[part]
+        return result
+
+    def unranks(self, ids: Sequence) -> List:
+        """Returns the partitions of a sequence of IDs."""
+        return [self.unrank(int(i)) for i in ids]
+
+    def partitions(self, m) -> Generator:
+        """Generator for the partitions of m, in the order of their IDs."""
+        for i in range(self.offsets[m] if m else 0, self.offsets[m + 1]):
+            yield self.unrank(i)
+
+    def _agglomeration(self) -> np.ndarray:
+        """Returns the agglomeration index of every ID. The partitions of m with parts >= k
+        are the last q(m, k) partitions of m, so each block of partitions of m that start
+        with x is x followed by a suffix of the partitions of m - x."""
+        blocks = [np.zeros(1, dtype=np.int32)]
+        for m in range(1, self.n + 1):
+            pieces = []
+            for x in range(1, m + 1):
+                rest = blocks[m - x]
+                pieces.append(x * (x - 1) // 2 + rest[len(rest) - self.count(m - x, x):])
+            blocks.append(np.concatenate(pieces).astype(np.int32))
+        return np.concatenate(blocks)
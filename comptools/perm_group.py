@@ -0,0 +1,262 @@
+"""
+Module with the permutation tools of the Comp_Tools library.
+A permutation of order numbers is stored as an array in one-line notation:
+the element at position i is the original order number that moved to position i,
+as in the order number representations of twelve_tone (see order_rep).
+"""
+
+
+from .row_arrays import as_rows, row_forms
+from math import lcm
+from typing import List, Sequence, Tuple
+import numpy as np
+
+
+def count_inversions(
+    sequence: Sequence,
+) -> int:
+
+    """Returns the number of pairs i < j with sequence[i] > sequence[j],
+    in O(n log n) time, using a merge sort.
+    """
+
+    def sort_count(seq):
+        if len(seq) <= 1:
+            return seq, 0
+        middle = len(seq) // 2
+        left, left_count = sort_count(seq[:middle])
+        right, right_count = sort_count(seq[middle:])
+        merged = []
+        count = left_count + right_count
+        i = j = 0
+        while i < len(left) and j < len(right):
+            if right[j] < left[i]:
+                merged.append(right[j])
+                count += len(left) - i
+                j += 1
+            else:
+                merged.append(left[i])
+                i += 1
+        merged += left[i:] + right[j:]
+        return merged, count
+
+    return sort_count(list(sequence))[1]
+
+
+class Permutation:
+    """Array-backed permutation of the order numbers 0..n-1."""
+
+    def __init__(self, images):
+        images = np.asarray(images, dtype=np.int64)
+        if images.ndim != 1 or not np.array_equal(np.sort(images), np.arange(len(images))):
+            raise ValueError("not a permutation of 0.." + str(len(images) - 1))
+        self.array = images
+
+    @classmethod
+    def identity(cls, n):
+        """Returns the identity permutation of n elements."""
+        return cls(np.arange(n))
+
+    @classmethod
+    def from_order_rep(cls, ttset):
+        """Returns the permutation of a row with order numbers, as returned by order_rep
+        and transformed by transposition_order_rep or inversion_order_rep."""
+        return cls([pair[0] for pair in ttset])
+
+    @classmethod
+    def from_rows(cls, source, target):
+        """Returns the permutation of order numbers that turns the source row into
+        the target row, which must have the same pitch classes."""
+        positions = {pc: i for i, pc in enumerate(source)}
+        return cls([positions[pc] for pc in target])
+
+    def __len__(self):
+        return len(self.array)
+
+    def __getitem__(self, i):
+        return int(self.array[i])
+
+    def __eq__(self, other):
+        return isinstance(other, Permutation) and np.array_equal(self.array, other.array)
+
+    def __hash__(self):
+        return hash(tuple(self.array.tolist()))
+
+    def __repr__(self) -> str:
+        return "Permutation(" + str(self.array.tolist()) + ")"
+
+    def __mul__(self, other):
+        return self.compose(other)
+
+    def compose(self, other):
+        """Returns the permutation that rearranges by other and then by self, in O(n)."""
+        return Permutation(other.array[self.array])
+
+    def inverse(self):
+        """Returns the inverse permutation, in O(n)."""
+        result = np.empty_like(self.array)
+        result[self.array] = np.arange(len(self.array))
+        return Permutation(result)
+
+    def cycles(self) -> List:
+        """Returns the cycles of the permutation as tuples, fixed points included.
+        Each cycle starts on its smallest element and the cycles are sorted by it."""
+        images = self.array.tolist()
+        seen = [False] * len(images)
+        result = []
+        for start in range(len(images)):
+            if not seen[start]:
+                cycle = []
+                i = start
+                while not seen[i]:
+                    seen[i] = True
+                    cycle.append(i)
+                    i = images[i]
+                result.append(tuple(cycle))
+        return result
+
+    def cycle_type(self) -> Tuple:
+        """Returns the sorted lengths of the cycles."""
+        return tuple(sorted(len(cycle) for cycle in self.cycles()))
+
+    def order(self) -> int:
+        """Returns the order of the permutation: the least power that is the identity."""
+        return lcm(*self.cycle_type())
+
+    def inversions(self) -> int:
+        """Returns the number of order inversions, in O(n log n)."""
+        return count_inversions(self.array.tolist())
+
+    def sign(self) -> int:
+        """Returns 1 for even permutations and -1 for odd ones."""
+        return -1 if (len(self.array) - len(self.cycles())) % 2 else 1
+
+    def apply(self, row: Sequence) -> List:
+        """Rearranges a row by the permutation."""
+        return [row[i] for i in self.array]
+
+
+def as_permutations(
+    perms: Sequence,
+) -> np.ndarray:
+
+    """Returns a two-dimensional array with one permutation per line.
+    """
+
+    result = np.asarray(perms, dtype=np.int64)
+    if result.ndim == 1:
+        result = result[np.newaxis, :]
+
+    return result
+
+
+def batch_compose(
+    perms1: Sequence,
+    perms2: Sequence,
+) -> np.ndarray:
+
+    """Composes two arrays of permutations line by line, as Permutation.compose.
+    """
+
+    perms1, perms2 = np.broadcast_arrays(as_permutations(perms1), as_permutations(perms2))
+
+    return np.take_along_axis(perms2, perms1, axis=-1)
+
+
+def batch_inverse(
+    perms: Sequence,
+) -> np.ndarray:
+
+    """Inverts an array of permutations line by line.
+    """
+
+    perms = as_permutations(perms)
+    result = np.empty_like(perms)
+    np.put_along_axis(result, perms, np.broadcast_to(np.arange(perms.shape[-1]), perms.shape), axis=-1)
+
+    return result
+
+
+def batch_inversions(
+    perms: Sequence,
+    chunk_size: int = 4096,
+) -> np.ndarray:
+
+    """Returns the number of order inversions of each permutation of an array.
+    """
+
+    perms = as_permutations(perms)
+    n = perms.shape[-1]
+    upper = np.triu(np.ones((n, n), dtype=bool), 1)
+    result = np.empty(len(perms), dtype=np.int64)
+    for start in range(0, len(perms), chunk_size):
+        chunk = perms[start:start + chunk_size]
+        greater = chunk[:, :, np.newaxis] > chunk[:, np.newaxis, :]
+        result[start:start + chunk_size] = (greater & upper).sum(axis=(1, 2))
+
+    return result
+
+
+def batch_cycle_lengths(
+    perms: Sequence,
+) -> np.ndarray:
+
+    """Returns, for each permutation of an array, the length of the cycle
+    that contains each order number.
+    """
+
+    perms = as_permutations(perms)
+    identity = np.arange(perms.shape[-1])
+    lengths = np.zeros(perms.shape, dtype=np.int64)
+    power = perms.copy()
+    for k in range(1, perms.shape[-1] + 1):
+        lengths[(lengths == 0) & (power == identity)] = k
+        power = np.take_along_axis(perms, power, axis=-1)
+
+    return lengths
+
+
+def batch_orders(
+    perms: Sequence,
+) -> np.ndarray:
+
+    """Returns the order of each permutation of an array.
+    """
+
+    return np.lcm.reduce(batch_cycle_lengths(perms), axis=-1)
+
+
+def batch_cycle_counts(
+    perms: Sequence,
+) -> np.ndarray:
+
+    """Returns the number of cycles (fixed points included) of each permutation of an array.
+    Each cycle is counted once, at its smallest element, found by pointer doubling.
+    """
+
+    perms = as_permutations(perms)
+    n = perms.shape[-1]
+    images = (perms + np.arange(len(perms))[:, np.newaxis] * n).ravel()
+    smallest = np.tile(np.arange(n), len(perms))
+    steps = 1
+    while steps < n:
+        smallest = np.minimum(smallest, smallest[images])
+        images = images[images]
+        steps *= 2
+
+    return (smallest.reshape(perms.shape) == np.arange(n)).sum(axis=-1)
+
+
+def order_position_forms(
+    rows: Sequence,
+) -> np.ndarray:
+
+    """Returns an array with shape (N, 48, 12) with the permutations of order numbers
+    that turn each twelve-tone row into each of its forms, in the order of FORM_LABELS.
+    """
+
+    rows = as_rows(rows)
+    positions = batch_inverse(rows)
+    forms = row_forms(rows).astype(np.int64)
+
+    return np.take_along_axis(positions[:, np.newaxis, :], forms, axis=-1)
@@ -0,0 +1,160 @@
+"""
+Module with the vectorized twelve-tone tools of the Comp_Tools library.
+Rows are handled as integer numpy arrays, one row per line, so that
+thousands of rows can be transformed at once.
+"""
+
+
+from .basic_tools import normal_form, prime_form
+from functools import lru_cache
+from typing import List, Sequence
+import numpy as np
+
+
+FORM_LABELS = tuple(op + str(n) for op in ("T", "I", "R", "RI") for n in range(12))
+
+AGGREGATE = 0xFFF
+
+_PACK_SHIFTS = np.arange(44, -1, -4, dtype=np.uint64)
+
+
+def as_rows(
+    rows: Sequence,
+) -> np.ndarray:
+
+    """Returns a two-dimensional int8 array with the given rows, one per line.
+    A single row is returned as an array with one line.
+    """
+
+    result = np.asarray(rows, dtype=np.int8)
+    if result.ndim == 1:
+        result = result[np.newaxis, :]
+    if result.ndim != 2:
+        raise ValueError("rows must be a row or a sequence of rows")
+
+    return result % 12
+
+
+def row_forms(
+    rows: Sequence,
+) -> np.ndarray:
+
+    """Returns an array with shape (N, 48, len(row)) with all the classic forms
+    of each row, in the order of FORM_LABELS. The labels follow twelve_tone_pallette,
+    but repeated forms of symmetrical rows are kept.
+    """
+
+    rows = as_rows(rows).astype(np.int16)
+    retrogrades = rows[:, ::-1]
+    n = np.arange(12, dtype=np.int16)[np.newaxis, :, np.newaxis]
+    forms = np.concatenate([
+        rows[:, np.newaxis, :] + n,
+        n - rows[:, np.newaxis, :],
+        retrogrades[:, np.newaxis, :] + n,
+        n - retrogrades[:, np.newaxis, :],
+    ], axis=1)
+
+    return (forms % 12).astype(np.int8)
+
+
+def pack_rows(
+    rows: Sequence,
+) -> np.ndarray:
+
+    """Packs twelve-tone rows into 48-bit integers, four bits per pitch class.
+    The packed integers sort in the same order as the rows.
+    """
+
+    rows = as_rows(rows).astype(np.uint64)
+
+    return np.bitwise_or.reduce(rows << _PACK_SHIFTS, axis=-1)
+
+
+def unpack_rows(
+    packed: Sequence,
+) -> np.ndarray:
+
+    """Returns the rows stored in an array of packed integers (see pack_rows).
+    """
+
+    packed = np.asarray(packed, dtype=np.uint64)
+
+    return ((packed[..., np.newaxis] >> _PACK_SHIFTS) & np.uint64(0xF)).astype(np.int8)
+
+
+def pc_masks(
+    pcsets: Sequence,
+) -> np.ndarray:
+
+    """Returns the 12-bit masks of pitch class sets stored along the last axis
+    of an array. Bit i is set if pitch class i is in the set.
+    """
+
+    pcsets = np.asarray(pcsets, dtype=np.int64) % 12
+
+    return np.bitwise_or.reduce(np.left_shift(1, pcsets).astype(np.uint16), axis=-1)
+
+
+def mask_to_pcs(
+    mask: int,
+) -> List:
+
+    """Returns the sorted pitch classes of a 12-bit mask.
+    """
+
+    return [pc for pc in range(12) if mask >> pc & 1]
+
+
+def rotate_masks(
+    masks: Sequence,
+    n: Sequence,
+) -> np.ndarray:
+
+    """Transposes 12-bit pitch class set masks by n semitones.
+    The masks and n are broadcast against each other.
+    """
+
+    masks = np.asarray(masks, dtype=np.uint16)
+    n = np.asarray(n, dtype=np.uint16) % 12
+
+    return ((masks << n) | (masks >> (12 - n))) & AGGREGATE
+
+
+def invert_masks(
+    masks: Sequence,
+) -> np.ndarray:
+
+    """Inverts 12-bit pitch class set masks around pitch class 0.
+    """
+
+    masks = np.asarray(masks, dtype=np.uint16)
+    result = masks & 1
+    for pc in range(1, 12):
+        result |= ((masks >> pc) & 1) << (12 - pc)
+
+    return result
+
+
+@lru_cache(maxsize=None)
+def prime_form_table() -> np.ndarray:
+
+    """Returns a read-only lookup table with the mask of the prime form
+    of each of the 4096 pitch class set masks. The empty set maps to 0.
+    """
+
+    table = np.zeros(4096, dtype=np.uint16)
+    for mask in range(1, 4096):
+        table[mask] = pc_masks(prime_form(mask_to_pcs(mask)))
+    table.setflags(write=False)
+
+    return table
+
+
+@lru_cache(maxsize=None)
+def normal_form_table() -> tuple:
+
+    """Returns a lookup table with the normal form (as a tuple) of each of the
+    4096 pitch class set masks. The empty set maps to an empty tuple.
+    """
+
+    return ((),) + tuple(tuple(normal_form(mask_to_pcs(mask))) for mask in range(1, 4096))
@@ -0,0 +1,96 @@
+"""
+Module with the vectorized pre-compositional charts of the Comp_Tools library.
+The charts are computed for all 48 forms of many rows at once
+and returned as dense integer arrays.
+"""
+
+
+from .row_arrays import row_forms, pc_masks, prime_form_table
+from typing import Dict, Sequence
+import numpy as np
+
+
+def pedro_successors(
+    forms: Sequence,
+    interval_range: Sequence = (3, 6),
+) -> np.ndarray:
+
+    """Returns, for each position of each row or form stored along the last axis,
+    the position of its partner in the 'Pedro Chords': the first note after it
+    (cyclically, starting on the note itself) whose interval above it is within
+    the interval range.
+    """
+
+    forms = np.asarray(forms, dtype=np.int16)
+    size = forms.shape[-1]
+    positions = (np.arange(size)[:, np.newaxis] + np.arange(size)[np.newaxis, :]) % size
+    intervals = (forms[..., positions] - forms[..., np.newaxis]) % 12
+    in_range = (interval_range[0] <= intervals) & (intervals <= interval_range[1])
+    if not in_range.any(axis=-1).all():
+        raise ValueError("there are notes with no partner in the interval range " + str(list(interval_range)))
+
+    return ((np.arange(size) + in_range.argmax(axis=-1)) % size).astype(np.int8)
+
+
+def pedro_chords_array(
+    rows: Sequence,
+    chord_lens: Sequence = (3,),
+    interval_ranges: Sequence = ((3, 6),),
+) -> Dict:
+
+    """Returns the 'Pedro Chords' of all 48 forms of many rows (see pedro_chords),
+    for several chord lengths and interval ranges.
+    The result is a dictionary keyed by (chord_len, interval_range), whose values
+    are arrays with shape (N, 48, 12, chord_len): entry [n, f, i] is the chord built
+    on the note at position i of form f of row n, with the forms in the order of FORM_LABELS.
+    The successor table is computed once per interval range, and the shorter chords
+    are views of the longest one.
+    """
+
+    forms = row_forms(rows)
+    longest = max(chord_lens)
+    result = dict()
+    for interval_range in interval_ranges:
+        successors = pedro_successors(forms, interval_range).astype(np.int64)
+        positions = np.empty(forms.shape + (longest,), dtype=np.int64)
+        positions[..., 0] = np.arange(forms.shape[-1])
+        for j in range(1, longest):
+            positions[..., j] = np.take_along_axis(successors, positions[..., j - 1], axis=-1)
+        chords = np.take_along_axis(
+            forms, positions.reshape(forms.shape[:-1] + (-1,)), axis=-1,
+        ).reshape(positions.shape)
+        for chord_len in chord_lens:
+            result[(chord_len, tuple(interval_range))] = chords[..., :chord_len]
+
+    return result
+
+
+def rotational_arrays(
+    rows: Sequence,
+    segment_size: int = 6,
+) -> Dict:
+
+    """Returns the Stravinsky rotational arrays (see stravinsky_rotation) of every
+    discrete segment of the given size of all 48 forms of many rows. Returns a dictionary with:
+    'arrays': an array with shape (N, 48, 12 // segment_size, segment_size, segment_size),
+    whose line r of each array is the rotation r of the segment, transposed to start
+    on the first note of the segment;
+    'verticals': the masks of the columns of each array;
+    'prime_forms': the masks of the prime forms of the verticals, from prime_form_table.
+    The forms follow FORM_LABELS. Use mask_to_pcs to read the masks.
+    """
+
+    forms = row_forms(rows).astype(np.int16)
+    if 12 % segment_size != 0:
+        raise ValueError("invalid segment size: " + str(segment_size))
+    segments = forms.reshape(forms.shape[:-1] + (12 // segment_size, segment_size))
+    positions = (np.arange(segment_size)[:, np.newaxis] + np.arange(segment_size)[np.newaxis, :]) % segment_size
+    rotations = segments[..., positions]
+    arrays = ((rotations - rotations[..., :1] + segments[..., np.newaxis, :1]) % 12).astype(np.int8)
+    verticals = pc_masks(np.swapaxes(arrays, -1, -2))
+
+    return {
+        "arrays": arrays,
+        "verticals": verticals,
+        "prime_forms": prime_form_table()[verticals],
+    }
@@ -0,0 +1,279 @@
+"""
+Module with the enumeration of twelve-tone row classes of the Comp_Tools library.
+Two rows are in the same class if one is a T, I, R or RI form of the other,
+as in twelve_tone_pallette. Each class is represented by its canonical row:
+the smallest of its forms that starts on pitch class 0.
+The classes are enumerated over a process pool and stored in a compact
+on-disk index of packed rows, which can be filtered by property afterwards.
+"""
+
+
+from .row_arrays import (FORM_LABELS, as_rows, row_forms, pack_rows, unpack_rows, pc_masks,
+                         rotate_masks, invert_masks, prime_form_table)
+from .basic_tools import prime_form
+from itertools import chain, permutations
+from multiprocessing import Pool
+from math import factorial
+from pathlib import Path
+from typing import List, Sequence, Tuple, Union
+import json
+import numpy as np
+
+
+ALL_INTERVAL = 1
+P_COMBINATORIAL = 2
+I_COMBINATORIAL = 4
+R_COMBINATORIAL = 8
+RI_COMBINATORIAL = 16
+ALL_COMBINATORIAL = P_COMBINATORIAL | I_COMBINATORIAL | RI_COMBINATORIAL
+
+INDEX_VERSION = 1
+
+
+def normal_forms(
+    rows: Sequence,
+) -> np.ndarray:
+
+    """Returns an array with shape (N, 4, 12) with the P, I, R and RI forms
+    of each row, all transposed to start on pitch class 0.
+    """
+
+    rows = as_rows(rows).astype(np.int16)
+    retrogrades = rows[:, ::-1]
+    forms = np.stack([
+        rows - rows[:, :1],
+        rows[:, :1] - rows,
+        retrogrades - retrogrades[:, :1],
+        retrogrades[:, :1] - retrogrades,
+    ], axis=1)
+
+    return (forms % 12).astype(np.int8)
+
+
+def canonical_rows(
+    rows: Sequence,
+) -> np.ndarray:
+
+    """Returns the packed canonical row of the class of each row.
+    Two rows are equivalent if and only if their canonical rows are equal.
+    """
+
+    return pack_rows(normal_forms(rows).reshape(-1, 12)).reshape(-1, 4).min(axis=1)
+
+
+def row_properties(
+    rows: Sequence,
+) -> np.ndarray:
+
+    """Returns the property flags of each row: ALL_INTERVAL and the hexachordal
+    P, I, R and RI combinatoriality flags. Combinatoriality with R0 is trivial
+    and is not flagged, so ALL_COMBINATORIAL does not include R_COMBINATORIAL.
+    """
+
+    rows = as_rows(rows)
+    intervals = (rows[:, 1:].astype(np.int16) - rows[:, :-1]) % 12
+    flags = np.where(pc_masks(intervals) == 0xFFE, ALL_INTERVAL, 0).astype(np.uint8)
+
+    first = pc_masks(rows[:, :6])[:, np.newaxis]
+    second = pc_masks(rows[:, 6:])[:, np.newaxis]
+    n = np.arange(12)
+    first_hexachords = np.hstack([
+        rotate_masks(first, n),
+        rotate_masks(invert_masks(first), n),
+        rotate_masks(second, n),
+        rotate_masks(invert_masks(second), n),
+    ])
+    disjoint = (first_hexachords & first) == 0
+    disjoint[:, FORM_LABELS.index("R0")] = False
+    for i, flag in enumerate([P_COMBINATORIAL, I_COMBINATORIAL, R_COMBINATORIAL, RI_COMBINATORIAL]):
+        flags |= np.where(disjoint[:, 12*i:12*(i+1)].any(axis=1), flag, 0).astype(np.uint8)
+
+    return flags
+
+
+def invariance_masks(
+    rows: Sequence,
+) -> np.ndarray:
+
+    """Returns, for each row, a 48-bit mask of the forms (in the order of FORM_LABELS)
+    that are equal to the row itself. Bit 0 (T0) is always set.
+    """
+
+    rows = as_rows(rows)
+    equal = (row_forms(rows) == rows[:, np.newaxis, :]).all(axis=2)
+    bits = np.left_shift(np.uint64(1), np.arange(48, dtype=np.uint64))
+
+    return np.bitwise_or.reduce(np.where(equal, bits, np.uint64(0)), axis=1)
+
+
+def derived_rows_mask(
+    rows: Sequence,
+    trichord: Sequence,
+) -> np.ndarray:
+
+    """Returns a boolean array telling which rows are derived from the given trichord,
+    that is, which rows have four discrete trichords of the same set class as it.
+    """
+
+    rows = as_rows(rows)
+    target = pc_masks(prime_form(list(trichord)))
+    trichords = prime_form_table()[pc_masks(rows.reshape(-1, 4, 3))]
+
+    return (trichords == target).all(axis=1)
+
+
+def _labels_mask(
+    labels: Sequence,
+) -> List:
+
+    """Returns the list of 48-bit masks described by a list of form labels.
+    A label without a number (as 'RI') stands for any form of that operation.
+    """
+
+    result = []
+    for label in labels:
+        if label in FORM_LABELS:
+            result.append(1 << FORM_LABELS.index(label))
+        elif label in ("T", "I", "R", "RI"):
+            ind = ["T", "I", "R", "RI"].index(label)
+            result.append(0xFFF << 12*ind)
+        else:
+            raise ValueError("invalid form label: " + str(label))
+    return result
+
+
+def shard_prefixes(
+    depth: int = 3,
+) -> List:
+
+    """Returns the prefixes that split the enumeration of the rows that start
+    on pitch class 0 into shards of equal size.
+    """
+
+    return [(0,) + p for p in permutations(range(1, 12), depth - 1)]
+
+
+def enumerate_shard(
+    prefix: Tuple,
+) -> Tuple:
+
+    """Enumerates the canonical rows that start with the given prefix.
+    Returns the packed rows and their property flags.
+    """
+
+    rest = [pc for pc in range(12) if pc not in prefix]
+    count = factorial(len(rest))
+    tails = np.fromiter(
+        chain.from_iterable(permutations(rest)), dtype=np.int8, count=count * len(rest),
+    ).reshape(count, len(rest))
+    rows = np.hstack([np.tile(np.array(prefix, dtype=np.int8), (count, 1)), tails])
+    packed = pack_rows(rows)
+    canonical = packed == canonical_rows(rows)
+
+    return packed[canonical], row_properties(rows[canonical])
+
+
+def build_row_index(
+    path: Union[str, Path],
+    processes: int = None,
+    prefixes: Sequence = None,
+) -> "RowIndex":
+
+    """Enumerates the twelve-tone row classes over a process pool and stores
+    them in an index at the given directory. The shards are written in order,
+    so the index is the same for any number of processes.
+    A subset of the shards (see shard_prefixes) can be given as prefixes.
+    """
+
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    if prefixes is None:
+        prefixes = shard_prefixes()
+    prefixes = [tuple(p) for p in prefixes]
+
+    count = 0
+    with open(path / "rows.bin", "wb") as rows_file, open(path / "flags.bin", "wb") as flags_file:
+        if processes == 1:
+            results = map(enumerate_shard, prefixes)
+            pool = None
+        else:
+            pool = Pool(processes)
+            results = pool.imap(enumerate_shard, prefixes)
+        try:
+            for packed, flags in results:
+                rows_file.write(packed.astype("<u8").tobytes())
+                flags_file.write(flags.tobytes())
+                count += len(packed)
+        except BaseException:
+            if pool is not None:
+                pool.terminate()
+            raise
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+    meta = {"version": INDEX_VERSION, "count": count, "prefixes": prefixes}
+    (path / "meta.json").write_text(json.dumps(meta))
+
+    return RowIndex(path)
+
+
+class RowIndex:
+    """On-disk index of canonical twelve-tone rows built by build_row_index.
+    The packed rows and their property flags are memory-mapped.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        meta = json.loads((self.path / "meta.json").read_text())
+        if meta["version"] != INDEX_VERSION:
+            raise ValueError("unsupported row index version: " + str(meta["version"]))
+        self.count = meta["count"]
+        self.prefixes = [tuple(p) for p in meta["prefixes"]]
+        if self.count:
+            self.packed = np.memmap(self.path / "rows.bin", dtype="<u8", mode="r")
+            self.flags = np.memmap(self.path / "flags.bin", dtype=np.uint8, mode="r")
+        else:
+            self.packed = np.zeros(0, dtype="<u8")
+            self.flags = np.zeros(0, dtype=np.uint8)
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self) -> str:
+        return "RowIndex(" + str(self.path) + ", " + str(self.count) + " rows)"
+
+    def rows(self, selection=None):
+        """Returns the unpacked rows, optionally restricted to a boolean mask or indices."""
+        if selection is None:
+            return unpack_rows(self.packed)
+        return unpack_rows(self.packed[selection])
+
+    def mask(self, properties=0, trichord=None, invariance=None, chunk_size=1 << 20):
+        """Returns a boolean mask of the rows that have all the given property flags,
+        are derived from the given trichord and are invariant under all the given forms.
+        """
+        result = (self.flags & properties) == properties
+        if trichord is None and invariance is None:
+            return result
+        wanted = _labels_mask(invariance or [])
+        for start in range(0, self.count, chunk_size):
+            stop = min(start + chunk_size, self.count)
+            candidates = np.flatnonzero(result[start:stop]) + start
+            if len(candidates) == 0:
+                continue
+            rows = self.rows(candidates)
+            keep = np.ones(len(candidates), dtype=bool)
+            if trichord is not None:
+                keep &= derived_rows_mask(rows, trichord)
+            if wanted:
+                invariant = invariance_masks(rows)
+                for bits in wanted:
+                    keep &= (invariant & np.uint64(bits)) != 0
+            result[candidates[~keep]] = False
+        return result
+
+    def query(self, properties=0, trichord=None, invariance=None):
+        """Returns the unpacked rows selected by mask."""
+        return self.rows(self.mask(properties, trichord, invariance))
@@ -0,0 +1,165 @@
+"""
+Module with the batch distance measures between tone rows of the Comp_Tools library.
+The measures compare the order positions of the pitch classes of two rows,
+as in the order number representations of twelve_tone (see order_rep),
+and are computed for all the N x M pairs of two arrays of rows at once.
+"""
+
+
+from .row_arrays import as_rows
+from .perm_group import batch_inverse, batch_cycle_counts, count_inversions
+from typing import Dict, Sequence
+import numpy as np
+
+
+ROW_METRICS = ("kendall_tau", "cayley", "spearman_footrule", "ordered_interval_overlap", "dyad_overlap")
+
+
+def kendall_tau(
+    row1: Sequence,
+    row2: Sequence,
+) -> int:
+
+    """Returns the Kendall tau distance between two rows: the number of pairs
+    of pitch classes that are in different orders in each row. Runs in O(n log n).
+    """
+
+    positions = {pc: i for i, pc in enumerate(row2)}
+
+    return count_inversions([positions[pc] for pc in row1])
+
+
+def _pair_orders(
+    rows: np.ndarray,
+) -> np.ndarray:
+
+    """Returns, for each row, one value per pair of pitch classes p < q:
+    1 if p comes before q in the row, 0 otherwise.
+    """
+
+    positions = batch_inverse(rows)
+    first, second = np.triu_indices(rows.shape[-1], 1)
+
+    return (positions[:, first] < positions[:, second]).astype(np.float64)
+
+
+def kendall_tau_distance(
+    rows1: Sequence,
+    rows2: Sequence,
+) -> np.ndarray:
+
+    """Returns the N x M matrix of the Kendall tau distances between two arrays of rows.
+    """
+
+    orders1 = _pair_orders(as_rows(rows1))
+    orders2 = _pair_orders(as_rows(rows2))
+    result = orders1.sum(axis=1)[:, np.newaxis] + orders2.sum(axis=1)[np.newaxis, :] - 2 * orders1 @ orders2.T
+
+    return np.rint(result).astype(np.int64)
+
+
+def spearman_footrule(
+    rows1: Sequence,
+    rows2: Sequence,
+    chunk_size: int = 1024,
+) -> np.ndarray:
+
+    """Returns the N x M matrix of the Spearman footrule distances between two arrays
+    of rows: the sum of the differences of the order positions of each pitch class.
+    """
+
+    positions1 = batch_inverse(as_rows(rows1)).astype(np.int16)
+    positions2 = batch_inverse(as_rows(rows2)).astype(np.int16)
+    result = np.empty((len(positions1), len(positions2)), dtype=np.int64)
+    for start in range(0, len(positions1), chunk_size):
+        chunk = positions1[start:start + chunk_size, np.newaxis, :]
+        result[start:start + chunk_size] = np.abs(chunk - positions2[np.newaxis, :, :]).sum(axis=-1)
+
+    return result
+
+
+def cayley_distance(
+    rows1: Sequence,
+    rows2: Sequence,
+    chunk_size: int = 256,
+) -> np.ndarray:
+
+    """Returns the N x M matrix of the Cayley distances between two arrays of rows:
+    the least number of swaps that turns one row into the other, that is,
+    the length of the rows minus the number of cycles of the permutation between them.
+    """
+
+    rows1 = as_rows(rows1)
+    positions2 = batch_inverse(as_rows(rows2))
+    size = rows1.shape[-1]
+    result = np.empty((len(rows1), len(positions2)), dtype=np.int64)
+    for start in range(0, len(rows1), chunk_size):
+        chunk = rows1[start:start + chunk_size].astype(np.int64)
+        perms = np.take_along_axis(
+            positions2[np.newaxis, :, :], chunk[:, np.newaxis, :], axis=-1,
+        ).reshape(-1, size)
+        result[start:start + chunk_size] = size - batch_cycle_counts(perms).reshape(len(chunk), -1)
+
+    return result
+
+
+def ordered_interval_overlap(
+    rows1: Sequence,
+    rows2: Sequence,
+) -> np.ndarray:
+
+    """Returns the N x M matrix of the number of ordered pitch-class intervals
+    between successive notes that the rows have in common (counted with repetitions).
+    """
+
+    def histograms(rows):
+        intervals = (rows[:, 1:].astype(np.int16) - rows[:, :-1]) % 12
+        return np.stack([(intervals == i).sum(axis=1) for i in range(12)], axis=1)
+
+    hist1 = histograms(as_rows(rows1))
+    hist2 = histograms(as_rows(rows2))
+
+    return np.minimum(hist1[:, np.newaxis, :], hist2[np.newaxis, :, :]).sum(axis=-1)
+
+
+def dyad_overlap(
+    rows1: Sequence,
+    rows2: Sequence,
+) -> np.ndarray:
+
+    """Returns the N x M matrix of the number of discrete dyads (as in compare_dyads)
+    that the rows have in common.
+    """
+
+    def one_hot(rows):
+        dyads = rows.reshape(len(rows), -1, 2).astype(np.int64)
+        codes = dyads.min(axis=-1) * 12 + dyads.max(axis=-1)
+        result = np.zeros((len(rows), 144))
+        np.put_along_axis(result, codes, 1, axis=1)
+        return result
+
+    return np.rint(one_hot(as_rows(rows1)) @ one_hot(as_rows(rows2)).T).astype(np.int64)
+
+
+def row_distances(
+    rows1: Sequence,
+    rows2: Sequence = None,
+    metrics: Sequence = ROW_METRICS,
+) -> Dict:
+
+    """Returns a dictionary with the N x M matrices of the given metrics between two
+    arrays of rows (see ROW_METRICS). If rows2 is None, the rows are compared
+    with each other.
+    """
+
+    if rows2 is None:
+        rows2 = rows1
+    functions = {
+        "kendall_tau": kendall_tau_distance,
+        "cayley": cayley_distance,
+        "spearman_footrule": spearman_footrule,
+        "ordered_interval_overlap": ordered_interval_overlap,
+        "dyad_overlap": dyad_overlap,
+    }
+
+    return {metric: functions[metric](rows1, rows2) for metric in metrics}
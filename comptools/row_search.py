@@ -0,0 +1,180 @@
+"""
+Module with the tools to locate twelve-tone row statements in a score.
+The pitch-class stream of each part is matched against all the forms of a row
+with a rolling hash over 12-note windows. A bounded-error mode also finds
+partial statements and statements with extra notes in between.
+"""
+
+
+from .twelve_tone import twelve_tone_pallette
+import music21 as m21
+from collections import defaultdict
+from typing import Dict, Generator, Iterable, List, Sequence, Union
+
+
+def row_hash(
+    pcs: Sequence,
+) -> int:
+
+    """Returns the hash of a sequence of pitch classes: its value as a base-12 number.
+    Twelve-note windows have distinct hashes, so there are no collisions.
+    """
+
+    result = 0
+    for pc in pcs:
+        result = result * 12 + pc % 12
+    return result
+
+
+def part_pitch_classes(
+    part: m21.stream.Stream,
+) -> List:
+
+    """Returns the pitch-class stream of a part as a list of (offset, pitch class) pairs.
+    Tied notes count once and the notes of a chord are read from the lowest up.
+    """
+
+    result = []
+    for el in part.stripTies().flatten().notes:
+        for pitch in sorted(el.pitches, key=lambda p: p.ps):
+            result.append((el.offset, pitch.pitchClass))
+    return result
+
+
+def iter_row_statements(
+    pcs: Iterable,
+    row: Sequence,
+    max_errors: int = 0,
+) -> Generator:
+
+    """Generator for the statements of the forms of a row in a stream of pitch classes.
+    Yields tuples (label, start, end, errors) with the labels of twelve_tone_pallette
+    and the indices of the first and last notes of the statement in the stream.
+    With max_errors = 0 only exact statements are found, with a rolling hash.
+    Otherwise, up to max_errors errors are allowed, each error being a note of the row
+    that is missing or an extra note in the stream. Runs in linear time and keeps
+    only the notes of the current window in memory.
+    """
+
+    forms = dict()
+    for label, form in twelve_tone_pallette(list(row)).items():
+        forms.setdefault(tuple(form), label)
+    if max_errors == 0:
+        yield from _exact_statements(pcs, forms)
+    else:
+        yield from _approximate_statements(pcs, forms, max_errors)
+
+
+def _exact_statements(
+    pcs: Iterable,
+    forms: Dict,
+) -> Generator:
+
+    """Rolling-hash search for exact statements of the given forms."""
+
+    hashes = {row_hash(form): label for form, label in forms.items()}
+    window = 12 ** 11
+    current = 0
+    for i, pc in enumerate(pcs):
+        current = (current % window) * 12 + pc % 12
+        if i >= 11 and current in hashes:
+            yield (hashes[current], i - 11, i, 0)
+
+
+def _approximate_statements(
+    pcs: Iterable,
+    forms: Dict,
+    max_errors: int,
+) -> Generator:
+
+    """Search for the statements of the given forms with up to max_errors errors.
+    Each live match is a state (form, start, position in the form) with its least
+    number of errors and the index of its last matched note. When no state with a
+    given form and start is left, its best match waits until the matches that start
+    earlier are decided too, and is reported unless one of them contains it with
+    no more errors.
+    """
+
+    labels = list(forms.values())
+    form_list = list(forms.keys())
+    span = 12 + max_errors
+    states = dict()
+    candidates = dict()
+    pending = []
+    reported = defaultdict(list)
+
+    def release(limit):
+        pending.sort()
+        while pending and pending[0][0] < limit:
+            start, f, end, errors = pending.pop(0)
+            rivals = reported[f] + [(p[0], p[2], p[3]) for p in pending if p[1] == f]
+            if not any(r_start <= start and r_end >= end and r_errors <= errors
+                       for r_start, r_end, r_errors in rivals):
+                reported[f].append((start, end, errors))
+                yield (labels[f], start, end, errors)
+            reported[f] = [r for r in reported[f] if r[1] >= start - span]
+
+    for i, pc in enumerate(pcs):
+        pc = pc % 12
+        new_states = dict()
+
+        def advance(key, errors, end):
+            if errors <= max_errors and errors < new_states.get(key, (max_errors + 1,))[0]:
+                new_states[key] = (errors, end)
+
+        for (f, start, pos), (errors, end) in states.items():
+            advance((f, start, pos), errors + 1, end)
+            for missing in range(min(max_errors - errors, 11 - pos) + 1):
+                if form_list[f][pos + missing] == pc:
+                    advance((f, start, pos + missing + 1), errors + missing, i)
+        for f, form in enumerate(form_list):
+            for missing in range(max_errors + 1):
+                if form[missing] == pc:
+                    advance((f, i, missing + 1), missing, i)
+
+        states = dict()
+        for (f, start, pos), (errors, end) in new_states.items():
+            total = errors + 12 - pos
+            if total <= max_errors and total < candidates.get((f, start), (max_errors + 1,))[0]:
+                candidates[(f, start)] = (total, end)
+            if pos < 12:
+                states[(f, start, pos)] = (errors, end)
+        live = {(f, start) for (f, start, _) in states}
+        for key in [k for k in candidates if k not in live]:
+            errors, end = candidates.pop(key)
+            pending.append((key[1], key[0], end, errors))
+        yield from release(min([start for (_, start) in live], default=i + 1))
+
+    for (f, start), (errors, end) in candidates.items():
+        pending.append((start, f, end, errors))
+    yield from release(float("inf"))
+
+
+def find_row_statements(
+    score: Union[str, m21.stream.Stream],
+    row: Sequence,
+    max_errors: int = 0,
+) -> List:
+
+    """Finds the statements of the forms of a row in each part of a score,
+    given as a music21 stream or a filename. Returns a list of dictionaries
+    with the part index, the form label, the offsets of the first and last notes
+    of the statement and the number of errors (see iter_row_statements).
+    """
+
+    if isinstance(score, str):
+        score = m21.converter.parse(score)
+    parts = list(score.parts) if hasattr(score, "parts") and len(score.parts) else [score]
+    result = []
+    for part_index, part in enumerate(parts):
+        stream = part_pitch_classes(part)
+        offsets = [x[0] for x in stream]
+        for label, start, end, errors in iter_row_statements((x[1] for x in stream), row, max_errors):
+            result.append({
+                "part": part_index,
+                "form": label,
+                "start": offsets[start],
+                "end": offsets[end],
+                "errors": errors,
+            })
+    return result
@@ -0,0 +1,107 @@
+"""
+Module with the persistent cache of parsed scores of the Comp_Tools library.
+The data extracted from a score is stored as NumPy arrays in a .npz file,
+keyed by the hash of the contents of the file and of the extraction options,
+so repeated analyses of the same score skip the music21 parsing.
+"""
+
+
+import music21 as m21
+from fractions import Fraction
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+import hashlib
+import json
+import os
+import numpy as np
+
+
+CACHE_VERSION = 2
+
+
+def cache_key(
+    filename: Union[str, Path],
+    options: Dict,
+) -> str:
+
+    """Returns the cache key of a file: the SHA-256 hash of its contents,
+    of the extraction options and of the versions of the cache and of music21.
+    """
+
+    digest = hashlib.sha256()
+    with open(filename, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    header = {"options": options, "version": CACHE_VERSION, "music21": m21.__version__}
+    digest.update(json.dumps(header, sort_keys=True).encode())
+
+    return digest.hexdigest()
+
+
+def cached_arrays(
+    filename: Union[str, Path],
+    options: Dict,
+    extractor: Callable,
+    cache_dir: Union[str, Path],
+) -> Dict:
+
+    """Returns the dictionary of arrays that extractor(filename) returns,
+    reading it from the cache directory if the same file was extracted before
+    with the same options, and storing it there otherwise.
+    """
+
+    path = Path(cache_dir) / (cache_key(filename, options) + ".npz")
+    if path.exists():
+        with np.load(path) as data:
+            return {name: data[name] for name in data.files}
+    result = extractor(filename)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(path.name + "." + str(os.getpid()) + ".tmp")
+    with open(temporary, "wb") as file:
+        np.savez(file, **result)
+    os.replace(temporary, path)
+
+    return result
+
+
+def clear_cache(
+    cache_dir: Union[str, Path],
+) -> int:
+
+    """Deletes the cached files of a cache directory. Returns the number of files deleted.
+    """
+
+    count = 0
+    for path in Path(cache_dir).glob("*.npz"):
+        path.unlink()
+        count += 1
+
+    return count
+
+
+def fraction_arrays(
+    values: Sequence,
+) -> Tuple[np.ndarray, np.ndarray]:
+
+    """Returns the numerators and denominators of a list of music21 offsets
+    or durations (floats or Fractions), so they can be stored exactly.
+    """
+
+    fractions = [Fraction(x).limit_denominator(1 << 31) for x in values]
+
+    return (
+        np.array([x.numerator for x in fractions], dtype=np.int64),
+        np.array([x.denominator for x in fractions], dtype=np.int64),
+    )
+
+
+def from_fraction_arrays(
+    numerators: np.ndarray,
+    denominators: np.ndarray,
+) -> List:
+
+    """Returns the music21 offsets or durations stored by fraction_arrays,
+    as floats where they are exact and as Fractions otherwise (see music21's opFrac).
+    """
+
+    return [m21.common.opFrac(Fraction(n, d)) for n, d in zip(numerators.tolist(), denominators.tolist())]
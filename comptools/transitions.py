@@ -0,0 +1,126 @@
+"""
+Module with the transition matrices of the partitiographs of the Comp_Tools library.
+The transitions between consecutive partitions of an analysis are counted in one pass
+into a sparse integer matrix over the partition IDs of a PartitionLattice (or over the
+labels of the linear partitions), and the graphs are written to .gv or image files
+without opening a viewer (see partitiograph and render_partitiograph in parsepy).
+"""
+
+
+from .partition_lattice import PartitionLattice
+from graphviz import Digraph
+from pathlib import Path
+from typing import Callable, Iterable, Sequence, Union
+import numpy as np
+import scipy.sparse as sp
+
+
+LINEAR_LABELS = ("N", "R", "G", "P", "A", "C", "F")
+
+
+def transition_counts(
+    ids: Iterable,
+    size: int,
+) -> sp.csr_matrix:
+
+    """Returns the sparse size x size matrix of the number of transitions between
+    consecutive states of a sequence of integer IDs: the entry (i, j) counts
+    the times the state i is followed by the state j.
+    """
+
+    ids = np.fromiter(ids, dtype=np.int64)
+    counts = np.ones(max(len(ids) - 1, 0), dtype=np.int64)
+    result = sp.coo_matrix((counts, (ids[:-1], ids[1:])), shape=(size, size))
+
+    return result.tocsr()
+
+
+def partition_transitions(
+    partitions: Iterable,
+    lattice: PartitionLattice = None,
+) -> sp.csr_matrix:
+
+    """Returns the sparse matrix of the transitions between consecutive partitions
+    of a sequence (the values of partitional_analysis, for instance), indexed
+    by the IDs of the partitions in the lattice. Without a lattice, the lattice
+    of the largest integer of the sequence is used. The sequence is read once.
+    """
+
+    if lattice is None:
+        partitions = list(partitions)
+        lattice = PartitionLattice(max([sum(part) for part in partitions], default=0))
+    ranks = dict()
+
+    def rank(part):
+        if part not in ranks:
+            ranks[part] = lattice.rank(part)
+        return ranks[part]
+
+    return transition_counts((rank(tuple(part)) for part in partitions), len(lattice))
+
+
+def linear_transitions(
+    labels: Iterable,
+) -> sp.csr_matrix:
+
+    """Returns the sparse 7 x 7 matrix of the transitions between consecutive
+    linear partitions, indexed in the order of LINEAR_LABELS.
+    """
+
+    codes = {label: i for i, label in enumerate(LINEAR_LABELS)}
+
+    return transition_counts((codes[label] for label in labels), len(LINEAR_LABELS))
+
+
+def transition_graph(
+    matrix: sp.spmatrix,
+    node_name: Callable,
+    name: str = None,
+    engine: str = None,
+    nodes: Sequence = None,
+    **attributes,
+) -> Digraph:
+
+    """Returns the graphviz Digraph of a transition matrix, as in partitiograph:
+    a node for each state with transitions (or for each of the given node IDs),
+    named by node_name(ID), and an edge for each nonzero entry, labelled with its count.
+    The engine is also set as the layout attribute of the graph, so the written
+    DOT source is laid out the same way when it is rendered later.
+    """
+
+    matrix = sp.coo_matrix(matrix)
+    gra = Digraph(name, engine=engine, **attributes)
+    if engine is not None:
+        gra.attr(layout=engine)
+    if nodes is None:
+        nodes = np.unique(np.concatenate([matrix.row, matrix.col]))
+    for i in np.asarray(nodes).tolist():
+        gra.node(node_name(i))
+    for a, b, count in zip(matrix.row.tolist(), matrix.col.tolist(), matrix.data.tolist()):
+        if count:
+            gra.edge(node_name(a), node_name(b), label=str(count))
+
+    return gra
+
+
+def write_graph(
+    gra: Digraph,
+    output: Union[str, Path],
+    file_format: str = None,
+) -> Path:
+
+    """Writes a graph to a file without opening it: the DOT source for the
+    'gv' format, or the image rendered by graphviz for the others ('svg', 'pdf',
+    'png', ...). By default, the format is the extension of the output.
+    The rendered formats need the graphviz executables. Returns the path written.
+    """
+
+    output = Path(output)
+    if file_format is None:
+        file_format = output.suffix[1:].lower() or "gv"
+    if file_format in ["gv", "dot"]:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(gra.source)
+        return output
+
+    return Path(gra.render(outfile=output, format=file_format, view=False, cleanup=True))
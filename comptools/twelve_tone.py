@@ -9,7 +9,9 @@ from pandas import DataFrame
 from numpy import reshape
 from typing import Sequence, List, Dict, Tuple
 from itertools import permutations
-from .master_perms import *
+from .master_perms import compositions
+from .perm_group import Permutation, count_inversions
+from .boulez import mask_complex_multiplication, multiplication_factor
 
 
 def twelve_tone_matrix(
@@ -141,11 +143,11 @@ def all_partitions(
     size = len(ps)
     result = [[] for _ in range(size)]
     if size <= 6:
-        all_perms = up_to_six
+        all_perms = list(compositions(12, 1, 6))
     elif 6 < size <= 9:
-        all_perms = up_to_six + six_to_nine
+        all_perms = list(compositions(12, 1, 9))
     elif 9 < size <= 12:
-        all_perms = up_to_six + six_to_nine + ten_to_twelve
+        all_perms = list(compositions(12, 1, 12))
     for i in range(0,size):
         if i == 0:
             for p in all_perms:
@@ -239,13 +241,8 @@ def transposition_order_rep(
 
     """ Applies the transposition operation on a tone row with its order numbers
     """
-    result = [0] * len(ttset)
-    for i, pair in enumerate(ttset):
-        new_pc = (pair[1] + n) % 12
-        for scpair in ttset:
-            if scpair[1] == new_pc:
-                result[i] = scpair
-    return result   
+    pairs = {pair[1]: pair for pair in ttset}
+    return [pairs.get((pair[1] + n) % 12, 0) for pair in ttset]
 
 
 def inversion_order_rep(
@@ -255,13 +252,8 @@ def inversion_order_rep(
 
     """ Applies the inversion (plus transposition) operation on a tone row with its order numbers
     """
-    result = [0] * len(ttset)
-    for i, pair in enumerate(ttset):
-        new_pc = ((12 - pair[1]) + n) % 12
-        for scpair in ttset:
-            if scpair[1] == new_pc:
-                result[i] = scpair
-    return result  
+    pairs = {pair[1]: pair for pair in ttset}
+    return [pairs.get(((12 - pair[1]) + n) % 12, 0) for pair in ttset]
 
 
 def order_inversions(
@@ -272,15 +264,7 @@ def order_inversions(
     returns the number of order inversions that ocurred because of the transformation.
     """
 
-    orders = [x[0] for x in ttset]
-    inv_count = 0
-    for i in range(len(ttset)):
-        for j in range(i+1, len(ttset)):
-            if (orders[i] > orders[j]):
-                inv_count += 1
-            else:
-                pass
-    return inv_count
+    return count_inversions([x[0] for x in ttset])
 
 
 def permutation_cycles(
@@ -290,15 +274,7 @@ def permutation_cycles(
     """ Given a transformed version of the series with order numbers,
     returns the sequence of permutations cycles"""
 
-    result = []
-    for i, el in enumerate(ttset):
-        if el[0] == i:
-            result.append(tuple([i]))
-        else:
-            pair = tuple(sorted([i,el[0]]))
-            if pair not in result:
-                result.append(pair)
-    return result
+    return Permutation.from_order_rep(ttset).cycles()
 
 
 def dyad_interval_pairs(
@@ -363,17 +339,13 @@ def boulez_matrix_multiplication(
     """
 
     row_part = row_partition(row,part)
-    first = row_part[0]
-    if len(first) <= 3:
-        k = first[-1]
-    else:
-        k = first[2]
+    k = multiplication_factor(row_part[0])
     result = dict()
     for m in row_part:
         for i in row_part:
             raw_key = [tuple(m),tuple(i)]
             key = tuple(raw_key)
-            mult = complex_multiplication(m,i,k)
+            mult = mask_complex_multiplication(m,i,k)
             result[key] = mult
 
     return result
@@ -435,9 +407,9 @@ def pedro_chords_palette(
     """Returns the pedro chords for all of the basic forms of the given row.
     """
     final = dict()
-    matriz = twelve_tone_matrix(row)
-    
-    inverse = list(matriz[0])
+    inverted_row = inversion(row)
+
+    inverse = transposition(inverted_row, row[0]-inverted_row[0])
     retrograde = row[::-1]
     ri = inverse[::-1]
     